@@ -0,0 +1,29 @@
+"""add rows_per_second to bulk_import_items
+
+Revision ID: f02b15caa4c5
+Revises: ea968a5d1636
+Create Date: 2026-10-17 09:10:12.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f02b15caa4c5'
+down_revision: Union[str, None] = 'ea968a5d1636'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "bulk_import_items",
+        sa.Column("rows_per_second", sa.Float(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("bulk_import_items", "rows_per_second")
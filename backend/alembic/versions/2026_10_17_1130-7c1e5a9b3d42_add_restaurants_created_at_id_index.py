@@ -0,0 +1,29 @@
+"""add (created_at, id) index to restaurants for keyset pagination
+
+Revision ID: 7c1e5a9b3d42
+Revises: f02b15caa4c5
+Create Date: 2026-10-17 11:30:41.218503
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e5a9b3d42'
+down_revision: Union[str, None] = 'f02b15caa4c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_restaurants_created_at_id",
+        "restaurants",
+        ["created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_restaurants_created_at_id", table_name="restaurants")
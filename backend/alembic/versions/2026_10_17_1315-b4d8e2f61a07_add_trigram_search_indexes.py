@@ -0,0 +1,42 @@
+"""add pg_trgm GIN indexes for restaurant and menu item search
+
+Revision ID: b4d8e2f61a07
+Revises: 7c1e5a9b3d42
+Create Date: 2026-10-17 13:15:09.664021
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d8e2f61a07'
+down_revision: Union[str, None] = '7c1e5a9b3d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRIGRAM_INDEXES = [
+    ("ix_restaurants_name_trgm", "restaurants", "name"),
+    ("ix_menu_items_name_trgm", "menu_items", "name"),
+    ("ix_menu_items_description_trgm", "menu_items", "description"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,30 @@
+"""add text_pattern_ops index on restaurants.slug for slug allocation
+
+Revision ID: 5e3c9a1f7b20
+Revises: b4d8e2f61a07
+Create Date: 2026-10-17 18:00:12.407315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e3c9a1f7b20'
+down_revision: Union[str, None] = 'b4d8e2f61a07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_restaurants_slug_pattern",
+        "restaurants",
+        ["slug"],
+        postgresql_ops={"slug": "text_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_restaurants_slug_pattern", table_name="restaurants")
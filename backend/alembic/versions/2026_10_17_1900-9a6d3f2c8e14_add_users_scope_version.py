@@ -0,0 +1,29 @@
+"""add scope_version to users
+
+Revision ID: 9a6d3f2c8e14
+Revises: 5e3c9a1f7b20
+Create Date: 2026-10-17 19:00:08.113402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a6d3f2c8e14'
+down_revision: Union[str, None] = '5e3c9a1f7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("scope_version", sa.Integer(), server_default="0", nullable=False)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "scope_version")
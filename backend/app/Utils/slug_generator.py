@@ -1,7 +1,12 @@
 import re
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.models.restaurant import Restaurant
 
+# Allocations retried when a concurrent write takes the same slug
+SLUG_ATTEMPTS = 3
+
 
 def generate_slug(name: str) -> str:
     """
@@ -12,24 +17,61 @@ def generate_slug(name: str) -> str:
     slug = slug.strip("-")
     return slug
 
+
+def next_free_slug(base_slug: str, taken: set[str]) -> str:
+    """
+    base_slug if free, else base_slug-N with the smallest free N >= 1.
+    """
+    if base_slug not in taken:
+        return base_slug
+
+    prefix = f"{base_slug}-"
+    suffixes = {
+        int(slug[len(prefix):])
+        for slug in taken
+        if slug.startswith(prefix) and slug[len(prefix):].isdigit()
+    }
+    counter = 1
+    while counter in suffixes:
+        counter += 1
+    return f"{prefix}{counter}"
+
+
 def generate_unique_slug(
     db: Session,
     base_name: str,
     exclude_id: int | None = None
 ) -> str:
+    """
+    Allocate a free slug with one query: every slug equal to or
+    prefixed by the base (served by ix_restaurants_slug_pattern).
+
+    Not a reservation - a concurrent write can still take it; callers
+    retry on the unique constraint (see is_slug_conflict).
+    """
     base_slug = generate_slug(base_name)
-    slug = base_slug
-    counter = 1
 
-    while True:
-        query = db.query(Restaurant).filter(Restaurant.slug == slug)
+    # Slugs only contain [a-z0-9-], so nothing needs LIKE escaping
+    query = db.query(Restaurant.slug).filter(
+        or_(
+            Restaurant.slug == base_slug,
+            Restaurant.slug.like(f"{base_slug}-%"),
+        )
+    )
 
-        if exclude_id:
-            query = query.filter(Restaurant.id != exclude_id)
+    if exclude_id:
+        query = query.filter(Restaurant.id != exclude_id)
 
-        if not query.first():
-            return slug
+    return next_free_slug(base_slug, {r[0] for r in query})
 
-        slug = f"{base_slug}-{counter}"
-        counter += 1
 
+def is_slug_conflict(error: IntegrityError) -> bool:
+    """
+    Whether the violated unique constraint is the slug's rather than
+    the name's.
+    """
+    # psycopg2 reports the constraint; SQLite only has the message
+    constraint = getattr(getattr(error.orig, "diag", None), "constraint_name", None)
+    if constraint:
+        return constraint == "ix_restaurants_slug"
+    return "restaurants.slug" in str(error.orig)
@@ -72,7 +72,6 @@ def create_first_admin(
 
     db.add(user)
     db.commit()
-    db.refresh(user)
 
     return {
         "message": "First admin created successfully",
@@ -1,19 +1,30 @@
 from typing import List
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Header, HTTPException, status
+from redis.exceptions import RedisError
 from sqlalchemy import true
 
 from app.core.dependencies import (
+    AsyncDBSession,
     DBSession,
     CurrentUser,
     RestaurantAccess,
 )
+from app.core.http_cache import (
+    PRIVATE_REVALIDATE_CACHE_CONTROL,
+    cache_headers,
+    etag_matches,
+    make_etag,
+    not_modified,
+)
+from app.core.responses import encoded_bodies, encoded_response
 from app.schemas.menu_category_schema import (
     MenuCategoryCreate,
     MenuCategoryRead,
     MenuCategoryUpdate,
 )
 from app.services.menu_category_service import MenuCategoryService
+from app.services.menu_version_service import get_menu_version_async
 
 router = APIRouter(
     prefix="/restaurants/{restaurant_id}/menu-categories",
@@ -58,22 +69,44 @@ def create_menu_category(
     "/",
     response_model=List[MenuCategoryRead],
 )
-def list_menu_categories(
+async def list_menu_categories(
     restaurant_id: int,
-    db: DBSession,
+    db: AsyncDBSession,
     _: RestaurantAccess,
+    if_none_match: str | None = Header(None),
 ):
     """
     ADMIN / RESTAURANT_ADMIN:
       - See restaurant categories
       - See global categories
-    """
 
-    return menu_category_service.list(
+    Category writes bump the menu version, so it doubles as the ETag.
+    """
+    try:
+        version = await get_menu_version_async(restaurant_id)
+    except RedisError:
+        version = None
+
+    etag = None
+    if version is not None:
+        etag = make_etag("menu-categories", restaurant_id, version)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, PRIVATE_REVALIDATE_CACHE_CONTROL)
+
+        body = encoded_bodies.get(etag)
+        if body is not None:
+            return encoded_response(
+                body, cache_headers(etag, PRIVATE_REVALIDATE_CACHE_CONTROL)
+            )
+
+    categories = await menu_category_service.list_rows_async(
         db=db,
         restaurant_id=restaurant_id,
     )
 
+    body = encoded_bodies.encode(etag, categories)
+    return encoded_response(body, cache_headers(etag, PRIVATE_REVALIDATE_CACHE_CONTROL))
+
 
 # =========================================================
 # UPDATE MENU CATEGORY
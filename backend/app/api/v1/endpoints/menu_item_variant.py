@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.core.dependencies import check_restaurant_access, CurrentUser
+from app.core.dependencies import AsyncReadDBSession, check_restaurant_access, CurrentUser
 from app.core.permission import require_roles
 from app.models.user import UserRole
 from app.schemas.menu_item_variant_schema import (
@@ -22,16 +22,16 @@ router = APIRouter(
 # LIST MENU ITEMS Varients (PUBLIC)
 # --------------------------------
 @router.get("/", response_model=list[MenuItemVariantRead])
-def list_variants(
+async def list_variants(
     restaurant_id: int,
     item_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncReadDBSession,
 ):
-    item = menu_items_service.get_menu_item(db, item_id)
-    if not item or item.restaurant_id != restaurant_id:
+    item = await menu_items_service.get_menu_item_async(db, item_id, restaurant_id)
+    if not item:
         raise HTTPException(status_code=404, detail="Menu item not found")
 
-    return menu_item_variant_service.list_variants(db, item_id)
+    return await menu_item_variant_service.list_variants_async(db, item_id)
 
 # --------------------------------
 # CREATE MENU ITEM
@@ -45,7 +45,7 @@ def create_variant(
     db: Session = Depends(get_db),
 ):
     require_roles(current_user, (UserRole.ADMIN, UserRole.RESTAURANT_ADMIN))
-    check_restaurant_access(restaurant_id, current_user, db)
+    check_restaurant_access(restaurant_id, current_user)
 
     item = menu_items_service.get_menu_item(db, item_id)
     if not item or item.restaurant_id != restaurant_id:
@@ -67,7 +67,7 @@ def update_variant(
     db: Session = Depends(get_db),
 ):
     require_roles(current_user, (UserRole.ADMIN, UserRole.RESTAURANT_ADMIN))
-    check_restaurant_access(restaurant_id, current_user, db)
+    check_restaurant_access(restaurant_id, current_user)
 
     item = menu_items_service.get_menu_item(db, item_id)
     if not item or item.restaurant_id != restaurant_id:
@@ -92,7 +92,7 @@ def delete_variant(
     db: Session = Depends(get_db),
 ):
     require_roles(current_user, (UserRole.ADMIN, UserRole.RESTAURANT_ADMIN))
-    check_restaurant_access(restaurant_id, current_user, db)
+    check_restaurant_access(restaurant_id, current_user)
 
     item = menu_items_service.get_menu_item(db, item_id)
     if not item or item.restaurant_id != restaurant_id:
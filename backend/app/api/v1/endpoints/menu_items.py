@@ -1,30 +1,45 @@
+from datetime import time
+from typing import Literal
+
 from fastapi import (
     APIRouter,
     Depends,
+    Header,
+    Query,
     UploadFile,
     File,
     HTTPException,
     status,
-    BackgroundTasks,
 )
 from sqlalchemy.orm import Session
-from io import StringIO
-import json
-import csv
 
-from app.core.database import get_db, SessionLocal
+from app.core.database import get_db
+from app.core.http_cache import (
+    PUBLIC_MENU_CACHE_CONTROL,
+    cache_headers,
+    etag_matches,
+    not_modified,
+)
+from app.core.responses import encoded_bodies, encoded_response
 from app.core.permission import require_roles
-from app.core.dependencies import CurrentUser, check_restaurant_access
+from app.core.dependencies import AsyncReadDBSession, CurrentUser, check_restaurant_access
 from app.models.user import UserRole
 from app.schemas.menu_items_schema import (
     MenuItemCreate,
+    MenuItemListRead,
     MenuItemRead,
+    MenuItemSearchResult,
     MenuItemUpdate,
     MenuItemAvailabilityUpdate,
     MenuItemTimingUpdate,
+    MenuItemBatchRequest,
+    MenuItemBatchResult,
 )
+from app.schemas.bulk_import_items_schema import MenuItemImportJobRead
 from app.services import (
     menu_items_service,
+    menu_search_service,
+    menu_snapshot_service,
     bulk_import_items_service,
 )
 
@@ -34,16 +49,44 @@ router = APIRouter(
 )
 
 
+# ------------------------------------------------------------------
+# SEARCH MENU ITEMS (PUBLIC, declared before /{item_id})
+# ------------------------------------------------------------------
+@router.get("/search", response_model=list[MenuItemSearchResult])
+def search_menu_items(
+    restaurant_id: int,
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=50),
+    available_only: bool = True,
+    db: Session = Depends(get_db),
+):
+    results = menu_search_service.search_menu_items(
+        db,
+        restaurant_id=restaurant_id,
+        q=q,
+        limit=limit,
+        available_only=available_only,
+    )
+
+    return [
+        MenuItemSearchResult(
+            **MenuItemRead.model_validate(item).model_dump(),
+            score=score,
+        )
+        for item, score in results
+    ]
+
+
 # ------------------------------------------------------------------
 # GET MENU ITEM BY ID (PUBLIC)
 # ------------------------------------------------------------------
 @router.get("/{item_id}", response_model=MenuItemRead)
-def get_menu_item(
+async def get_menu_item(
     restaurant_id: int,
     item_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncReadDBSession,
 ):
-    item = menu_items_service.get_menu_item(
+    item = await menu_items_service.get_menu_item_async(
         db,
         item_id=item_id,
         restaurant_id=restaurant_id,
@@ -66,7 +109,6 @@ def get_menu_item(
 def import_menu_items(
     restaurant_id: int,
     current_user: CurrentUser,
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
 ):
@@ -76,42 +118,18 @@ def import_menu_items(
     )
 
     if current_user.is_restaurant_admin:
-        check_restaurant_access(restaurant_id, current_user, db)
-
-    job = bulk_import_items_service.create_job(db, restaurant_id)
-    filename = file.filename.lower()
-
-    # ---------- CSV ----------
-    if filename.endswith(".csv"):
-        content = file.file.read().decode("utf-8")
-        csv.DictReader(StringIO(content))  # validate CSV
-
-        background_tasks.add_task(
-            menu_items_service._run_import_job,
-            job.id,
-            restaurant_id,
-            "csv",
-            content,  # ✅ Pass the CSV content string, not the file
-        )
-
-    # ---------- JSON ----------
-    elif filename.endswith(".json"):
-        content = file.file.read().decode("utf-8")
-        items = json.loads(content)
-        if not isinstance(items, list):
-            raise HTTPException(400, "JSON must be an array")
-
-        background_tasks.add_task(
-            menu_items_service.run_import_job,
-            job.id,
-            restaurant_id,
-            "json",
-            items,  # ✅ Already a list of dicts
-        )
+        check_restaurant_access(restaurant_id, current_user)
 
+    # Spool to disk before creating the job so bad uploads fail fast
+    file_type, path = bulk_import_items_service.save_upload(file)
 
-    else:
-        raise HTTPException(400, "Only CSV or JSON supported")
+    # Processed out of process by app.workers.import_worker
+    job = bulk_import_items_service.create_job(
+        db,
+        restaurant_id,
+        file_type,
+        path,
+    )
 
     return {
         "job_id": job.id,
@@ -120,14 +138,14 @@ def import_menu_items(
     }
 
 
-@router.get("/import/{job_id}")
+@router.get("/import/{job_id}", response_model=MenuItemImportJobRead)
 def get_import_job_status(
     restaurant_id: int,
     job_id: int,
     current_user: CurrentUser,
     db: Session = Depends(get_db),
 ):
-    check_restaurant_access(restaurant_id, current_user, db)
+    check_restaurant_access(restaurant_id, current_user)
 
     return bulk_import_items_service.get_import_job(
         db=db,
@@ -139,20 +157,56 @@ def get_import_job_status(
 # =================================================
 # MENU ITEM CRUD
 # =================================================
-@router.get("/", response_model=list[MenuItemRead])
+@router.get("/", response_model=list[MenuItemListRead])
 def list_menu_items(
     restaurant_id: int,
     category_id: int | None = None,
     available_now: bool = True,
+    at: time | None = Query(None, description="Restaurant-local time to check availability at (default: now)"),
+    include: Literal["variants"] | None = Query(None, description="Embed each item's variants"),
+    if_none_match: str | None = Header(None),
     db: Session = Depends(get_db),
 ):
-    return menu_items_service.list_menu_items(
+    etag_args = dict(
+        restaurant_id=restaurant_id,
+        version=menu_snapshot_service.current_menu_version(restaurant_id),
+        category_id=category_id,
+        only_currently_available=available_now,
+        at=at,
+        include_variants=include == "variants",
+    )
+
+    etag = menu_snapshot_service.menu_list_etag(**etag_args)
+    if etag and etag_matches(if_none_match, etag):
+        return not_modified(etag, PUBLIC_MENU_CACHE_CONTROL)
+
+    body = encoded_bodies.get(etag)
+    if body is not None:
+        return encoded_response(body, cache_headers(etag, PUBLIC_MENU_CACHE_CONTROL))
+
+    items, version = menu_snapshot_service.list_menu_items_with_version(
         db=db,
         restaurant_id=restaurant_id,
         category_id=category_id,
         only_currently_available=available_now,
+        at=at,
+        include_variants=include == "variants",
     )
 
+    # The body is tagged with the version stored in the snapshot it came
+    # from, not the one read above: a write in between must not get the
+    # old menu cached under the new tag. The availability index is warm
+    # now, compiled from that same snapshot.
+    etag = menu_snapshot_service.menu_list_etag(**{**etag_args, "version": version})
+
+    # Snapshot items are already MenuItemRead dumps; only the Postgres
+    # fallback (Redis down) returns ORM rows that need validating.
+    if items and not isinstance(items[0], dict):
+        items = [MenuItemRead.model_validate(i).model_dump(mode="json") for i in items]
+
+    body = encoded_bodies.encode(etag, items)
+    return encoded_response(body, cache_headers(etag, PUBLIC_MENU_CACHE_CONTROL))
+
 
 @router.post("/", response_model=MenuItemRead)
 def create_menu_item(
@@ -166,7 +220,7 @@ def create_menu_item(
         (UserRole.ADMIN, UserRole.RESTAURANT_ADMIN),
     )
 
-    check_restaurant_access(restaurant_id, current_user, db)
+    check_restaurant_access(restaurant_id, current_user)
     data.restaurant_id = restaurant_id
     return menu_items_service.create_menu_item(db, data)
 
@@ -184,7 +238,7 @@ def update_menu_item(
         (UserRole.ADMIN, UserRole.RESTAURANT_ADMIN),
     )
 
-    check_restaurant_access(restaurant_id, current_user, db)
+    check_restaurant_access(restaurant_id, current_user)
     item = menu_items_service.get_menu_item(
         db=db,
         item_id=item_id,
@@ -212,7 +266,7 @@ def delete_menu_item(
         (UserRole.ADMIN, UserRole.RESTAURANT_ADMIN),
     )
 
-    check_restaurant_access(restaurant_id, current_user, db)
+    check_restaurant_access(restaurant_id, current_user)
 
     item = menu_items_service.get_menu_item(
         db=db,
@@ -245,7 +299,7 @@ def update_menu_item_availability(
         (UserRole.ADMIN, UserRole.RESTAURANT_ADMIN),
     )
 
-    check_restaurant_access(restaurant_id, current_user, db)
+    check_restaurant_access(restaurant_id, current_user)
 
     item = menu_items_service.get_menu_item(
         db=db,
@@ -289,7 +343,7 @@ def update_menu_item_timings(
         (UserRole.ADMIN, UserRole.RESTAURANT_ADMIN),
     )
 
-    check_restaurant_access(restaurant_id, current_user, db)
+    check_restaurant_access(restaurant_id, current_user)
 
     item = menu_items_service.get_menu_item(
         db=db,
@@ -316,3 +370,29 @@ def update_menu_item_timings(
         "available_to": str(item.available_to) if item.available_to else None,
         "status": "updated",
     }
+
+
+# =================================================
+# BATCH UPDATE (/restaurants/{id}/menu-items:batch)
+# =================================================
+@router.patch(":batch", response_model=MenuItemBatchResult)
+def batch_update_menu_items(
+    restaurant_id: int,
+    data: MenuItemBatchRequest,
+    current_user: CurrentUser,
+    db: Session = Depends(get_db),
+):
+    require_roles(
+        current_user,
+        (UserRole.ADMIN, UserRole.RESTAURANT_ADMIN),
+    )
+
+    check_restaurant_access(restaurant_id, current_user)
+
+    item_ids = menu_items_service.batch_update_menu_items(
+        db=db,
+        restaurant_id=restaurant_id,
+        updates=data.items,
+    )
+
+    return MenuItemBatchResult(updated=len(item_ids), item_ids=item_ids)
@@ -1,6 +1,5 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from fastapi import APIRouter
+from app.core.dependencies import AsyncDBSession
 from app.schemas.otp_schema import OTPRequest, OTPVerify
 from app.services.otp_service import request_otp, verify_otp
 
@@ -13,17 +12,17 @@ router = APIRouter(
 # SEND OTP (No DB Needed)
 # ---------------------------
 @router.post("/request-otp")
-def send_otp(payload: OTPRequest):
+async def send_otp(payload: OTPRequest):
 
-    return request_otp(payload.phone)
+    return await request_otp(payload.phone)
 
 # ---------------------------
 # VERIFY OTP (DB Needed)
 # ---------------------------
 @router.post("/verify-otp")
-def verify(
+async def verify(
     payload: OTPVerify,
-    db: Session = Depends(get_db)
+    db: AsyncDBSession,
 ):
 
-    return verify_otp(db, payload.phone, payload.otp)
+    return await verify_otp(db, payload.phone, payload.otp)
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, HTTPException, Query, status
 from app.models.user import UserRole
 from app.core.dependencies import (
+    AsyncDBSession,
     DBSession,
     CurrentUser,
     AdminUser,
     RestaurantAccess,
 )
+from app.core.responses import json_response
 from app.services.restaurant_service import RestaurantService
 from app.services.restaurant_setting_service import RestaurantSettingsService
 from app.schemas.restaurant import (
@@ -15,6 +17,7 @@ from app.schemas.restaurant import (
     RestaurantStaffAddRequest,
     RestaurantRead,
     RestaurantResponse,
+    RestaurantListMeta,
     RestaurantListResponse,
     RestaurantDetailResponse,
 )
@@ -62,22 +65,32 @@ def get_restaurants(
     db: DBSession,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor of the previous page (keyset mode)"),
+    include_total: bool = True,
 ):
     skip = (page - 1) * limit
 
-    restaurants, total = service.get_all(
+    restaurants, total, next_cursor = service.get_all(
         db=db,
         user=user,
         skip=skip,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
 
-    return RestaurantListResponse(
-        status=True,
-        message="Restaurant list fetched",
-        data=[RestaurantRead.model_validate(r) for r in restaurants],
-        meta={"page": page, "limit": limit, "total": total},
-    )
+    # Rows are already RestaurantRead dumps (cached or freshly built)
+    return json_response({
+        "status": True,
+        "message": "Restaurant list fetched",
+        "data": restaurants,
+        "meta": RestaurantListMeta(
+            page=None if cursor else page,
+            limit=limit,
+            total=total,
+            next_cursor=next_cursor,
+        ).model_dump(),
+    })
 
 
 # =========================================================
@@ -85,13 +98,13 @@ def get_restaurants(
 # =========================================================
 
 @router.get("/{restaurant_id}", response_model=RestaurantDetailResponse)
-def get_restaurant(
+async def get_restaurant(
     restaurant_id: int,
     user: CurrentUser,
-    db: DBSession,
+    db: AsyncDBSession,
     _: RestaurantAccess,
 ):
-    restaurant = service.get_by_id(db, restaurant_id)
+    restaurant = await service.get_by_id_async(db, restaurant_id)
 
     if not restaurant:
         raise HTTPException(
@@ -248,8 +261,7 @@ def get_restaurant_settings(
             detail="Admin or Restaurant Admin access required",
         )
 
-    settings = settings_service.get_or_create(db, restaurant_id)
-    return RestaurantSettingsRead.model_validate(settings)
+    return settings_service.get_cached_or_create(db, restaurant_id)
 
 
 @router.patch(
@@ -0,0 +1,91 @@
+"""
+Restaurant access scope carried in user access tokens.
+
+login_user / refresh_tokens embed two claims:
+
+  rids  sorted restaurant ids the user is assigned to
+  sv    the user's scope version when the token was issued
+
+The scope version is users.scope_version, bumped by bump_scope_version()
+in the same transaction as any change to the user's role, status or
+assignments, so it cannot be lost or reset the way a cache entry can.
+Requests are authorized from the cached principal (principal_cache),
+which carries the current version and active flag: a token whose sv no
+longer matches is rejected so the client refreshes and gets the new
+scope.
+"""
+import logging
+
+from fastapi import HTTPException, status
+from redis.exceptions import RedisError
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.principal_cache import UserPrincipal, invalidate_user
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+def bump_scope_version(db: Session, *user_ids: int) -> None:
+    """
+    Revoke the scope embedded in outstanding tokens. Call before
+    committing a role/status/assignment change so both commit (or fail)
+    together.
+    """
+    user_ids = tuple(uid for uid in user_ids if uid is not None)
+    if not user_ids:
+        return
+
+    db.execute(
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(scope_version=User.scope_version + 1)
+    )
+
+
+def invalidate_access(*user_ids: int) -> None:
+    """
+    Drop cached principals. Call after committing role/status/assignment
+    changes; raises 503 if the cached principals could not be dropped.
+    """
+    user_ids = tuple(uid for uid in user_ids if uid is not None)
+    if not user_ids:
+        return
+
+    try:
+        invalidate_user(*user_ids)
+    except RedisError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=(
+                "Change saved, but cached permissions could not be refreshed; "
+                f"it may take up to {settings.PRINCIPAL_CACHE_REDIS_TTL_SECONDS}s to apply"
+            ),
+        )
+
+
+# ------------------------------------------------
+# CLAIMS
+# ------------------------------------------------
+def scope_claims(principal: UserPrincipal) -> dict:
+    """
+    Claims to merge into an access token. Empty when the scope is too
+    large to embed.
+    """
+    if len(principal.restaurant_ids) > settings.TOKEN_SCOPE_MAX_RESTAURANTS:
+        return {}
+
+    return {
+        "rids": sorted(principal.restaurant_ids),
+        "sv": principal.scope_version,
+    }
+
+
+def check_token_scope(payload: dict, principal: UserPrincipal) -> None:
+    """
+    Raises ValueError when the token's scope version is stale.
+    """
+    if "sv" in payload and payload["sv"] != principal.scope_version:
+        raise ValueError("stale access scope")
@@ -23,14 +23,84 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int = 5432
     POSTGRES_DB: str = "dinebuddy"
     DATABASE_URL: str = ""
+    # Optional replica for lag-tolerant public reads
+    DATABASE_READ_REPLICA_URL: Optional[str] = None
+
+    # Engine pools: a named profile (api | worker | migration), then
+    # per-setting overrides (unset = profile value)
+    DB_POOL_PROFILE: str = "api"
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT_SECONDS: Optional[float] = None
+    DB_POOL_RECYCLE_SECONDS: Optional[int] = None
+    DB_POOL_PRE_PING: Optional[bool] = None
+    DB_STATEMENT_CACHE_SIZE: Optional[int] = None
+    # PgBouncer in transaction mode: NullPool, no prepared statement caches
+    DB_PGBOUNCER_TRANSACTION_MODE: bool = False
+    # Log every SQL statement (off by default; skews timings)
+    DB_ECHO: bool = False
 
         # Redis
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_URL: Optional[str] = None
+    # Async client pool (callers wait up to the timeout for a free connection)
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT_SECONDS: float = 5
+
+    # Public menu snapshot cache
+    MENU_SNAPSHOT_TTL_SECONDS: int = 3600
+    # Retry interval for menu version bumps that failed after a commit
+    MENU_VERSION_BUMP_RETRY_SECONDS: float = 5
+    # Compiled "available now" indexes kept per worker (restaurants, LRU)
+    MENU_AVAILABILITY_INDEX_CACHE_SIZE: int = 1024
+
+    # Restaurant list cache (pages and total counts)
+    RESTAURANT_LIST_CACHE_TTL_SECONDS: int = 30
+    RESTAURANT_COUNT_CACHE_TTL_SECONDS: int = 300
+
+    # Restaurant settings cache (dropped on update)
+    RESTAURANT_SETTINGS_CACHE_TTL_SECONDS: int = 300
 
+    # Pre-encoded JSON bodies kept per ETag (per worker)
+    ENCODED_RESPONSE_CACHE_SIZE: int = 512
+
+    # Request instrumentation
+    # Server-Timing header with app/db time and query count on every response
+    SERVER_TIMING_HEADER: bool = True
+    # Log a warning when a single request runs more statements than this
+    REQUEST_QUERY_BUDGET: int = 20
+    # Bearer token the Prometheus scraper sends to /metrics; unset disables it
+    METRICS_TOKEN: Optional[str] = None
+
+    # Menu item imports
+    # Upload dir must be shared with the import worker (defaults to the system temp dir)
+    IMPORT_UPLOAD_DIR: Optional[str] = None
+    IMPORT_WORKER_CONCURRENCY: int = 2
+    IMPORT_VISIBILITY_TIMEOUT_SECONDS: int = 300
+    IMPORT_MAX_RETRIES: int = 3
+    IMPORT_POLL_INTERVAL_SECONDS: float = 1.0
     
+    # Authenticated principal cache (in-process LRU + Redis)
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_LOCAL_TTL_SECONDS: float = 30
+    PRINCIPAL_CACHE_REDIS_TTL_SECONDS: int = 300
+
+    # Customer phone -> id mapping used at OTP sign-in
+    CUSTOMER_ID_CACHE_TTL_SECONDS: int = 86400
+
+    # Password hashing
+    # bcrypt cost; stored hashes with another cost are rehashed on login
+    BCRYPT_ROUNDS: int = 12
+    # Dedicated hashing threads, and how many checks may run or wait at
+    # once before new ones are turned away with 503
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 16
+
+    # Restaurant scope embedded in access tokens (larger scopes use the principal cache)
+    TOKEN_SCOPE_MAX_RESTAURANTS: int = 50
+
     # CORS - can be comma-separated string or list
     CORS_ORIGINS: Union[List[str], str] = "http://localhost:3000,http://localhost:8000"
     
@@ -42,6 +112,14 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",")]
         return v
     
+    @field_validator("BCRYPT_ROUNDS")
+    @classmethod
+    def check_bcrypt_rounds(cls, v: int) -> int:
+        """Keep the cost within what a login request can afford"""
+        if not 4 <= v <= 15:
+            raise ValueError("BCRYPT_ROUNDS must be between 4 and 15")
+        return v
+    
     # JWT / Security (for future use)
     SECRET_KEY: str
     ALGORITHM: str
@@ -1,23 +1,147 @@
 """
 Database connection and session management
+
+Two engines share the same database:
+
+  sync  (psycopg2)  routes/services that write, migrations and scripts
+  async (asyncpg)   hot public read paths served on the event loop
+
+plus an optional async read-replica engine (DATABASE_READ_REPLICA_URL)
+for public reads that tolerate replication lag.
+
+Pool sizing comes from a named profile (DB_POOL_PROFILE), which
+individual DB_* settings override:
+
+  api        per uvicorn worker; several workers share the database
+  worker     the import worker: a connection per consumer thread
+  migration  Alembic and one-off scripts: no pooling
+
+Behind PgBouncer in transaction mode (DB_PGBOUNCER_TRANSACTION_MODE)
+connections are not pooled client-side and asyncpg prepared statement
+caches are disabled, since consecutive transactions may land on
+different server connections.
+
+Sessions keep loaded state across commit (expire_on_commit=False), so a
+service can return the object it just wrote without a refresh SELECT:
+the INSERT/UPDATE already brings back generated keys and server defaults
+via RETURNING, and client-side values (updated_at) are known. Sessions
+are request-scoped, so nothing reads the object much later.
 """
+from dataclasses import asdict, dataclass, replace
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.pool import NullPool
+from typing import AsyncGenerator, Generator
 
 from app.core.config import settings
+from app.core.metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool
+
+
+# ======================================================
+# Pool profiles
+# ======================================================
+@dataclass(frozen=True)
+class PoolConfig:
+    null_pool: bool = False
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_cache_size: int = 100
+
+
+POOL_PROFILES = {
+    "api": PoolConfig(),
+    "worker": PoolConfig(
+        pool_size=settings.IMPORT_WORKER_CONCURRENCY + 1,
+        max_overflow=2,
+        pool_timeout=60,
+    ),
+    "migration": PoolConfig(null_pool=True),
+}
+
+
+def pool_config() -> PoolConfig:
+    """
+    The DB_POOL_PROFILE profile with any DB_* overrides applied.
+    """
+    try:
+        config = POOL_PROFILES[settings.DB_POOL_PROFILE]
+    except KeyError:
+        raise ValueError(
+            f"Unknown DB_POOL_PROFILE {settings.DB_POOL_PROFILE!r} "
+            f"(expected one of: {', '.join(POOL_PROFILES)})"
+        )
+
+    overrides = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    config = replace(config, **{k: v for k, v in overrides.items() if v is not None})
+
+    if settings.DB_PGBOUNCER_TRANSACTION_MODE:
+        config = replace(config, null_pool=True, statement_cache_size=0)
+
+    return config
+
+
+def engine_options(config: PoolConfig, is_async: bool) -> dict:
+    options = {
+        "pool_pre_ping": config.pool_pre_ping,
+        "echo": settings.DB_ECHO,
+    }
+
+    if config.null_pool:
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            # Timed pools report checkout wait to /metrics
+            poolclass=TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_timeout=config.pool_timeout,
+            pool_recycle=config.pool_recycle,
+        )
+
+    if is_async:
+        options["connect_args"] = {
+            # asyncpg's statement cache and SQLAlchemy's prepared statement cache
+            "statement_cache_size": config.statement_cache_size,
+            "prepared_statement_cache_size": config.statement_cache_size,
+        }
+
+    return options
+
+
+def async_url(url: str) -> URL:
+    return make_url(url).set(drivername="postgresql+asyncpg")
+
+
+POOL_CONFIG = pool_config()
+
 
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,  # Verify connections before using them
-    pool_size=10,
-    max_overflow=20,
-    echo=settings.ENVIRONMENT == "development"  # Log SQL in development
+    pool_logging_name="sync",
+    **engine_options(POOL_CONFIG, is_async=False),
 )
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create SessionLocal class; written objects stay loaded after commit
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -31,3 +155,69 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+
+
+# ======================================================
+# Async engine (asyncpg)
+# ======================================================
+ASYNC_DATABASE_URL = async_url(settings.DATABASE_URL)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_logging_name="async",
+    **engine_options(POOL_CONFIG, is_async=True),
+)
+
+# Loaded rows are returned to the caller after the session closes
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get an async database session
+    Usage: db: AsyncSession = Depends(get_async_db)
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# ======================================================
+# Async read replica (falls back to the primary)
+# ======================================================
+if settings.DATABASE_READ_REPLICA_URL:
+    async_read_engine = create_async_engine(
+        async_url(settings.DATABASE_READ_REPLICA_URL),
+        pool_logging_name="async_replica",
+        **engine_options(POOL_CONFIG, is_async=True),
+    )
+else:
+    async_read_engine = async_engine
+
+AsyncReadSessionLocal = async_sessionmaker(
+    async_read_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Read-only session, on the replica when one is configured.
+    Only for reads that tolerate replication lag and are not cached
+    under a menu version.
+    """
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+
+def pool_config_summary() -> str:
+    """
+    Effective pool settings, for the startup log.
+    """
+    replica = "yes" if async_read_engine is not async_engine else "no"
+    options = ", ".join(f"{k}={v}" for k, v in asdict(POOL_CONFIG).items())
+    return f"profile={settings.DB_POOL_PROFILE}, {options}, read_replica={replica}"
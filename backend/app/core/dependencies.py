@@ -1,15 +1,23 @@
 # app/core/dependencies.py
+import secrets
 from typing import List, Annotated
 from fastapi import Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.models.user import User
-from app.models.user_restaurant_map import UserRestaurant
+from app.core.config import settings
+from app.core.database import get_async_db, get_async_read_db, get_db
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.core.jwt import decode_access_token
-from app.models.customer import Customer
+from app.core.access_scope import check_token_scope
+from app.core.principal_cache import (
+    CustomerPrincipal,
+    UserPrincipal,
+    get_customer_principal,
+    get_user_principal,
+)
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 # =========================================================
 # Temporary "current user" dependency for testing
@@ -17,7 +25,7 @@ security = HTTPBearer()
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
-) -> User:
+) -> UserPrincipal:
 
     token = credentials.credentials
 
@@ -37,7 +45,7 @@ def get_current_user(
             detail="Invalid token payload",
         )
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = get_user_principal(db, int(user_id))
 
     if not user:
         raise HTTPException(
@@ -45,6 +53,21 @@ def get_current_user(
             detail="User not found",
         )
 
+    # Role or assignments changed since the token was issued
+    try:
+        check_token_scope(payload, user)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Access scope changed, please refresh your token",
+        )
+
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User is inactive",
+        )
+
     return user
 # =========================================================
 # Get current customer
@@ -52,7 +75,7 @@ def get_current_user(
 def get_current_customer(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
-) -> Customer:
+) -> CustomerPrincipal:
 
     token = credentials.credentials
     payload = decode_access_token(token)
@@ -71,9 +94,13 @@ def get_current_customer(
 
     customer_id = payload.get("sub")
 
-    customer = db.query(Customer).filter(
-        Customer.id == int(customer_id)
-    ).first()
+    if not customer_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+        )
+
+    customer = get_customer_principal(db, int(customer_id))
 
     if not customer:
         raise HTTPException(
@@ -81,12 +108,18 @@ def get_current_customer(
             detail="Customer not found",
         )
 
+    if not customer.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Customer is inactive",
+        )
+
     return customer
 
 # =========================================================
 # Role Guards
 # =========================================================
-def require_admin(current_user: User = Depends(get_current_user)) -> User:
+def require_admin(current_user: UserPrincipal = Depends(get_current_user)) -> UserPrincipal:
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -95,9 +128,25 @@ def require_admin(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
+def require_metrics_token(
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+) -> None:
+    # Not served at all unless a scrape token is configured
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(), settings.METRICS_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
 def require_restaurant_admin(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> List[int]:
     if not current_user.is_restaurant_admin:
         raise HTTPException(
@@ -105,12 +154,7 @@ def require_restaurant_admin(
             detail="Restaurant admin access required",
         )
 
-    restaurant_ids = (
-        db.query(UserRestaurant.restaurant_id)
-        .filter(UserRestaurant.user_id == current_user.id)
-        .all()
-    )
-    ids = [r[0] for r in restaurant_ids]
+    ids = sorted(current_user.restaurant_ids)
 
     if not ids:
         raise HTTPException(
@@ -125,22 +169,12 @@ def require_restaurant_admin(
 # =========================================================
 def check_restaurant_access(
     restaurant_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> None:
     if current_user.is_admin:
         return
 
-    has_access = (
-        db.query(UserRestaurant)
-        .filter(
-            UserRestaurant.user_id == current_user.id,
-            UserRestaurant.restaurant_id == restaurant_id,
-        )
-        .first()
-    )
-
-    if not has_access:
+    if restaurant_id not in current_user.restaurant_ids:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied to this restaurant",
@@ -150,8 +184,10 @@ def check_restaurant_access(
 # Dependency aliases for clean routes
 # =========================================================
 DBSession = Annotated[Session, Depends(get_db)]
-CurrentUser = Annotated[User, Depends(get_current_user)]
-AdminUser = Annotated[User, Depends(require_admin)]
+AsyncDBSession = Annotated[AsyncSession, Depends(get_async_db)]
+AsyncReadDBSession = Annotated[AsyncSession, Depends(get_async_read_db)]
+CurrentUser = Annotated[UserPrincipal, Depends(get_current_user)]
+AdminUser = Annotated[UserPrincipal, Depends(require_admin)]
 RestaurantAdminRestaurantIds = Annotated[List[int], Depends(require_restaurant_admin)]
 RestaurantAccess = Annotated[None, Depends(check_restaurant_access)]
-CurrentCustomer = Annotated[Customer, Depends(get_current_customer)]
\ No newline at end of file
+CurrentCustomer = Annotated[CustomerPrincipal, Depends(get_current_customer)]
\ No newline at end of file
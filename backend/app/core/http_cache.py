@@ -0,0 +1,48 @@
+"""
+ETag / conditional GET helpers.
+
+Routes derive a strong ETag from cheap inputs (the menu version and the
+request parameters) so a matching If-None-Match can be answered with a
+304 before any query runs or any JSON is rendered.
+"""
+import hashlib
+
+from fastapi import Response, status
+
+
+# Cache-Control policies per route
+PUBLIC_MENU_CACHE_CONTROL = "public, max-age=15, stale-while-revalidate=30"
+PRIVATE_REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    raw = "|".join("" if p is None else str(p) for p in parts)
+    return '"' + hashlib.sha1(raw.encode()).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match uses weak comparison (RFC 9110 13.1.2).
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag.removeprefix("W/") for tag in candidates)
+
+
+def cache_headers(etag: str | None, cache_control: str) -> dict:
+    headers = {"Cache-Control": cache_control}
+    if etag:
+        headers["ETag"] = etag
+    return headers
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=cache_headers(etag, cache_control),
+    )
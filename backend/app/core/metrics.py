@@ -0,0 +1,274 @@
+"""
+Prometheus metrics.
+
+Everything exported at /metrics is either a counter or gauge updated on
+the request path (route latency/status, queries per request, pool
+checkout wait and occupancy, Redis command latency) or read at scrape
+time from a few Redis keys (import queue depth and job totals, which the
+import worker process writes). A scrape never touches the database.
+
+With several uvicorn workers, set PROMETHEUS_MULTIPROC_DIR (emptied
+before the server starts): every worker then writes its samples to
+files there and a scrape, whichever worker serves it, aggregates all of
+them. Pool gauges are summed over live workers. Without it, metrics are
+those of the serving process only.
+"""
+import logging
+import os
+import time
+from typing import Callable
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from redis.exceptions import RedisError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------
+# HTTP
+# ------------------------------------------------
+HTTP_REQUESTS = Counter(
+    "dinebuddy_http_requests_total",
+    "HTTP requests by route template and status code",
+    ["method", "route", "status"],
+)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "dinebuddy_http_request_duration_seconds",
+    "HTTP request wall time by route template",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+HTTP_REQUEST_QUERIES = Histogram(
+    "dinebuddy_http_request_db_queries",
+    "SQL statements issued per request by route template",
+    ["method", "route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+
+
+def observe_request(
+    method: str,
+    route: str,
+    status_code: int,
+    seconds: float,
+    queries: int,
+) -> None:
+    HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+    HTTP_REQUEST_DURATION.labels(method, route).observe(seconds)
+    HTTP_REQUEST_QUERIES.labels(method, route).observe(queries)
+
+
+# ------------------------------------------------
+# SQLALCHEMY POOLS
+# ------------------------------------------------
+DB_POOL_WAIT = Histogram(
+    "dinebuddy_db_pool_wait_seconds",
+    "Time to check a connection out of the pool (includes connecting)",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "dinebuddy_db_pool_checked_out",
+    "Connections currently checked out",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    "dinebuddy_db_pool_overflow",
+    "Connections open beyond pool_size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_SIZE = Gauge(
+    "dinebuddy_db_pool_size",
+    "Configured pool_size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+
+class _TimedCheckout:
+    """
+    Pool mixin timing every checkout and refreshing the occupancy gauges
+    on checkout and return; the pool is labelled by the engine's
+    pool_logging_name.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.labels(self._metrics_label).observe(
+                time.perf_counter() - started
+            )
+            self._report_usage()
+
+    def _do_return_conn(self, record):
+        try:
+            super()._do_return_conn(record)
+        finally:
+            self._report_usage()
+
+    @property
+    def _metrics_label(self) -> str:
+        return self.logging_name or "default"
+
+    def _report_usage(self) -> None:
+        label = self._metrics_label
+        DB_POOL_CHECKED_OUT.labels(label).set(self.checkedout())
+        DB_POOL_OVERFLOW.labels(label).set(max(self.overflow(), 0))
+        DB_POOL_SIZE.labels(label).set(self.size())
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+# ------------------------------------------------
+# REDIS
+# ------------------------------------------------
+REDIS_COMMAND_DURATION = Histogram(
+    "dinebuddy_redis_command_duration_seconds",
+    "Redis command round-trip time (pipelines excluded)",
+    ["client", "command"],
+    buckets=(0.0002, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5),
+)
+
+
+def observe_redis(client: str, command, seconds: float) -> None:
+    if isinstance(command, bytes):
+        command = command.decode()
+    REDIS_COMMAND_DURATION.labels(client, str(command).upper()).observe(seconds)
+
+
+# ------------------------------------------------
+# MENU CACHE
+# ------------------------------------------------
+MENU_VERSION_BUMP_FAILURES = Counter(
+    "dinebuddy_menu_version_bump_failures",
+    "Menu version bumps that failed after commit (Redis errors)",
+)
+
+MENU_VERSION_BUMPS_PENDING = Gauge(
+    "dinebuddy_menu_version_bumps_pending",
+    "Restaurants whose failed menu version bump awaits retry",
+    multiprocess_mode="livesum",
+)
+
+
+# ------------------------------------------------
+# MENU IMPORTS
+# ------------------------------------------------
+class ImportQueueCollector:
+    """
+    Queue depth and job totals kept in Redis by the import worker.
+    """
+
+    def __init__(self, stats: Callable[[], dict]):
+        self.stats = stats
+
+    def describe(self):
+        # Without describe() the registry calls collect() on register,
+        # i.e. a Redis round trip at import time
+        return []
+
+    def collect(self):
+        try:
+            stats = self.stats()
+        except RedisError as e:
+            logger.warning("Import queue metrics unavailable: %s", e)
+            return
+
+        depth = GaugeMetricFamily(
+            "dinebuddy_import_queue_depth",
+            "Menu import jobs waiting or being processed",
+            labels=["state"],
+        )
+        depth.add_metric(["pending"], stats["pending"])
+        depth.add_metric(["processing"], stats["processing"])
+        yield depth
+
+        jobs = CounterMetricFamily(
+            "dinebuddy_import_jobs",
+            "Finished menu import jobs",
+            labels=["status"],
+        )
+        for status, count in stats["jobs"].items():
+            jobs.add_metric([status], count)
+        yield jobs
+
+        rows = CounterMetricFamily(
+            "dinebuddy_import_rows",
+            "Menu import rows processed",
+            labels=["result"],
+        )
+        rows.add_metric(["imported"], stats["rows_imported"])
+        rows.add_metric(["failed"], stats["rows_failed"])
+        yield rows
+
+        yield CounterMetricFamily(
+            "dinebuddy_import_processing_seconds",
+            "Time spent processing menu import jobs",
+            value=stats["seconds"],
+        )
+
+
+# ------------------------------------------------
+# SCRAPE
+# ------------------------------------------------
+def multiprocess_mode() -> bool:
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+_import_stats: Callable[[], dict] | None = None
+
+
+def register_collectors(import_stats: Callable[[], dict]) -> None:
+    global _import_stats
+    _import_stats = import_stats
+    if not multiprocess_mode():
+        REGISTRY.register(ImportQueueCollector(import_stats))
+
+
+def render() -> bytes:
+    """
+    Exposition text for one scrape.
+    """
+    if not multiprocess_mode():
+        return generate_latest(REGISTRY)
+
+    # Samples of every worker, plus the Redis-backed import metrics once
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    if _import_stats is not None:
+        registry.register(ImportQueueCollector(_import_stats))
+    return generate_latest(registry)
+
+
+def mark_process_dead() -> None:
+    """
+    Drop this worker's live gauges on shutdown (multiprocess mode).
+    """
+    if multiprocess_mode():
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,315 @@
+"""
+Two-tier cache of authenticated principals.
+
+get_current_user / get_current_customer used to load the users or
+customers row on every authenticated request. The fields needed for
+authorization are cached instead:
+
+  tier 1: in-process LRU (per uvicorn worker, short TTL)
+  tier 2: Redis (shared by all workers)
+
+Writes that change a user's role, status or restaurant assignments call
+invalidate_user(), which drops both tiers and broadcasts the eviction to
+the other workers over Redis pub/sub. A failed invalidation raises
+instead of leaving revoked access cached unnoticed.
+"""
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from redis.exceptions import RedisError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.redis import redis_client
+from app.models.customer import Customer
+from app.models.user import User, UserRole
+from app.models.user_restaurant_map import UserRestaurant
+
+logger = logging.getLogger(__name__)
+
+
+INVALIDATION_CHANNEL = "auth:principal:invalidate"
+
+
+# =========================================================
+# Principals
+# =========================================================
+@dataclass(frozen=True)
+class UserPrincipal:
+    """
+    Authorization view of a User (mirrors its role helpers).
+    """
+    id: int
+    role: UserRole
+    is_active: bool
+    restaurant_ids: frozenset[int] = field(default_factory=frozenset)
+    scope_version: int = 0
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role == UserRole.ADMIN
+
+    @property
+    def is_restaurant_staff(self) -> bool:
+        return self.role == UserRole.RESTAURANT_STAFF
+
+    @property
+    def is_restaurant_admin(self) -> bool:
+        return self.role == UserRole.RESTAURANT_ADMIN
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "id": self.id,
+            "role": self.role.value,
+            "is_active": self.is_active,
+            "restaurant_ids": sorted(self.restaurant_ids),
+            "scope_version": self.scope_version,
+        })
+
+    @classmethod
+    def from_json(cls, raw: str) -> "UserPrincipal":
+        data = json.loads(raw)
+        return cls(
+            id=data["id"],
+            role=UserRole(data["role"]),
+            is_active=data["is_active"],
+            restaurant_ids=frozenset(data["restaurant_ids"]),
+            scope_version=data.get("scope_version", 0),
+        )
+
+
+@dataclass(frozen=True)
+class CustomerPrincipal:
+    id: int
+    is_active: bool
+
+    def to_json(self) -> str:
+        return json.dumps({"id": self.id, "is_active": self.is_active})
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CustomerPrincipal":
+        data = json.loads(raw)
+        return cls(id=data["id"], is_active=data["is_active"])
+
+
+# =========================================================
+# Two-tier cache
+# =========================================================
+class PrincipalCache:
+
+    def __init__(
+        self,
+        namespace: str,
+        principal_cls: type,
+        maxsize: int = settings.PRINCIPAL_CACHE_SIZE,
+        local_ttl: float = settings.PRINCIPAL_CACHE_LOCAL_TTL_SECONDS,
+        redis_ttl: int = settings.PRINCIPAL_CACHE_REDIS_TTL_SECONDS,
+    ):
+        self.namespace = namespace
+        self.principal_cls = principal_cls
+        self.maxsize = maxsize
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self._local: OrderedDict[int, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _redis_key(self, principal_id: int) -> str:
+        return f"auth:principal:{self.namespace}:{principal_id}"
+
+    # ---------- tier 1 ----------
+    def _get_local(self, principal_id: int):
+        with self._lock:
+            entry = self._local.get(principal_id)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at < time.monotonic():
+                del self._local[principal_id]
+                return None
+            self._local.move_to_end(principal_id)
+            return principal
+
+    def _set_local(self, principal) -> None:
+        with self._lock:
+            self._local[principal.id] = (time.monotonic() + self.local_ttl, principal)
+            self._local.move_to_end(principal.id)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+    def evict_local(self, principal_id: int | None = None) -> None:
+        with self._lock:
+            if principal_id is None:
+                self._local.clear()
+            else:
+                self._local.pop(principal_id, None)
+
+    # ---------- both tiers ----------
+    def get(self, principal_id: int):
+        principal = self._get_local(principal_id)
+        if principal is not None:
+            return principal
+
+        try:
+            raw = redis_client.get(self._redis_key(principal_id))
+        except RedisError as e:
+            logger.debug("Principal cache unavailable: %s", e)
+            return None
+
+        if raw is None:
+            return None
+
+        principal = self.principal_cls.from_json(raw)
+        self._set_local(principal)
+        return principal
+
+    def set(self, principal) -> None:
+        self._set_local(principal)
+        try:
+            redis_client.set(
+                self._redis_key(principal.id),
+                principal.to_json(),
+                ex=self.redis_ttl,
+            )
+        except RedisError as e:
+            logger.debug("Principal cache unavailable: %s", e)
+
+    def invalidate(self, *principal_ids: int) -> None:
+        """
+        Drop both tiers and broadcast the eviction. Raises RedisError if
+        the shared tier could not be cleared: the old entry would then be
+        served for up to redis_ttl, which the caller has to report.
+        """
+        for principal_id in principal_ids:
+            self.evict_local(principal_id)
+
+        if not principal_ids:
+            return
+
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for principal_id in principal_ids:
+                pipe.delete(self._redis_key(principal_id))
+                pipe.publish(INVALIDATION_CHANNEL, f"{self.namespace}:{principal_id}")
+            pipe.execute()
+        except RedisError as e:
+            logger.error(
+                "Principal invalidation failed for %s %s: %s",
+                self.namespace,
+                principal_ids,
+                e,
+            )
+            raise
+
+
+user_principals = PrincipalCache("user", UserPrincipal)
+customer_principals = PrincipalCache("customer", CustomerPrincipal)
+
+_caches = {cache.namespace: cache for cache in (user_principals, customer_principals)}
+
+
+# =========================================================
+# Loaders
+# =========================================================
+def get_user_principal(db: Session, user_id: int) -> UserPrincipal | None:
+    principal = user_principals.get(user_id)
+    if principal is not None:
+        return principal
+
+    row = (
+        db.query(User.id, User.role, User.is_active, User.scope_version)
+        .filter(User.id == user_id)
+        .first()
+    )
+    if not row:
+        return None
+
+    restaurant_ids = (
+        db.query(UserRestaurant.restaurant_id)
+        .filter(UserRestaurant.user_id == user_id)
+        .all()
+    )
+
+    principal = UserPrincipal(
+        id=row.id,
+        role=row.role,
+        is_active=row.is_active,
+        restaurant_ids=frozenset(r[0] for r in restaurant_ids),
+        scope_version=row.scope_version,
+    )
+    user_principals.set(principal)
+    return principal
+
+
+def get_customer_principal(db: Session, customer_id: int) -> CustomerPrincipal | None:
+    principal = customer_principals.get(customer_id)
+    if principal is not None:
+        return principal
+
+    row = (
+        db.query(Customer.id, Customer.is_active)
+        .filter(Customer.id == customer_id)
+        .first()
+    )
+    if not row:
+        return None
+
+    principal = CustomerPrincipal(id=row.id, is_active=row.is_active)
+    customer_principals.set(principal)
+    return principal
+
+
+def invalidate_user(*user_ids: int) -> None:
+    user_principals.invalidate(*user_ids)
+
+
+def invalidate_customer(*customer_ids: int) -> None:
+    customer_principals.invalidate(*customer_ids)
+
+
+# =========================================================
+# Cross-worker invalidation
+# =========================================================
+_listener = None
+
+
+def _on_invalidate(message: dict) -> None:
+    namespace, _, principal_id = message["data"].partition(":")
+    cache = _caches.get(namespace)
+    if cache and principal_id.isdigit():
+        cache.evict_local(int(principal_id))
+
+
+def _on_listener_error(error: Exception, pubsub, thread) -> None:
+    # Evictions may have been missed while disconnected
+    logger.warning("Principal invalidation listener error: %s", error)
+    for cache in _caches.values():
+        cache.evict_local()
+    time.sleep(1)
+
+
+def start_invalidation_listener() -> None:
+    global _listener
+    if _listener is not None:
+        return
+
+    try:
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{INVALIDATION_CHANNEL: _on_invalidate})
+        _listener = pubsub.run_in_thread(
+            sleep_time=1.0,
+            daemon=True,
+            exception_handler=_on_listener_error,
+        )
+    except RedisError as e:
+        logger.warning("Principal invalidation listener not started: %s", e)
+
+
+def stop_invalidation_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
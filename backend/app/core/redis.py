@@ -1,16 +1,33 @@
+import time
+
 import redis
+import redis.asyncio as aioredis
 from app.core.config import settings
+from app.core.metrics import observe_redis
+
+
+class TimedRedis(redis.Redis):
+    """
+    Records each command's round trip for /metrics.
+    """
+
+    def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return super().execute_command(*args, **options)
+        finally:
+            observe_redis("sync", args[0], time.perf_counter() - started)
 
 
 def get_redis_client() -> redis.Redis:
 
     if settings.REDIS_URL:
-        return redis.from_url(
+        return TimedRedis.from_url(
             settings.REDIS_URL,
             decode_responses=True,
         )
 
-    return redis.Redis(
+    return TimedRedis(
         host=settings.REDIS_HOST,
         port=settings.REDIS_PORT,
         db=settings.REDIS_DB,
@@ -19,3 +36,40 @@ def get_redis_client() -> redis.Redis:
 
 
 redis_client = get_redis_client()
+
+
+# ======================================================
+# Async client (redis.asyncio)
+# ======================================================
+class TimedAsyncRedis(aioredis.Redis):
+
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            observe_redis("async", args[0], time.perf_counter() - started)
+
+
+def get_async_redis_pool() -> aioredis.BlockingConnectionPool:
+
+    if settings.REDIS_URL:
+        return aioredis.BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+            decode_responses=True,
+        )
+
+    return aioredis.BlockingConnectionPool(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DB,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+        decode_responses=True,
+    )
+
+
+async_redis_pool = get_async_redis_pool()
+async_redis_client = TimedAsyncRedis(connection_pool=async_redis_pool)
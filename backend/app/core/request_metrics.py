@@ -0,0 +1,146 @@
+"""
+Per-request timing and SQL query counting.
+
+RequestMetricsMiddleware opens a RequestStats for every HTTP request in a
+context variable; cursor events on both engines add each statement's
+count and duration to it (sync routes run in the threadpool with a copy
+of the context, so they update the same object). The totals are sent back
+as a Server-Timing header, and a warning is logged when a request goes
+over REQUEST_QUERY_BUDGET - the usual sign of an N+1. Per-route latency,
+status and query counts are aggregated by Prometheus (app.core.metrics).
+"""
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import observe_request
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+
+    def server_timing(self, wall_seconds: float) -> str:
+        return (
+            f"app;dur={wall_seconds * 1e3:.2f}, "
+            f'db;dur={self.db_seconds * 1e3:.2f};desc="{self.queries} queries"'
+        )
+
+
+_current: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> RequestStats | None:
+    return _current.get()
+
+
+# ------------------------------------------------
+# SQLALCHEMY EVENTS
+# ------------------------------------------------
+# The start time is kept on the statement's execution context, not on
+# the pooled connection: after_cursor_execute does not fire when a
+# statement raises, and a per-connection stack would then pair later
+# statements with stale start times.
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+
+    stats.queries += 1
+    started = getattr(context, "_query_started", None)
+    if started is not None:
+        stats.db_seconds += time.perf_counter() - started
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Count statements run on this engine (pass async_engine.sync_engine
+    for the async one).
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ------------------------------------------------
+# ROUTES
+# ------------------------------------------------
+def route_path(scope: Scope) -> str:
+    """
+    Path template of the matched route; unmatched paths share one value
+    so 404 scans cannot grow the label set.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or "<unmatched>"
+
+
+def warn_over_budget(scope: Scope, stats: RequestStats) -> None:
+    if stats.queries > settings.REQUEST_QUERY_BUDGET:
+        logger.warning(
+            "%s %s issued %d queries (budget %d)",
+            scope.get("method", ""),
+            route_path(scope),
+            stats.queries,
+            settings.REQUEST_QUERY_BUDGET,
+        )
+
+
+# ------------------------------------------------
+# MIDDLEWARE
+# ------------------------------------------------
+class RequestMetricsMiddleware:
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.SERVER_TIMING_HEADER:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        stats.server_timing(time.perf_counter() - started),
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            wall_seconds = time.perf_counter() - started
+            warn_over_budget(scope, stats)
+            observe_request(
+                scope.get("method", ""),
+                route_path(scope),
+                status_code,
+                wall_seconds,
+                stats.queries,
+            )
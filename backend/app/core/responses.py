@@ -0,0 +1,67 @@
+"""
+Fast JSON rendering.
+
+ORJSONResponse is the app's default response class. Hot list routes go
+further: they build plain dicts (from the compiled menu snapshot or from
+row tuples) and return them in a Response directly, which skips FastAPI's
+per-object response_model validation. Bodies whose content is fully
+identified by an ETag are also kept pre-encoded in a small in-process
+LRU, so a repeat request that misses the client cache is a dict lookup.
+"""
+import threading
+from collections import OrderedDict
+
+import orjson
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+from app.core.config import settings
+
+
+def json_response(
+    content,
+    headers: dict | None = None,
+    status_code: int = 200,
+) -> ORJSONResponse:
+    return ORJSONResponse(content=content, status_code=status_code, headers=headers)
+
+
+def encoded_response(body: bytes, headers: dict | None = None) -> Response:
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class EncodedBodyCache:
+    """
+    LRU of ETag -> encoded JSON body.
+    """
+
+    def __init__(self, maxsize: int = settings.ENCODED_RESPONSE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._bodies: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, etag: str | None) -> bytes | None:
+        if etag is None:
+            return None
+        with self._lock:
+            body = self._bodies.get(etag)
+            if body is not None:
+                self._bodies.move_to_end(etag)
+            return body
+
+    def encode(self, etag: str | None, content) -> bytes:
+        """
+        Encode content, remembering the body under etag when there is one.
+        """
+        body = orjson.dumps(content)
+        if etag is None:
+            return body
+        with self._lock:
+            self._bodies[etag] = body
+            self._bodies.move_to_end(etag)
+            while len(self._bodies) > self.maxsize:
+                self._bodies.popitem(last=False)
+        return body
+
+
+encoded_bodies = EncodedBodyCache()
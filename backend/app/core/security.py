@@ -1,12 +1,58 @@
+"""
+Password hashing.
+
+bcrypt runs on a small dedicated thread pool (PASSWORD_HASH_WORKERS; the
+bcrypt extension releases the GIL while hashing) rather than directly on
+the request thread, and at most PASSWORD_HASH_MAX_PENDING checks may run
+or wait at once. A burst of logins therefore queues behind its own
+workers, bounded, instead of taking every request thread and stalling
+unrelated routes; checks past the bound get a 503.
+
+The cost is BCRYPT_ROUNDS. A stored hash with any other cost still
+verifies, and verify_and_rehash() returns a replacement at the current
+cost so it can be upgraded on login.
+"""
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 from passlib.exc import PasswordValueError
 
+from app.core.config import settings
+
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    # Any other cost is flagged by needs_update / verify_and_update
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
 )
+_slots = threading.BoundedSemaphore(settings.PASSWORD_HASH_MAX_PENDING)
+
+
+def _offload(fn, *args):
+    """
+    Run fn on the hashing pool and wait for it, or refuse when the pool
+    already has PASSWORD_HASH_MAX_PENDING checks in flight.
+    """
+    if not _slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign-in attempts in progress, please retry",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        return _executor.submit(fn, *args).result()
+    finally:
+        _slots.release()
 
 
 def _sha256(password: str) -> bytes:
@@ -14,13 +60,25 @@ def _sha256(password: str) -> bytes:
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(_sha256(password))
+    return _offload(pwd_context.hash, _sha256(password))
 
 
-def verify_password(password: str, hashed_password: str) -> bool:
-    """Return True if password matches hash, False otherwise. Never raises for invalid input."""
+def _verify_and_update(password: str, hashed_password: str) -> tuple[bool, str | None]:
     try:
-        return pwd_context.verify(_sha256(password), hashed_password)
+        return pwd_context.verify_and_update(_sha256(password), hashed_password)
     except PasswordValueError:
         # bcrypt rejects digests containing NULL bytes; treat as wrong password
-        return False
+        return False, None
+
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    """Return True if password matches hash, False otherwise. Never raises for invalid input."""
+    return _offload(_verify_and_update, password, hashed_password)[0]
+
+
+def verify_and_rehash(password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """
+    Verify the password; on success with a hash of another cost, also
+    return a new hash at BCRYPT_ROUNDS (None when no rehash is needed).
+    """
+    return _offload(_verify_and_update, password, hashed_password)
@@ -1,13 +1,29 @@
 """
 Main FastAPI application entry point
 """
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+from prometheus_client import CONTENT_TYPE_LATEST
 from app.core.config import settings
-from app.core.database import engine
+from app.core.database import (
+    async_engine,
+    async_read_engine,
+    engine,
+    pool_config_summary,
+)
+from app.core import metrics as prometheus_metrics
+from app.core.dependencies import require_metrics_token
+from app.core.redis import async_redis_pool
+from app.core.request_metrics import RequestMetricsMiddleware, instrument_engine
+from app.core.principal_cache import (
+    start_invalidation_listener,
+    stop_invalidation_listener,
+)
 from app.db.base import Base
 from app.api.v1.router import api_router
+from app.services import import_queue_service
 
 
 @asynccontextmanager
@@ -18,15 +34,25 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting up DineBuddy backend...")
     print(f"📊 Database URL: {settings.DATABASE_URL.split('@')[-1] if '@' in settings.DATABASE_URL else 'Not configured'}")
+    print(f"🏊 Database pools: {pool_config_summary()}")
     
     # Note: We use Alembic migrations for database schema management
     # Tables are created by running: alembic upgrade head
     # (handled automatically in docker-compose.yml startup command)
+
+    # Evict cached principals when another worker changes a user
+    start_invalidation_listener()
     
     yield
     
     # Shutdown
     print("👋 Shutting down DineBuddy backend...")
+    stop_invalidation_listener()
+    prometheus_metrics.mark_process_dead()
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+    await async_redis_pool.disconnect()
 
 
 app = FastAPI(
@@ -36,9 +62,18 @@ app = FastAPI(
     docs_url=f"{settings.API_V1_PREFIX}/docs",
     redoc_url=f"{settings.API_V1_PREFIX}/redoc",
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Count SQL statements and their time per request
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+instrument_engine(async_read_engine.sync_engine)
+
+# Scrape-time import queue metrics (pool gauges are kept by the pools)
+prometheus_metrics.register_collectors(import_stats=import_queue_service.stats)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -48,6 +83,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request timing (added last, so it is outermost and covers CORS too)
+app.add_middleware(RequestMetricsMiddleware)
+
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
@@ -61,3 +99,13 @@ async def root():
         "version": settings.VERSION,
         "docs": f"{settings.API_V1_PREFIX}/docs"
     }
+
+
+@app.get(
+    "/metrics",
+    include_in_schema=False,
+    dependencies=[Depends(require_metrics_token)],
+)
+def metrics():
+    """Prometheus scrape endpoint (bearer METRICS_TOKEN, no database access)"""
+    return Response(content=prometheus_metrics.render(), media_type=CONTENT_TYPE_LATEST)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, ForeignKey, JSON, Float
 from app.db.base import Base
 
 
@@ -19,3 +19,6 @@ class MenuItemImportJob(Base):
     failed_count = Column(Integer, default=0)
 
     errors = Column(JSON, default=list)
+
+    # Import throughput (rows processed per second)
+    rows_per_second = Column(Float, nullable=True)
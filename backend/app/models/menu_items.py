@@ -49,4 +49,17 @@ class MenuItem(Base, TimestampMixin):
         Index("ix_menu_items_restaurant_category", "restaurant_id", "category_id"),
         Index("ix_menu_items_availability", "is_available"),
         Index("ix_menu_items_time_window", "available_from", "available_to"),
+        # Fuzzy search (pg_trgm)
+        Index(
+            "ix_menu_items_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_menu_items_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
     )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, JSON
+from sqlalchemy import Column, String, Boolean, JSON, Index
 from app.db.base import Base, IDMixin, TimestampMixin
 from sqlalchemy.orm import relationship
 
@@ -51,3 +51,21 @@ class Restaurant(Base, IDMixin, TimestampMixin):
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
+
+    __table_args__ = (
+        # Keyset pagination of the restaurant list
+        Index("ix_restaurants_created_at_id", "created_at", "id"),
+        # Slug allocation; LIKE 'base-%' needs pattern ops outside the C collation
+        Index(
+            "ix_restaurants_slug_pattern",
+            "slug",
+            postgresql_ops={"slug": "text_pattern_ops"},
+        ),
+        # Name search; ILIKE '%term%' is served by the trigram index (pg_trgm)
+        Index(
+            "ix_restaurants_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
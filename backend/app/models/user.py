@@ -1,7 +1,7 @@
 """
 User model - Basic customer/admin authentication
 """
-from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum   
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 import enum
 
@@ -47,6 +47,9 @@ class User(Base, IDMixin, TimestampMixin):
     )
     is_active = Column(Boolean, default=True, nullable=False)
     is_verified = Column(Boolean, default=False, nullable=False)
+
+    # Bumped with every role/status/assignment change (see access_scope)
+    scope_version = Column(Integer, default=0, server_default="0", nullable=False)
     
     # Tracking
     last_login = Column(DateTime, nullable=True)
@@ -15,6 +15,7 @@ class MenuItemImportJobRead(BaseModel):
     success_count: int
     failed_count: int
     errors: list
+    rows_per_second: Optional[float] = None
 
     class Config:
         from_attributes = True
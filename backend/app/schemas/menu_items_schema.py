@@ -4,6 +4,8 @@ from decimal import Decimal
 from datetime import time
 from pydantic import condecimal
 
+from app.schemas.menu_item_variant_schema import MenuItemVariantRead
+
 PriceDecimal = condecimal(max_digits=10, decimal_places=2)
 
 class MenuItemBase(BaseModel):
@@ -76,6 +78,15 @@ class MenuItemRead(MenuItemBase):
         from_attributes = True
 
 
+class MenuItemSearchResult(MenuItemRead):
+    score: float
+
+
+class MenuItemListRead(MenuItemRead):
+    # Only present with ?include=variants
+    variants: Optional[list[MenuItemVariantRead]] = None
+
+
 class MenuItemAvailabilityUpdate(BaseModel):
     is_available: bool
     model_config = {"from_attributes": True}
@@ -98,3 +109,57 @@ class MenuItemTimingUpdate(BaseModel):
             )
         
         return self
+
+
+MAX_BATCH_ITEMS = 500
+
+
+class MenuItemBatchUpdate(BaseModel):
+    """
+    One item of a batch update. Omitted or null fields are left unchanged,
+    except the timing window, which is replaced as a pair (both null
+    clears it).
+    """
+    id: int
+    is_available: Optional[bool] = None
+    price: PriceDecimal | None = Field(None, ge=0)
+    category_id: Optional[int] = None
+    available_from: Optional[time] = None
+    available_to: Optional[time] = None
+
+    @property
+    def sets_timing(self) -> bool:
+        return "available_from" in self.model_fields_set
+
+    @model_validator(mode='after')
+    def validate_fields(self):
+        timing = {"available_from", "available_to"} & self.model_fields_set
+        if len(timing) == 1 or (self.available_from is None) != (self.available_to is None):
+            raise ValueError(
+                "available_from and available_to must be set together. "
+                "Either both must be provided or both must be None."
+            )
+
+        # null leaves a field unchanged, so it does not count as an update
+        # (except for the timing pair, where both null clears the window)
+        changes = self.model_dump(exclude={"id"}, exclude_unset=True, exclude_none=True)
+        if not changes and not self.sets_timing:
+            raise ValueError("Nothing to update")
+
+        return self
+
+
+class MenuItemBatchRequest(BaseModel):
+    items: list[MenuItemBatchUpdate] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS)
+
+    @model_validator(mode='after')
+    def validate_unique_ids(self):
+        ids = [item.id for item in self.items]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Each item id may appear only once")
+        return self
+
+
+class MenuItemBatchResult(BaseModel):
+    updated: int
+    item_ids: list[int]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, field_validator
-from typing import Optional, List, Dict
+from typing import Optional, List
 from app.utils.validators import validate_business_hours_format
 
 class RestaurantCreateRequest(BaseModel):
@@ -72,11 +72,18 @@ class RestaurantResponse(BaseModel):
     data: RestaurantRead
 
 
+class RestaurantListMeta(BaseModel):
+    page: Optional[int] = None
+    limit: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
 class RestaurantListResponse(BaseModel):
     status: bool
     message: str
     data: List[RestaurantRead]
-    meta: Dict[str, int]
+    meta: RestaurantListMeta
 
 
 class RestaurantDetailResponse(BaseModel):
@@ -1,21 +1,43 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, TextIO
+from itertools import islice
 import json
 import csv
-import io
+import os
+import re
+import shutil
+import tempfile
+import time
 
-from fastapi import HTTPException, UploadFile, BackgroundTasks,status
+from fastapi import HTTPException, UploadFile, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.config import settings
 from app.core.database import SessionLocal
+from app.models.menu_category import MenuCategory
 from app.models.menu_items import MenuItem
 from app.models.bulk_import_items import MenuItemImportJob
+from app.schemas.menu_items_schema import MenuItemCreate
+from app.services import import_queue_service
+from app.services.menu_version_service import bump_menu_version
 
 
 # ------------------------------------------------
 # CREATE IMPORT JOB
 # ------------------------------------------------
-def create_job(db: Session, restaurant_id: int) -> MenuItemImportJob:
+def create_job(
+    db: Session,
+    restaurant_id: int,
+    file_type: str,
+    path: str,
+) -> MenuItemImportJob:
+    """
+    Record the job and hand it to the import worker queue.
+    """
     job = MenuItemImportJob(
         restaurant_id=restaurant_id,
         status="PENDING",
@@ -26,88 +48,392 @@ def create_job(db: Session, restaurant_id: int) -> MenuItemImportJob:
     )
     db.add(job)
     db.commit()
-    db.refresh(job)
+
+    try:
+        import_queue_service.enqueue(job.id, restaurant_id, file_type, path)
+    except RedisError:
+        mark_job_failed(db, job.id, "Import queue unavailable")
+        os.remove(path)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Import queue unavailable, please retry",
+        )
+
     return job
 
 
+# A job in one of these has committed its outcome; redeliveries are no-ops
+FINAL_STATUSES = ("COMPLETED", "FAILED")
+
+
+def is_job_finished(db: Session, job_id: int) -> bool:
+    status = (
+        db.query(MenuItemImportJob.status)
+        .filter(MenuItemImportJob.id == job_id)
+        .scalar()
+    )
+    return status in FINAL_STATUSES
+
+
+def mark_job_failed(db: Session, job_id: int, error: str) -> None:
+    job = db.query(MenuItemImportJob).filter(MenuItemImportJob.id == job_id).first()
+    if not job or job.status in FINAL_STATUSES:
+        return
+
+    job.status = "FAILED"
+    job.errors = [*(job.errors or []), {"row": None, "error": error, "data": None}]
+    db.commit()
+
+    import_queue_service.record_finished(job.status)
+
+
+# ------------------------------------------------
+# VALIDATION (PURE PYTHON, NO DB)
+# ------------------------------------------------
+IMPORT_BATCH_SIZE = 500
+
+
+def _clean_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    # CSV cells are strings; an empty cell means "not provided"
+    return {
+        key.strip(): (value.strip() or None) if isinstance(value, str) else value
+        for key, value in row.items()
+        if key
+    }
+
+
+def validate_rows(
+    rows: List[Dict[str, Any]],
+    restaurant_id: int,
+    category_ids: set[int],
+    start: int = 1,
+) -> tuple[list[tuple[int, dict]], list[dict]]:
+    """
+    Validate rows against MenuItemCreate.
+
+    Returns (index, insert values) pairs for valid rows and an error entry
+    for every rejected row.
+    """
+    valid: list[tuple[int, dict]] = []
+    errors: list[dict] = []
+
+    for index, row in enumerate(rows, start=start):
+        # JSON arrays may hold anything; CSV rows are always dicts
+        if not isinstance(row, dict):
+            errors.append({"row": index, "error": "row must be an object", "data": row})
+            continue
+
+        try:
+            item = MenuItemCreate.model_validate(_clean_row(row))
+        except ValidationError as e:
+            errors.append({
+                "row": index,
+                "error": "; ".join(
+                    f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}"
+                    for err in e.errors()
+                ),
+                "data": row,
+            })
+            continue
+
+        if item.category_id not in category_ids:
+            errors.append({
+                "row": index,
+                "error": f"category_id: Category {item.category_id} not found",
+                "data": row,
+            })
+            continue
+
+        values = item.model_dump()
+        values["restaurant_id"] = restaurant_id
+        valid.append((index, values))
+
+    return valid, errors
+
+
+def _allowed_category_ids(db: Session, restaurant_id: int) -> set[int]:
+    return {
+        r[0]
+        for r in db.query(MenuCategory.id).filter(
+            (MenuCategory.restaurant_id == restaurant_id)
+            | (MenuCategory.is_global.is_(True))
+        )
+    }
+
+
+# ------------------------------------------------
+# BATCH WRITER
+# ------------------------------------------------
+def insert_batch(db: Session, batch: list[tuple[int, dict]]) -> list[dict]:
+    """
+    Insert a batch with one multi-row INSERT inside a savepoint.
+
+    If the batch is rejected by the database, retry it row by row so only
+    the offending rows are dropped. Returns the per-row errors.
+    """
+    if not batch:
+        return []
+
+    try:
+        with db.begin_nested():
+            db.execute(insert(MenuItem), [values for _, values in batch])
+        return []
+    except SQLAlchemyError:
+        pass
+
+    errors: list[dict] = []
+    for index, values in batch:
+        try:
+            with db.begin_nested():
+                db.execute(insert(MenuItem), [values])
+        except SQLAlchemyError as e:
+            errors.append({
+                "row": index,
+                "error": str(getattr(e, "orig", e)),
+                "data": jsonable_encoder(values),
+            })
+    return errors
+
+
 # ------------------------------------------------
 # CORE PROCESSOR
 # ------------------------------------------------
+def _batches(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[list]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
 def process_rows(
     db: Session,
     job_id: int,
     restaurant_id: int,
-    rows: List[Dict[str, Any]],
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int = IMPORT_BATCH_SIZE,
 ) -> None:
+    """
+    Import rows in fixed-size batches.
+
+    `rows` may be a lazy iterator (see iter_csv_rows / iter_json_rows), so
+    at most one batch is held in memory. Every batch is validated up front,
+    written with a multi-row INSERT and committed together with the job's
+    progress counters.
+    """
     job = db.query(MenuItemImportJob).filter(MenuItemImportJob.id == job_id).first()
-    if not job:
+    if not job or job.status in FINAL_STATUSES:
+        # Redelivered after its outcome was committed: importing again
+        # would duplicate every row
         return
 
-    job.status = "PROCESSING"
-    job.total_records = len(rows)
-    db.commit()
+    started = time.perf_counter()
 
-    success = 0
-    failed = 0
-    errors: list[dict] = []
+    # A job still PROCESSING was interrupted mid-way (worker restart).
+    # Its counters were committed with the rows, so resume after them.
+    resume_from = 0
+    if job.status == "PROCESSING":
+        resume_from = job.total_records or 0
+        rows = islice(rows, resume_from, None)
+    else:
+        job.status = "PROCESSING"
+        job.total_records = 0
+        job.success_count = 0
+        job.failed_count = 0
+        job.errors = []
+        db.commit()
 
-    for index, row in enumerate(rows, start=1):
-        try:
-            item = MenuItem(
-                restaurant_id=restaurant_id,
-                name=row["name"],
-                category_id=int(row["category_id"]),
-                price=float(row["price"]),
-                description=row.get("description"),
-                is_available=bool(row.get("is_available", True)),
-                is_vegetarian=bool(row.get("is_vegetarian", False)),
-                preparation_time_minutes=(
-                    int(row["preparation_time_minutes"])
-                    if row.get("preparation_time_minutes")
-                    else None
-                ),
+    category_ids = _allowed_category_ids(db, restaurant_id)
+    total = resume_from
+    success = job.success_count or 0
+    failed = job.failed_count or 0
+    errors: list[dict] = list(job.errors or [])
+
+    try:
+        for batch in _batches(rows, batch_size):
+            # 1. Validate the batch in pure Python
+            valid, invalid = validate_rows(
+                batch,
+                restaurant_id,
+                category_ids,
+                start=total + 1,
             )
-            db.add(item)
-            db.flush()   # validates row before commit
-            success += 1
 
-        except (KeyError, ValueError, SQLAlchemyError) as e:
-            db.rollback()
-            failed += 1
-            errors.append({
-                "row": index,
-                "error": str(e),
-                "data": row
-            })
+            # 2. Write valid rows in one statement
+            rejected = insert_batch(db, valid)
+
+            total += len(batch)
+            success += len(valid) - len(rejected)
+            failed += len(invalid) + len(rejected)
+            errors.extend(invalid)
+            errors.extend(rejected)
+
+            job.total_records = total
+            job.success_count = success
+            job.failed_count = failed
+            if invalid or rejected:
+                job.errors = list(errors)
+            db.commit()
+
+    except (ValueError, csv.Error) as e:
+        # Malformed file: keep the rows imported so far, fail the job
+        db.rollback()
+        errors.append({"row": total + 1, "error": f"Malformed file: {e}", "data": None})
+        failed += 1
 
+    # 3. Record per-row errors without touching the good rows
+    elapsed = time.perf_counter() - started
+    job.total_records = total
     job.success_count = success
     job.failed_count = failed
-    job.errors = errors
+    job.errors = sorted(errors, key=lambda e: e["row"] or 0)
+    job.rows_per_second = (
+        round((total - resume_from) / elapsed, 2) if elapsed > 0 else None
+    )
     job.status = "COMPLETED" if failed == 0 else "FAILED"
     db.commit()
 
+    import_queue_service.record_finished(
+        job.status,
+        rows_imported=success,
+        rows_failed=failed,
+        seconds=elapsed,
+    )
+
+    if success:
+        bump_menu_version(restaurant_id)
+
 
 # ------------------------------------------------
-# FILE PROCESSORS
+# STREAMING FILE READERS
 # ------------------------------------------------
-def process_csv(
-    db: Session,
-    job_id: int,
-    restaurant_id: int,
-    file: UploadFile,
-):
-    content = file.file.read().decode("utf-8")
-    rows = list(csv.DictReader(io.StringIO(content)))
-    process_rows(db, job_id, restaurant_id, rows)
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+JSON_READ_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"\s*")
+
 
+def iter_csv_rows(fp: TextIO) -> Iterator[Dict[str, Any]]:
+    """
+    Yield CSV rows one line at a time.
+    """
+    yield from csv.DictReader(fp)
+
+
+def iter_json_rows(
+    fp: TextIO,
+    chunk_size: int = JSON_READ_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array one at a time.
+
+    Reads the file in fixed-size chunks and decodes one element at a time,
+    so memory is bounded by the chunk size plus the largest element.
+    Raises ValueError if the document is not a well-formed array.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+    state = "start"  # start | first | value | separator
+
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+
+        if pos == len(buffer):
+            if eof:
+                if state == "start":
+                    raise ValueError("JSON must be an array")
+                raise ValueError("Unexpected end of JSON array")
+            buffer, pos = buffer[pos:] + fp.read(chunk_size), 0
+            eof = pos == len(buffer)
+            continue
+
+        char = buffer[pos]
+
+        if state == "start":
+            if char != "[":
+                raise ValueError("JSON must be an array")
+            pos += 1
+            state = "first"
+
+        elif state == "separator" or (state == "first" and char == "]"):
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' at offset {pos}")
+            pos += 1
+            state = "value"
+
+        else:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                end = None
+
+            # Element may continue in the next chunk
+            if end is None or (end == len(buffer) and not eof):
+                if eof:
+                    raise ValueError(f"Invalid JSON element at offset {pos}")
+                chunk = fp.read(chunk_size)
+                buffer, pos = buffer[pos:] + chunk, 0
+                eof = not chunk
+                continue
+
+            pos = end
+            state = "separator"
+            yield value
+
+
+def _file_type(filename: str | None) -> str:
+    filename = (filename or "").lower()
+    if filename.endswith(".csv"):
+        return "csv"
+    if filename.endswith(".json"):
+        return "json"
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Only CSV or JSON supported",
+    )
 
-def process_json(
+
+def save_upload(file: UploadFile) -> tuple[str, str]:
+    """
+    Copy the spooled upload to disk in fixed-size chunks.
+
+    The UploadFile is closed once the response is sent, so the import
+    reads from this copy instead. Returns (file_type, path).
+    """
+    file_type = _file_type(file.filename)
+
+    if file_type == "json":
+        head = file.file.read(1024).decode("utf-8-sig", errors="ignore").lstrip()
+        if head and not head.startswith("["):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="JSON must be an array"
+            )
+        file.file.seek(0)
+
+    fd, path = tempfile.mkstemp(
+        prefix="menu-import-",
+        suffix=f".{file_type}",
+        dir=settings.IMPORT_UPLOAD_DIR,
+    )
+    with os.fdopen(fd, "wb") as out:
+        shutil.copyfileobj(file.file, out, UPLOAD_COPY_CHUNK_SIZE)
+
+    return file_type, path
+
+
+def process_file(
     db: Session,
     job_id: int,
     restaurant_id: int,
-    items: List[Dict[str, Any]],
-):
-    process_rows(db, job_id, restaurant_id, items)
+    file_type: str,
+    path: str,
+) -> None:
+    with open(path, encoding="utf-8-sig", newline="") as fp:
+        rows = iter_csv_rows(fp) if file_type == "csv" else iter_json_rows(fp)
+        process_rows(db, job_id, restaurant_id, rows)
 
 
 # ------------------------------------------------
@@ -131,66 +457,20 @@ def get_import_job(db: Session, job_id: int, restaurant_id: int) -> MenuItemImpo
 
 
 # ------------------------------------------------
-# BACKGROUND TASK ENTRY
+# WORKER ENTRY (see app.workers.import_worker)
 # ------------------------------------------------
-def start_import(
-    job_id: int,
-    restaurant_id: int,
-    file: UploadFile,
-    background_tasks: BackgroundTasks,
-):
-    filename = file.filename.lower()
-
-    if filename.endswith(".csv"):
-        content = file.file.read().decode("utf-8")
-        background_tasks.add_task(
-            _run_import_job,
-            job_id,
-            restaurant_id,
-            "csv",
-            content,
-        )
-
-    elif filename.endswith(".json"):
-        items = json.loads(file.file.read().decode("utf-8"))
-        if not isinstance(items, list):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="JSON must be an array"
-            )
-
-        background_tasks.add_task(
-            _run_import_job,
-            job_id,
-            restaurant_id,
-            "json",
-            items,
-        )
-    else:
-        raise ValueError("Only CSV or JSON supported")
-
-
-
-
-
-# ------------------------------------------------
-# BACKGROUND WORKER
-# ------------------------------------------------
-def _run_import_job(
+def run_import_job(
     job_id: int,
     restaurant_id: int,
     file_type: str,
-    payload,
-):
+    path: str,
+) -> None:
     """
-    Runs in background with isolated DB session
+    Runs one queued job with an isolated DB session.
+    The worker removes the upload once the job is acknowledged.
     """
     db = SessionLocal()
     try:
-        if file_type == "json":
-            process_rows(db, job_id, restaurant_id, payload)
-        else:  # CSV
-            rows = list(csv.DictReader(io.StringIO(payload)))
-            process_rows(db, job_id, restaurant_id, rows)
+        process_file(db, job_id, restaurant_id, file_type, path)
     finally:
         db.close()
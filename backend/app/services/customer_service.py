@@ -0,0 +1,69 @@
+"""
+Customer resolution for OTP sign-in.
+
+A phone number is resolved to a customer id with a single
+INSERT ... ON CONFLICT (phone) DO UPDATE ... RETURNING id, which creates
+first-time customers and returns existing ones in one round trip without
+racing on the unique phone index. The phone -> id mapping never changes,
+so it is also kept in Redis: a returning customer is resolved with no
+database query at all.
+"""
+import logging
+
+from redis.exceptions import RedisError
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import async_redis_client
+from app.models.customer import Customer
+
+logger = logging.getLogger(__name__)
+
+
+def phone_key(phone: str) -> str:
+    return f"customer:phone:{phone}"
+
+
+async def get_cached_customer_id(phone: str) -> int | None:
+    try:
+        cached = await async_redis_client.get(phone_key(phone))
+    except RedisError as e:
+        logger.warning("Customer id cache unavailable: %s", e)
+        return None
+    return int(cached) if cached else None
+
+
+async def upsert_customer_id(db: AsyncSession, phone: str) -> int:
+    stmt = insert(Customer).values(phone=phone)
+    # No-op update so RETURNING also yields the id of an existing row
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Customer.phone],
+        set_={"phone": stmt.excluded.phone},
+    ).returning(Customer.id)
+
+    customer_id = (await db.execute(stmt)).scalar_one()
+    await db.commit()
+    return customer_id
+
+
+async def resolve_customer_id(db: AsyncSession, phone: str) -> int:
+    """
+    Id of the customer with this phone, created on first sign-in.
+    """
+    customer_id = await get_cached_customer_id(phone)
+    if customer_id is not None:
+        return customer_id
+
+    customer_id = await upsert_customer_id(db, phone)
+
+    try:
+        await async_redis_client.setex(
+            phone_key(phone),
+            settings.CUSTOMER_ID_CACHE_TTL_SECONDS,
+            customer_id,
+        )
+    except RedisError as e:
+        logger.warning("Could not cache customer id: %s", e)
+
+    return customer_id
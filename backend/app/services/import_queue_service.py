@@ -0,0 +1,181 @@
+"""
+Durable Redis-backed queue for menu item import jobs.
+
+Reliable-queue layout:
+  import:queue            pending jobs (LPUSH in, consumed from the right)
+  import:processing       jobs reserved by a worker
+  import:lease:{job_id}   visibility lease, kept alive by the worker
+  import:metrics          running totals of finished jobs (for /metrics)
+
+A job whose lease expires (worker crashed or was restarted) is moved back
+to the pending list by requeue_expired() with its attempt count bumped.
+"""
+import json
+import logging
+
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = "import:queue"
+PROCESSING_KEY = "import:processing"
+LEASE_KEY_PREFIX = "import:lease:"
+METRICS_KEY = "import:metrics"
+
+
+def lease_key(job_id: int) -> str:
+    return f"{LEASE_KEY_PREFIX}{job_id}"
+
+
+# Move one job to the processing list and take its lease atomically
+_RESERVE = redis_client.register_script(
+    """
+    local raw = redis.call('LMOVE', KEYS[1], KEYS[2], 'RIGHT', 'LEFT')
+    if not raw then
+        return nil
+    end
+    local job = cjson.decode(raw)
+    redis.call('SET', ARGV[1] .. job['job_id'], '1', 'EX', ARGV[2])
+    return raw
+    """
+)
+
+# Put back every reserved job whose lease has expired
+_REQUEUE_EXPIRED = redis_client.register_script(
+    """
+    local moved = 0
+    for _, raw in ipairs(redis.call('LRANGE', KEYS[1], 0, -1)) do
+        local job = cjson.decode(raw)
+        if redis.call('EXISTS', ARGV[1] .. job['job_id']) == 0 then
+            redis.call('LREM', KEYS[1], 1, raw)
+            job['attempts'] = (job['attempts'] or 0) + 1
+            redis.call('LPUSH', KEYS[2], cjson.encode(job))
+            moved = moved + 1
+        end
+    end
+    return moved
+    """
+)
+
+
+# ------------------------------------------------
+# PRODUCER
+# ------------------------------------------------
+def enqueue(job_id: int, restaurant_id: int, file_type: str, path: str) -> None:
+    redis_client.lpush(
+        QUEUE_KEY,
+        json.dumps({
+            "job_id": job_id,
+            "restaurant_id": restaurant_id,
+            "file_type": file_type,
+            "path": path,
+            "attempts": 0,
+        }),
+    )
+
+
+# ------------------------------------------------
+# CONSUMER
+# ------------------------------------------------
+def reserve(visibility_timeout: int | None = None) -> tuple[str, dict] | None:
+    """
+    Reserve the oldest pending job. Returns (raw message, payload) or None.
+    """
+    raw = _RESERVE(
+        keys=[QUEUE_KEY, PROCESSING_KEY],
+        args=[
+            LEASE_KEY_PREFIX,
+            visibility_timeout or settings.IMPORT_VISIBILITY_TIMEOUT_SECONDS,
+        ],
+    )
+    if raw is None:
+        return None
+    return raw, json.loads(raw)
+
+
+def extend_lease(job_id: int, visibility_timeout: int | None = None) -> None:
+    redis_client.expire(
+        lease_key(job_id),
+        visibility_timeout or settings.IMPORT_VISIBILITY_TIMEOUT_SECONDS,
+    )
+
+
+def ack(raw: str, job_id: int) -> None:
+    """
+    Drop a finished job (completed or permanently failed).
+    """
+    pipe = redis_client.pipeline()
+    pipe.lrem(PROCESSING_KEY, 1, raw)
+    pipe.delete(lease_key(job_id))
+    pipe.execute()
+
+
+def retry(raw: str, payload: dict) -> None:
+    """
+    Give a failed attempt back to the pending list.
+    """
+    payload = {**payload, "attempts": payload.get("attempts", 0) + 1}
+
+    pipe = redis_client.pipeline()
+    pipe.lrem(PROCESSING_KEY, 1, raw)
+    pipe.lpush(QUEUE_KEY, json.dumps(payload))
+    pipe.delete(lease_key(payload["job_id"]))
+    pipe.execute()
+
+
+def requeue_expired() -> int:
+    return _REQUEUE_EXPIRED(
+        keys=[PROCESSING_KEY, QUEUE_KEY],
+        args=[LEASE_KEY_PREFIX],
+    )
+
+
+# ------------------------------------------------
+# METRICS
+# ------------------------------------------------
+def record_finished(
+    status: str,
+    rows_imported: int = 0,
+    rows_failed: int = 0,
+    seconds: float = 0.0,
+) -> None:
+    """
+    Add a finished job to the running totals. Best effort: the job's own
+    row is the source of truth.
+    """
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.hincrby(METRICS_KEY, f"jobs:{status}", 1)
+    pipe.hincrby(METRICS_KEY, "rows_imported", rows_imported)
+    pipe.hincrby(METRICS_KEY, "rows_failed", rows_failed)
+    pipe.hincrbyfloat(METRICS_KEY, "seconds", seconds)
+    try:
+        pipe.execute()
+    except RedisError as e:
+        logger.warning("Could not record import metrics: %s", e)
+
+
+def stats() -> dict:
+    """
+    Queue depth and finished-job totals, in three Redis round trips.
+    """
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.llen(QUEUE_KEY)
+    pipe.llen(PROCESSING_KEY)
+    pipe.hgetall(METRICS_KEY)
+    pending, processing, totals = pipe.execute()
+
+    return {
+        "pending": pending,
+        "processing": processing,
+        "jobs": {
+            field.removeprefix("jobs:"): int(value)
+            for field, value in totals.items()
+            if field.startswith("jobs:")
+        },
+        "rows_imported": int(totals.get("rows_imported", 0)),
+        "rows_failed": int(totals.get("rows_failed", 0)),
+        "seconds": float(totals.get("seconds", 0)),
+    }
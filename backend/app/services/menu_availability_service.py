@@ -0,0 +1,179 @@
+"""
+Precomputed "available now" index for the public menu.
+
+Each restaurant's items are compiled once per menu version into
+intervals of seconds-of-day; overnight windows (22:00 - 02:00) are split
+at midnight. The day is then cut at every interval boundary into
+elementary segments, each holding the ids of the items available
+throughout it, so a lookup is a bisect over the boundaries.
+
+Times are evaluated in the restaurant's own timezone, at whole-second
+resolution (both ends of a window are inclusive, as in
+currently_available_clause, which drops sub-second precision too).
+"""
+import logging
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import datetime, time
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def second_of_day(at: time) -> int:
+    return at.hour * 3600 + at.minute * 60 + at.second
+
+
+def restaurant_local_time(timezone: str | None) -> time:
+    """
+    Wall-clock time in the restaurant's timezone (server time if unset).
+    """
+    if timezone:
+        try:
+            return datetime.now(ZoneInfo(timezone)).time()
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.warning("Unknown restaurant timezone %r", timezone)
+    return datetime.now().time()
+
+
+# ------------------------------------------------
+# COMPILE
+# ------------------------------------------------
+def item_intervals(item: dict) -> list[tuple[int, int]]:
+    """
+    Half-open [start, end) second intervals in which the item is available.
+    """
+    if not item["is_available"]:
+        return []
+
+    start, end = item["available_from"], item["available_to"]
+
+    # All-day items (no time restrictions)
+    if start is None and end is None:
+        return [(0, SECONDS_PER_DAY)]
+    if start is None or end is None:
+        return []
+
+    start = second_of_day(time.fromisoformat(start))
+    end = second_of_day(time.fromisoformat(end)) + 1
+
+    # Normal window (e.g., 10:00 - 14:00)
+    if start < end:
+        return [(start, end)]
+
+    # Overnight window (e.g., 22:00 - 02:00), split at midnight
+    return [(start, SECONDS_PER_DAY), (0, end)]
+
+
+class AvailabilityIndex:
+
+    def __init__(self, items: list[dict], timezone: str | None = None):
+        self.timezone = timezone
+
+        intervals = [
+            (start, end, item["id"])
+            for item in items
+            for start, end in item_intervals(item)
+        ]
+
+        boundaries = sorted(
+            {0, SECONDS_PER_DAY}
+            | {start for start, _, _ in intervals}
+            | {end for _, end, _ in intervals}
+        )
+
+        # segments[i] covers [boundaries[i], boundaries[i + 1])
+        self._boundaries = boundaries
+        self._segments = [
+            frozenset(
+                item_id
+                for start, end, item_id in intervals
+                if start <= lo and hi <= end
+            )
+            for lo, hi in zip(boundaries, boundaries[1:])
+        ]
+
+    def segment_at(self, at: time) -> int:
+        """
+        Position of the segment containing `at`; the available set only
+        changes when this does.
+        """
+        i = bisect_right(self._boundaries, second_of_day(at)) - 1
+        return min(i, len(self._segments) - 1)
+
+    def available_ids(self, at: time) -> frozenset[int]:
+        return self._segments[self.segment_at(at)]
+
+
+# ------------------------------------------------
+# PER-VERSION CACHE
+# ------------------------------------------------
+class AvailabilityIndexCache:
+    """
+    LRU of restaurant_id -> (menu version, index); an entry is replaced
+    when the version moves.
+    """
+
+    def __init__(self, maxsize: int = settings.MENU_AVAILABILITY_INDEX_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._indexes: OrderedDict[int, tuple[int, AvailabilityIndex]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, restaurant_id: int, version: int) -> AvailabilityIndex | None:
+        with self._lock:
+            cached = self._indexes.get(restaurant_id)
+            if cached is None or cached[0] != version:
+                return None
+            self._indexes.move_to_end(restaurant_id)
+            return cached[1]
+
+    def put(self, restaurant_id: int, version: int, index: AvailabilityIndex) -> None:
+        with self._lock:
+            self._indexes[restaurant_id] = (version, index)
+            self._indexes.move_to_end(restaurant_id)
+            while len(self._indexes) > self.maxsize:
+                self._indexes.popitem(last=False)
+
+
+_indexes = AvailabilityIndexCache()
+
+
+def cached_index(restaurant_id: int, version: int) -> AvailabilityIndex | None:
+    """
+    Index compiled for exactly this menu version, if this worker has one.
+    """
+    return _indexes.get(restaurant_id, version)
+
+
+def get_index(snapshot: dict) -> AvailabilityIndex:
+    restaurant_id = snapshot.get("restaurant_id")
+    version = snapshot.get("version")
+
+    if restaurant_id is None or version is None:
+        return AvailabilityIndex(snapshot["items"], snapshot.get("timezone"))
+
+    index = cached_index(restaurant_id, version)
+    if index is not None:
+        return index
+
+    index = AvailabilityIndex(snapshot["items"], snapshot.get("timezone"))
+    _indexes.put(restaurant_id, version, index)
+    return index
+
+
+def available_items(snapshot: dict, at: time | None = None) -> list[dict]:
+    """
+    Items of the snapshot available at the given restaurant-local time
+    (now, in the restaurant's timezone, if omitted).
+    """
+    if at is None:
+        at = restaurant_local_time(snapshot.get("timezone"))
+
+    ids = get_index(snapshot).available_ids(at)
+    return [item for item in snapshot["items"] if item["id"] in ids]
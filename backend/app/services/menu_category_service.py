@@ -1,11 +1,20 @@
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
 from app.models.menu_category import MenuCategory
 from app.models.user import User
 from app.core.dependencies import check_restaurant_access
+from app.services.menu_version_service import (
+    bump_all_menu_versions,
+    bump_menu_version,
+)
 from app.schemas.menu_category_schema import (
     MenuCategoryCreate,
+    MenuCategoryRead,
     MenuCategoryUpdate,
 )
 
@@ -36,7 +45,7 @@ class MenuCategoryService:
                 )
             restaurant_id = None
         else:
-            check_restaurant_access(restaurant_id, user, db)
+            check_restaurant_access(restaurant_id, user)
 
         category = MenuCategory(
             restaurant_id=restaurant_id,
@@ -49,8 +58,8 @@ class MenuCategoryService:
 
         db.add(category)
         db.commit()
-        db.refresh(category)
 
+        self._bump_menu_version(db, category)
         return category
     # =========================================================
     # LIST
@@ -71,6 +80,35 @@ class MenuCategoryService:
             .all()
         )
 
+    async def list_rows_async(
+        self,
+        db: AsyncSession,
+        restaurant_id: int,
+    ) -> List[dict]:  # `list` here is the method above
+        """
+        Same rows as list() as plain dicts (MenuCategoryRead fields),
+        for responses that skip per-object validation.
+        """
+        result = await db.execute(
+            select(*(getattr(MenuCategory, f) for f in MenuCategoryRead.model_fields))
+            .where(
+                MenuCategory.is_active.is_(True),
+                (MenuCategory.restaurant_id == restaurant_id)
+                | (MenuCategory.is_global.is_(True)),
+            )
+            .order_by(MenuCategory.display_order)
+        )
+        return [dict(row._mapping) for row in result]
+
+    # =========================================================
+    # MENU VERSION (PUBLIC MENU SNAPSHOT)
+    # =========================================================
+    def _bump_menu_version(self, db: Session, category: MenuCategory) -> None:
+        if category.is_global:
+            bump_all_menu_versions(db)
+        else:
+            bump_menu_version(category.restaurant_id)
+
     # =========================================================
     # INTERNAL FETCH (USED BY UPDATE / DELETE)
     # =========================================================
@@ -96,7 +134,7 @@ class MenuCategoryService:
             )
 
         if not category.is_global:
-            check_restaurant_access(category.restaurant_id, user, db)
+            check_restaurant_access(category.restaurant_id, user)
 
         return category
 
@@ -122,7 +160,7 @@ class MenuCategoryService:
             setattr(category, field, value)
 
         db.commit()
-        db.refresh(category)
+        self._bump_menu_version(db, category)
         return category
 
     # =========================================================
@@ -144,3 +182,4 @@ class MenuCategoryService:
 
         category.is_active = False
         db.commit()
+        self._bump_menu_version(db, category)
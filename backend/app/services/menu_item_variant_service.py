@@ -1,7 +1,13 @@
+from typing import Iterable
+
+from sqlalchemy import Integer, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from app.models.menu_item_variant import MenuItemVariant
+from app.services.menu_version_service import bump_menu_version_for_item
 from app.schemas.menu_item_variant_schema import (
     MenuItemVariantCreate,
     MenuItemVariantUpdate,
@@ -20,6 +26,52 @@ def list_variants(db: Session, item_id: int) -> list[MenuItemVariant]:
     )
 
 
+def _item_id_in(db: Session, item_ids: list[int]):
+    # One array parameter on PostgreSQL instead of a bind per id
+    if db.get_bind().dialect.name == "postgresql":
+        return MenuItemVariant.item_id == any_(
+            bindparam("item_ids", item_ids, type_=ARRAY(Integer))
+        )
+    return MenuItemVariant.item_id.in_(item_ids)
+
+
+def list_variants_for_items(
+    db: Session,
+    item_ids: Iterable[int],
+) -> dict[int, list[MenuItemVariant]]:
+    """
+    Variants of many items in one query (WHERE item_id = ANY(...)),
+    grouped by item id; every requested id gets a list, possibly empty.
+    """
+    item_ids = list(item_ids)
+    grouped: dict[int, list[MenuItemVariant]] = {item_id: [] for item_id in item_ids}
+    if not item_ids:
+        return grouped
+
+    variants = (
+        db.query(MenuItemVariant)
+        .filter(_item_id_in(db, item_ids))
+        .order_by(MenuItemVariant.price_adjustment.asc(), MenuItemVariant.id.asc())
+        .all()
+    )
+    for variant in variants:
+        grouped[variant.item_id].append(variant)
+
+    return grouped
+
+
+async def list_variants_async(
+    db: AsyncSession,
+    item_id: int,
+) -> list[MenuItemVariant]:
+    result = await db.execute(
+        select(MenuItemVariant)
+        .where(MenuItemVariant.item_id == item_id)
+        .order_by(MenuItemVariant.price_adjustment.asc())
+    )
+    return list(result.scalars().all())
+
+
 # ------------------------------------------------
 # CREATE
 # ------------------------------------------------
@@ -60,7 +112,7 @@ def create_variant(
 
     db.add(variant)
     db.commit()
-    db.refresh(variant)
+    bump_menu_version_for_item(db, item_id)
     return variant
 
 
@@ -102,7 +154,7 @@ def update_variant(
         setattr(variant, field, value)
 
     db.commit()
-    db.refresh(variant)
+    bump_menu_version_for_item(db, variant.item_id)
     return variant
 
 
@@ -110,5 +162,7 @@ def update_variant(
 # DELETE
 # ------------------------------------------------
 def delete_variant(db: Session, variant: MenuItemVariant) -> None:
+    item_id = variant.item_id
     db.delete(variant)
     db.commit()
+    bump_menu_version_for_item(db, item_id)
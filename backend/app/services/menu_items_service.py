@@ -1,17 +1,69 @@
 from sqlalchemy.orm import Session
-from fastapi import UploadFile, BackgroundTasks
-from decimal import Decimal
-import csv
-import io
-import json
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, time
-from sqlalchemy import or_, and_
+from fastapi import HTTPException, status
+from sqlalchemy import (
+    Boolean,
+    Integer,
+    Numeric,
+    Time,
+    and_,
+    case,
+    cast,
+    column,
+    func,
+    or_,
+    select,
+    update,
+    values,
+)
+from app.models.menu_category import MenuCategory
 from app.models.menu_items import MenuItem
-from app.schemas.menu_items_schema import MenuItemCreate, MenuItemUpdate
-from app.services.bulk_import_items_service import process_rows
-from app.core.database import SessionLocal
+from app.schemas.menu_items_schema import MenuItemBatchUpdate, MenuItemCreate, MenuItemUpdate
+from app.services.menu_version_service import bump_menu_version
 
 
+# ------------------------------------------------
+# AVAILABILITY PREDICATE
+# ------------------------------------------------
+def currently_available_clause(now: time):
+    """
+    SQL filter for items that are available and inside their time window.
+
+    `now` is compared in whole seconds, like the compiled index in
+    menu_availability_service, so both paths agree at window edges.
+    """
+    now = now.replace(microsecond=0)
+    return and_(
+        MenuItem.is_available.is_(True),
+        # AND must satisfy time window conditions
+        or_(
+            # All-day items (no time restrictions)
+            and_(
+                MenuItem.available_from.is_(None),
+                MenuItem.available_to.is_(None),
+            ),
+            # Normal time-windowed items (e.g., 10:00 - 14:00)
+            and_(
+                MenuItem.available_from.isnot(None),
+                MenuItem.available_to.isnot(None),
+                MenuItem.available_from <= MenuItem.available_to,
+                MenuItem.available_from <= now,
+                MenuItem.available_to >= now,
+            ),
+            # Overnight time-windowed items (e.g., 22:00 - 02:00)
+            and_(
+                MenuItem.available_from.isnot(None),
+                MenuItem.available_to.isnot(None),
+                MenuItem.available_from > MenuItem.available_to,
+                or_(
+                    MenuItem.available_from <= now,  # After start time (e.g., 23:00 >= 22:00)
+                    MenuItem.available_to >= now,    # Before end time (e.g., 01:00 <= 02:00)
+                ),
+            ),
+        ),
+    )
+
 
 # ------------------------------------------------
 # CREATE
@@ -20,7 +72,7 @@ def create_menu_item(db: Session, data: MenuItemCreate) -> MenuItem:
     item = MenuItem(**data.model_dump())
     db.add(item)
     db.commit()
-    db.refresh(item)
+    bump_menu_version(item.restaurant_id)
     return item
 
 
@@ -50,6 +102,7 @@ def list_menu_items(
     restaurant_id: int,
     category_id: int | None = None,
     only_currently_available: bool = True,
+    at: time | None = None,
 ):
     query = db.query(MenuItem).filter(
         MenuItem.restaurant_id == restaurant_id
@@ -59,41 +112,44 @@ def list_menu_items(
         query = query.filter(MenuItem.category_id == category_id)
 
     if only_currently_available:
-        now = datetime.now().time()
+        query = query.filter(currently_available_clause(at or datetime.now().time()))
 
-        query = query.filter(
-            and_(
-                MenuItem.is_available.is_(True),
-                # AND must satisfy time window conditions
-                or_(
-                    # All-day items (no time restrictions)
-                    and_(
-                        MenuItem.available_from.is_(None),
-                        MenuItem.available_to.is_(None),
-                    ),
-                    # Normal time-windowed items (e.g., 10:00 - 14:00)
-                    and_(
-                        MenuItem.available_from.isnot(None),
-                        MenuItem.available_to.isnot(None),
-                        MenuItem.available_from <= MenuItem.available_to,
-                        MenuItem.available_from <= now,
-                        MenuItem.available_to >= now,
-                    ),
-                    # Overnight time-windowed items (e.g., 22:00 - 02:00)
-                    and_(
-                        MenuItem.available_from.isnot(None),
-                        MenuItem.available_to.isnot(None),
-                        MenuItem.available_from > MenuItem.available_to,
-                        or_(
-                            MenuItem.available_from <= now,  # After start time (e.g., 23:00 >= 22:00)
-                            MenuItem.available_to >= now,    # Before end time (e.g., 01:00 <= 02:00)
-                        ),
-                    ),
-                ),
-            ),
+    return query.order_by(MenuItem.name.asc()).all()
+
+
+# ------------------------------------------------
+# ASYNC READS (PUBLIC)
+# ------------------------------------------------
+async def get_menu_item_async(
+    db: AsyncSession,
+    item_id: int,
+    restaurant_id: int,
+) -> MenuItem | None:
+    result = await db.execute(
+        select(MenuItem).where(
+            MenuItem.id == item_id,
+            MenuItem.restaurant_id == restaurant_id,
         )
+    )
+    return result.scalars().first()
 
-    return query.order_by(MenuItem.name.asc()).all()
+
+async def list_menu_items_async(
+    db: AsyncSession,
+    restaurant_id: int,
+    category_id: int | None = None,
+    only_currently_available: bool = True,
+) -> list[MenuItem]:
+    stmt = select(MenuItem).where(MenuItem.restaurant_id == restaurant_id)
+
+    if category_id:
+        stmt = stmt.where(MenuItem.category_id == category_id)
+
+    if only_currently_available:
+        stmt = stmt.where(currently_available_clause(datetime.now().time()))
+
+    result = await db.execute(stmt.order_by(MenuItem.name.asc()))
+    return list(result.scalars().all())
 
 
 
@@ -105,10 +161,11 @@ def update_menu_item(
     item: MenuItem,
     data: MenuItemUpdate,
 ) -> MenuItem:
+    previous_restaurant_id = item.restaurant_id
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(item, field, value)
     db.commit()
-    db.refresh(item)
+    bump_menu_version(previous_restaurant_id, item.restaurant_id)
     return item
 
 
@@ -116,8 +173,10 @@ def update_menu_item(
 # DELETE
 # ------------------------------------------------
 def delete_menu_item(db: Session, item: MenuItem) -> None:
+    restaurant_id = item.restaurant_id
     db.delete(item)
     db.commit()
+    bump_menu_version(restaurant_id)
 
 
 # ------------------------------------------------
@@ -130,7 +189,7 @@ def update_menu_item_availability(
 ) -> MenuItem:
     item.is_available = is_available
     db.commit()
-    db.refresh(item)
+    bump_menu_version(item.restaurant_id)
     return item
 
 
@@ -146,45 +205,145 @@ def update_menu_item_timing(
     item.available_from = available_from
     item.available_to = available_to
     db.commit()
-    db.refresh(item)
+    bump_menu_version(item.restaurant_id)
     return item
 
 
 # ------------------------------------------------
-# IMPORT (BACKGROUND TASKS)
+# BATCH UPDATE
 # ------------------------------------------------
-def start_import(
-    job_id: int,
+def _check_batch_categories(
+    db: Session,
     restaurant_id: int,
-    file: UploadFile,
-    background_tasks: BackgroundTasks,
-):
-    filename = file.filename.lower()
+    updates: list[MenuItemBatchUpdate],
+) -> None:
+    requested = {u.category_id for u in updates if u.category_id is not None}
+    if not requested:
+        return
+
+    allowed = {
+        r[0]
+        for r in db.query(MenuCategory.id).filter(
+            MenuCategory.id.in_(requested),
+            (MenuCategory.restaurant_id == restaurant_id)
+            | (MenuCategory.is_global.is_(True)),
+        )
+    }
+    unknown = sorted(requested - allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Categories not found: {unknown}",
+        )
+
+
+def batch_update_statement(restaurant_id: int, updates: list[MenuItemBatchUpdate]):
+    """
+    UPDATE menu_items ... FROM (VALUES ...) applying every row in one
+    statement. A null value keeps the current column, except the timing
+    pair, which is taken as-is where the row's set_timing flag is true.
+    """
+    rows = values(
+        column("id", Integer),
+        column("is_available", Boolean),
+        column("price", Numeric(10, 2)),
+        column("category_id", Integer),
+        column("set_timing", Boolean),
+        column("available_from", Time),
+        column("available_to", Time),
+        name="batch",
+    ).data([
+        (
+            u.id,
+            u.is_available,
+            u.price,
+            u.category_id,
+            u.sets_timing,
+            u.available_from,
+            u.available_to,
+        )
+        for u in updates
+    ])
+
+    # All-null VALUES columns come back untyped; cast before mixing with the table's
+    def keep_unless_null(name, type_):
+        return func.coalesce(cast(rows.c[name], type_), getattr(MenuItem, name))
+
+    def timing(name):
+        return case(
+            (rows.c.set_timing, cast(rows.c[name], Time)),
+            else_=getattr(MenuItem, name),
+        )
+
+    return (
+        update(MenuItem)
+        .where(
+            MenuItem.id == rows.c.id,
+            MenuItem.restaurant_id == restaurant_id,
+        )
+        .values(
+            is_available=keep_unless_null("is_available", Boolean),
+            price=keep_unless_null("price", Numeric(10, 2)),
+            category_id=keep_unless_null("category_id", Integer),
+            available_from=timing("available_from"),
+            available_to=timing("available_to"),
+        )
+        .returning(MenuItem.id)
+        .execution_options(synchronize_session=False)
+    )
+
 
-    if filename.endswith(".csv"):
-        content = file.file.read().decode("utf-8")
-        background_tasks.add_task(_run_import_job, job_id, restaurant_id, "csv", content)
-    elif filename.endswith(".json"):
-        items = json.loads(file.file.read().decode("utf-8"))
-        if not isinstance(items, list):
-            raise ValueError("JSON must be an array")
-        background_tasks.add_task(_run_import_job, job_id, restaurant_id, "json", items)
-    else:
-        raise ValueError("Only CSV or JSON supported")
+def _update_rows(db: Session, restaurant_id: int, updates: list[MenuItemBatchUpdate]) -> list[int]:
+    # Dialects without UPDATE ... FROM (VALUES) column aliases (SQLite in tests)
+    updated = []
+    for u in updates:
+        fields = u.model_dump(exclude={"id"}, exclude_unset=True)
+        fields = {
+            k: v for k, v in fields.items()
+            if v is not None or k in ("available_from", "available_to")
+        }
+        result = db.execute(
+            update(MenuItem)
+            .where(MenuItem.id == u.id, MenuItem.restaurant_id == restaurant_id)
+            .values(**fields)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            updated.append(u.id)
+    return updated
 
 
-def _run_import_job(job_id: int, restaurant_id: int, file_type: str, payload):
+def batch_update_menu_items(
+    db: Session,
+    restaurant_id: int,
+    updates: list[MenuItemBatchUpdate],
+) -> list[int]:
     """
-    Runs the import in a background task with a new DB session.
+    Apply partial updates to many items of one restaurant in a single
+    transaction and bump the menu version once.
+
+    All or nothing: if any id is not an item of this restaurant nothing
+    is changed and a 404 lists the missing ids. Returns the updated ids
+    in request order.
     """
-    db = SessionLocal()
+    _check_batch_categories(db, restaurant_id, updates)
+
     try:
-        if file_type == "json":
-            process_rows(db, job_id, restaurant_id, payload)
-        else:  # CSV
-            rows = list(csv.DictReader(io.StringIO(payload)))
-            process_rows(db, job_id, restaurant_id, rows)
-    finally:
-        db.close()
+        if db.get_bind().dialect.name == "postgresql":
+            updated = set(db.execute(batch_update_statement(restaurant_id, updates)).scalars())
+        else:
+            updated = set(_update_rows(db, restaurant_id, updates))
 
+        missing = [u.id for u in updates if u.id not in updated]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Menu items not found: {missing}",
+            )
+    except Exception:
+        db.rollback()
+        raise
 
+    db.commit()
+    bump_menu_version(restaurant_id)
+    return [u.id for u in updates]
@@ -0,0 +1,134 @@
+"""
+Fuzzy menu item search ranked by trigram similarity.
+
+On PostgreSQL the pg_trgm GIN indexes on menu_items.name / description
+serve both the similarity operator (%) and substring ILIKE, and the
+score is computed by similarity(). Other dialects (SQLite test runs)
+fall back to TrigramIndex, an in-process twin of the same scoring, so
+the ranking can be tested offline.
+"""
+import re
+from datetime import time
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from app.models.menu_items import MenuItem
+from app.models.restaurant import Restaurant
+from app.services.menu_availability_service import restaurant_local_time
+from app.services.menu_items_service import currently_available_clause
+
+
+# pg_trgm's default pg_trgm.similarity_threshold
+SIMILARITY_THRESHOLD = 0.3
+
+_WORD = re.compile(r"[0-9a-z]+")
+
+
+# ------------------------------------------------
+# TRIGRAMS (mirrors pg_trgm)
+# ------------------------------------------------
+def trigrams(text: str | None) -> set[str]:
+    """
+    Each word is padded with two spaces in front and one behind,
+    as show_trgm() does.
+    """
+    grams = set()
+    for word in _WORD.findall((text or "").lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: set[str], b: set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class TrigramIndex:
+    """
+    In-process fallback for the pg_trgm indexes.
+    """
+
+    def __init__(self, items: list[MenuItem]):
+        self._entries = [
+            (item, trigrams(item.name), trigrams(item.description))
+            for item in items
+        ]
+
+    def search(self, q: str, limit: int) -> list[tuple[MenuItem, float]]:
+        q_grams = trigrams(q)
+        needle = q.lower()
+
+        results = []
+        for item, name_grams, description_grams in self._entries:
+            score = max(
+                similarity(name_grams, q_grams),
+                similarity(description_grams, q_grams),
+            )
+            substring = (
+                needle in item.name.lower()
+                or needle in (item.description or "").lower()
+            )
+            if score >= SIMILARITY_THRESHOLD or substring:
+                results.append((item, score))
+
+        results.sort(key=lambda r: (-r[1], r[0].name))
+        return results[:limit]
+
+
+# ------------------------------------------------
+# SEARCH
+# ------------------------------------------------
+def search_menu_items(
+    db: Session,
+    restaurant_id: int,
+    q: str,
+    limit: int = 20,
+    available_only: bool = True,
+    at: time | None = None,
+) -> list[tuple[MenuItem, float]]:
+    """
+    Items of a restaurant matching q, best match first, with their score.
+
+    available_only applies the same rule as the public menu list: the
+    item is available and inside its time window at the restaurant-local
+    time `at` (now if omitted).
+    """
+    query = db.query(MenuItem).filter(MenuItem.restaurant_id == restaurant_id)
+
+    if available_only:
+        if at is None:
+            at = restaurant_local_time(
+                db.query(Restaurant.timezone)
+                .filter(Restaurant.id == restaurant_id)
+                .scalar()
+            )
+        query = query.filter(currently_available_clause(at))
+
+    if db.get_bind().dialect.name != "postgresql":
+        return TrigramIndex(query.all()).search(q, limit)
+
+    score = func.greatest(
+        func.similarity(MenuItem.name, q),
+        func.similarity(func.coalesce(MenuItem.description, ""), q),
+    )
+
+    rows = (
+        query
+        .add_columns(score.label("score"))
+        .filter(
+            or_(
+                MenuItem.name.op("%")(q),
+                MenuItem.description.op("%")(q),
+                MenuItem.name.icontains(q, autoescape=True),
+                MenuItem.description.icontains(q, autoescape=True),
+            )
+        )
+        .order_by(score.desc(), MenuItem.name.asc())
+        .limit(limit)
+        .all()
+    )
+
+    return [(item, float(item_score)) for item, item_score in rows]
@@ -0,0 +1,301 @@
+import json
+import logging
+from datetime import time
+
+from redis.exceptions import RedisError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.http_cache import make_etag
+from app.core.redis import redis_client
+from app.models.menu_items import MenuItem
+from app.models.restaurant import Restaurant
+from app.schemas.menu_category_schema import MenuCategoryRead
+from app.schemas.menu_item_variant_schema import MenuItemVariantRead
+from app.schemas.menu_items_schema import MenuItemRead
+from app.services import (
+    menu_availability_service,
+    menu_item_variant_service,
+    menu_items_service,
+)
+from app.services.menu_category_service import MenuCategoryService
+from app.services.menu_version_service import (
+    get_menu_version,
+    snapshot_key,
+    version_key,
+)
+
+logger = logging.getLogger(__name__)
+
+menu_category_service = MenuCategoryService()
+
+# Store the snapshot only if no write bumped the version while it was
+# being compiled; otherwise a slow builder could cache a stale menu.
+_STORE_IF_CURRENT = redis_client.register_script(
+    """
+    local current = redis.call('GET', KEYS[1]) or '0'
+    if current == ARGV[1] then
+        redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3])
+        return 1
+    end
+    return 0
+    """
+)
+
+
+# ------------------------------------------------
+# BUILD
+# ------------------------------------------------
+def variant_dumps(db: Session, item_ids: list[int]) -> dict[str, list[dict]]:
+    """
+    item id (as a JSON key) -> MenuItemVariantRead dumps, in one query.
+    """
+    grouped = menu_item_variant_service.list_variants_for_items(db, item_ids)
+    return {
+        str(item_id): [
+            MenuItemVariantRead.model_validate(v).model_dump(mode="json")
+            for v in variants
+        ]
+        for item_id, variants in grouped.items()
+    }
+
+
+def build_snapshot(db: Session, restaurant_id: int, version: int) -> dict:
+    """
+    Compile the full public menu of a restaurant into plain JSON data.
+    """
+    categories = menu_category_service.list(db=db, restaurant_id=restaurant_id)
+
+    items = (
+        db.query(MenuItem)
+        .filter(MenuItem.restaurant_id == restaurant_id)
+        .order_by(MenuItem.name.asc())
+        .all()
+    )
+
+    variants = variant_dumps(db, [item.id for item in items])
+
+    timezone = (
+        db.query(Restaurant.timezone)
+        .filter(Restaurant.id == restaurant_id)
+        .scalar()
+    )
+
+    return {
+        "restaurant_id": restaurant_id,
+        "version": version,
+        "timezone": timezone,
+        "categories": [
+            MenuCategoryRead.model_validate(c).model_dump(mode="json")
+            for c in categories
+        ],
+        "items": [
+            MenuItemRead.model_validate(i).model_dump(mode="json")
+            for i in items
+        ],
+        "variants": variants,
+    }
+
+
+# ------------------------------------------------
+# GET (single Redis GET on hit)
+# ------------------------------------------------
+def get_snapshot(db: Session, restaurant_id: int) -> dict:
+    """
+    Return the compiled menu, building and caching it on a miss.
+    Raises RedisError if Redis is unreachable.
+    """
+    cached = redis_client.get(snapshot_key(restaurant_id))
+    if cached:
+        return json.loads(cached)
+
+    version = get_menu_version(restaurant_id)
+    snapshot = build_snapshot(db, restaurant_id, version)
+
+    _STORE_IF_CURRENT(
+        keys=[version_key(restaurant_id), snapshot_key(restaurant_id)],
+        args=[
+            version,
+            json.dumps(snapshot, separators=(",", ":")),
+            settings.MENU_SNAPSHOT_TTL_SECONDS,
+        ],
+    )
+
+    return snapshot
+
+
+# ------------------------------------------------
+# FILTER
+# ------------------------------------------------
+def is_available_at(item: dict, at: time) -> bool:
+    """
+    Python twin of the time-window predicate in list_menu_items
+    (the compiled equivalent is menu_availability_service).
+    """
+    if not item["is_available"]:
+        return False
+
+    start, end = item["available_from"], item["available_to"]
+
+    # All-day items (no time restrictions)
+    if start is None and end is None:
+        return True
+    if start is None or end is None:
+        return False
+
+    start, end = time.fromisoformat(start), time.fromisoformat(end)
+    at = at.replace(microsecond=0)
+
+    # Normal window (e.g., 10:00 - 14:00)
+    if start <= end:
+        return start <= at <= end
+
+    # Overnight window (e.g., 22:00 - 02:00)
+    return at >= start or at <= end
+
+
+def filter_items(
+    snapshot: dict,
+    category_id: int | None = None,
+    only_currently_available: bool = True,
+    at: time | None = None,
+) -> list[dict]:
+    if only_currently_available:
+        items = menu_availability_service.available_items(snapshot, at)
+    else:
+        items = snapshot["items"]
+
+    if category_id:
+        items = [i for i in items if i["category_id"] == category_id]
+
+    return items
+
+
+def with_variants(items: list[dict], variants: dict[str, list[dict]]) -> list[dict]:
+    return [{**item, "variants": variants.get(str(item["id"]), [])} for item in items]
+
+
+# ------------------------------------------------
+# CONDITIONAL GET
+# ------------------------------------------------
+def current_menu_version(restaurant_id: int) -> int | None:
+    try:
+        return get_menu_version(restaurant_id)
+    except RedisError as e:
+        logger.debug("Menu version unavailable for %s: %s", restaurant_id, e)
+        return None
+
+
+def menu_list_etag(
+    restaurant_id: int,
+    version: int | None,
+    category_id: int | None = None,
+    only_currently_available: bool = True,
+    at: time | None = None,
+    include_variants: bool = False,
+) -> str | None:
+    """
+    ETag of the public menu list at this version, or None if it cannot
+    be derived without loading the menu.
+
+    "Available now" lists also change over the day, so their tag includes
+    the availability segment of the current restaurant-local time; that
+    needs this worker's compiled index for exactly this version.
+    """
+    if version is None:
+        return None
+
+    window = None
+    if only_currently_available and at is not None:
+        window = f"at:{menu_availability_service.second_of_day(at)}"
+    elif only_currently_available:
+        index = menu_availability_service.cached_index(restaurant_id, version)
+        if index is None:
+            return None
+        now = menu_availability_service.restaurant_local_time(index.timezone)
+        window = f"segment:{index.segment_at(now)}"
+
+    return make_etag(
+        "menu-items",
+        restaurant_id,
+        version,
+        category_id,
+        only_currently_available,
+        window,
+        "variants" if include_variants else None,
+    )
+
+
+# ------------------------------------------------
+# PUBLIC MENU LIST
+# ------------------------------------------------
+def list_menu_items(
+    db: Session,
+    restaurant_id: int,
+    category_id: int | None = None,
+    only_currently_available: bool = True,
+    at: time | None = None,
+    include_variants: bool = False,
+):
+    """
+    Serve the public menu from the compiled snapshot, falling back to
+    Postgres when Redis is unavailable. Availability is evaluated at the
+    restaurant-local time `at` (now if omitted).
+
+    With include_variants every item carries its variants; they come from
+    the snapshot, or from one batched query on the fallback path, so the
+    number of queries does not grow with the menu.
+    """
+    items, _ = list_menu_items_with_version(
+        db,
+        restaurant_id,
+        category_id,
+        only_currently_available,
+        at,
+        include_variants,
+    )
+    return items
+
+
+def list_menu_items_with_version(
+    db: Session,
+    restaurant_id: int,
+    category_id: int | None = None,
+    only_currently_available: bool = True,
+    at: time | None = None,
+    include_variants: bool = False,
+) -> tuple[list, int | None]:
+    """
+    list_menu_items() together with the menu version stored in the
+    snapshot it was served from (None on the Postgres fallback), so an
+    ETag built from it always describes this content.
+    """
+    try:
+        snapshot = get_snapshot(db, restaurant_id)
+    except RedisError as e:
+        logger.warning("Menu snapshot unavailable for %s: %s", restaurant_id, e)
+
+        if only_currently_available and at is None:
+            at = menu_availability_service.restaurant_local_time(
+                db.query(Restaurant.timezone)
+                .filter(Restaurant.id == restaurant_id)
+                .scalar()
+            )
+
+        rows = menu_items_service.list_menu_items(
+            db=db,
+            restaurant_id=restaurant_id,
+            category_id=category_id,
+            only_currently_available=only_currently_available,
+            at=at,
+        )
+        if not include_variants:
+            return rows, None
+
+        items = [MenuItemRead.model_validate(r).model_dump(mode="json") for r in rows]
+        return with_variants(items, variant_dumps(db, [r.id for r in rows])), None
+
+    items = filter_items(snapshot, category_id, only_currently_available, at)
+    if include_variants:
+        items = with_variants(items, snapshot["variants"])
+    return items, snapshot.get("version")
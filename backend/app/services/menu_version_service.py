@@ -0,0 +1,140 @@
+import logging
+import threading
+
+from redis.exceptions import RedisError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import MENU_VERSION_BUMP_FAILURES, MENU_VERSION_BUMPS_PENDING
+from app.core.redis import async_redis_client, redis_client
+from app.models.menu_items import MenuItem
+from app.models.restaurant import Restaurant
+
+logger = logging.getLogger(__name__)
+
+
+MENU_VERSION_KEY = "menu:version:{restaurant_id}"
+MENU_SNAPSHOT_KEY = "menu:snapshot:{restaurant_id}"
+
+
+def version_key(restaurant_id: int) -> str:
+    return MENU_VERSION_KEY.format(restaurant_id=restaurant_id)
+
+
+def snapshot_key(restaurant_id: int) -> str:
+    return MENU_SNAPSHOT_KEY.format(restaurant_id=restaurant_id)
+
+
+# ------------------------------------------------
+# READ VERSION
+# ------------------------------------------------
+def get_menu_version(restaurant_id: int) -> int:
+    """
+    Current menu version of a restaurant (0 until the first write).
+    Raises RedisError if Redis is unreachable.
+    """
+    version = redis_client.get(version_key(restaurant_id))
+    return int(version) if version else 0
+
+
+async def get_menu_version_async(restaurant_id: int) -> int:
+    version = await async_redis_client.get(version_key(restaurant_id))
+    return int(version) if version else 0
+
+
+# ------------------------------------------------
+# BUMP VERSION
+# ------------------------------------------------
+# Restaurants whose bump failed, retried by a timer and by the next bump
+_pending: set[int] = set()
+_pending_lock = threading.Lock()
+_retry_timer: threading.Timer | None = None
+
+
+def _send_bumps(ids: set[int]) -> None:
+    # MULTI/EXEC: no reader may see the new version with the old snapshot
+    pipe = redis_client.pipeline(transaction=True)
+    for rid in ids:
+        pipe.incr(version_key(rid))
+        pipe.delete(snapshot_key(rid))
+    pipe.execute()
+
+
+def _defer(ids: set[int]) -> None:
+    global _retry_timer
+    with _pending_lock:
+        _pending.update(ids)
+        MENU_VERSION_BUMPS_PENDING.set(len(_pending))
+        if _retry_timer is None:
+            _retry_timer = threading.Timer(
+                settings.MENU_VERSION_BUMP_RETRY_SECONDS,
+                retry_pending_bumps,
+            )
+            _retry_timer.daemon = True
+            _retry_timer.start()
+
+
+def _take_pending() -> set[int]:
+    with _pending_lock:
+        ids = set(_pending)
+        _pending.clear()
+        MENU_VERSION_BUMPS_PENDING.set(0)
+    return ids
+
+
+def bump_menu_version(*restaurant_ids: int | None) -> None:
+    """
+    Invalidate the compiled menu of the given restaurants.
+
+    Called by every menu write path after commit. A Redis outage must not
+    fail the write, so a failed bump is counted, logged and kept for
+    retry (every MENU_VERSION_BUMP_RETRY_SECONDS, and with the next bump)
+    instead of leaving the snapshot stale until its TTL.
+    """
+    ids = {rid for rid in restaurant_ids if rid is not None}
+    if not ids:
+        return
+
+    ids |= _take_pending()
+    try:
+        _send_bumps(ids)
+    except RedisError as e:
+        MENU_VERSION_BUMP_FAILURES.inc()
+        logger.warning("Menu version bump failed for %s, will retry: %s", sorted(ids), e)
+        _defer(ids)
+
+
+def retry_pending_bumps() -> None:
+    global _retry_timer
+    with _pending_lock:
+        _retry_timer = None
+
+    ids = _take_pending()
+    if not ids:
+        return
+
+    try:
+        _send_bumps(ids)
+    except RedisError as e:
+        logger.warning("Menu version bump retry failed for %s: %s", sorted(ids), e)
+        _defer(ids)
+    else:
+        logger.info("Menu version bump retried for %s", sorted(ids))
+
+
+def bump_menu_version_for_item(db: Session, item_id: int) -> None:
+    restaurant_id = (
+        db.query(MenuItem.restaurant_id)
+        .filter(MenuItem.id == item_id)
+        .scalar()
+    )
+    bump_menu_version(restaurant_id)
+
+
+def bump_all_menu_versions(db: Session) -> None:
+    """
+    Global categories are shared by every restaurant, so changing one
+    invalidates all compiled menus. Admin-only and rare.
+    """
+    restaurant_ids = [r[0] for r in db.query(Restaurant.id).all()]
+    bump_menu_version(*restaurant_ids)
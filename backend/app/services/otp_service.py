@@ -1,14 +1,48 @@
 import random
 from fastapi import HTTPException
 import hashlib
-from app.core.redis import redis_client
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.redis import async_redis_client
 from app.core.jwt import create_access_token
-from app.models.customer import Customer
+from app.services.customer_service import resolve_customer_id
 
 
 OTP_TTL = 300        # 5 min
 MAX_ATTEMPTS = 3
 
+
+def otp_key(phone: str) -> str:
+    # Hash {code, attempts}; the attempt count expires with the code
+    return f"otp_session:{phone}"
+
+
+# Check-and-increment in one round trip on one key; concurrent guesses
+# cannot race past MAX_ATTEMPTS because the script runs atomically.
+#
+#   KEYS[1] otp session key
+#   ARGV[1] hashed otp, ARGV[2] max attempts
+VERIFY_OTP_SCRIPT = """
+local session = redis.call('HMGET', KEYS[1], 'code', 'attempts')
+if not session[1] then
+    return 'expired'
+end
+
+if tonumber(session[2] or '0') >= tonumber(ARGV[2]) then
+    return 'locked'
+end
+
+if session[1] ~= ARGV[1] then
+    redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+    return 'wrong'
+end
+
+redis.call('DEL', KEYS[1])
+return 'ok'
+"""
+
+_verify_script = async_redis_client.register_script(VERIFY_OTP_SCRIPT)
+
+
 def hash_otp(otp: str) -> str:
     return hashlib.sha256(otp.encode()).hexdigest()
 
@@ -22,19 +56,17 @@ def generate_otp():
 # -------------------------------
 # Request OTP
 # -------------------------------
-def request_otp(phone: str):
+async def request_otp(phone: str):
 
     otp = generate_otp()
 
-    key = f"otp:{phone}"
-
-    # Save OTP (auto expire)
-    hashed = hash_otp(otp)
-    redis_client.setex(key, OTP_TTL, hashed)
-
+    key = otp_key(phone)
 
-    # Reset attempts
-    redis_client.delete(f"otp_attempt:{phone}")
+    # Save OTP with zero attempts (auto expire) in one round trip
+    async with async_redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping={"code": hash_otp(otp), "attempts": 0})
+        pipe.expire(key, OTP_TTL)
+        await pipe.execute()
 
     # Send SMS (mock)
     print(f"OTP sent to {phone}: {otp}")
@@ -47,64 +79,40 @@ def request_otp(phone: str):
 # -------------------------------
 # Verify OTP
 # -------------------------------
-def verify_otp(db, phone: str, otp: str):
+async def check_otp(phone: str, otp: str) -> str:
+    """
+    Returns ok / wrong / locked / expired.
+    """
+    return await _verify_script(
+        keys=[otp_key(phone)],
+        args=[hash_otp(otp), MAX_ATTEMPTS],
+    )
 
-    otp_key = f"otp:{phone}"
-    attempt_key = f"otp_attempt:{phone}"
 
-    saved_otp = redis_client.get(otp_key)
-
-    if saved_otp:
-        saved_otp = saved_otp
-        
+async def verify_otp(db: AsyncSession, phone: str, otp: str):
 
+    result = await check_otp(phone, otp)
 
     # OTP expired / not found
-    if not saved_otp:
+    if result == "expired":
         raise HTTPException(400, "OTP expired or not found")
 
     # Rate limit
-    attempts = redis_client.get(attempt_key)
-
-    if attempts:
-        attempts = int(attempts.decode())
-    else:
-        attempts = 0
-
-
-    if attempts >= MAX_ATTEMPTS:
+    if result == "locked":
         raise HTTPException(429, "Too many attempts")
-        
-    otp = hash_otp(otp)
-    # Wrong OTP
-    if saved_otp != otp:
-
-        redis_client.incr(attempt_key)
-        redis_client.expire(attempt_key, OTP_TTL)
 
+    # Wrong OTP
+    if result == "wrong":
         raise HTTPException(400, "Invalid OTP")
 
     # ---------------- SUCCESS ----------------
 
-    # Remove OTP
-    redis_client.delete(otp_key)
-    redis_client.delete(attempt_key)
-
-    # Get / Create customer
-    customer = db.query(Customer).filter(
-        Customer.phone == phone
-    ).first()
-
-    if not customer:
-        customer = Customer(phone=phone)
-        db.add(customer)
-        db.flush()
-
-    db.commit()
+    # Get / Create customer (cached, or one upsert)
+    customer_id = await resolve_customer_id(db, phone)
 
     # JWT
     token = create_access_token({
-        "sub": str(customer.id),
+        "sub": str(customer_id),
         "type": "customer"
     })
 
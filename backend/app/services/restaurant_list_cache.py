@@ -0,0 +1,91 @@
+"""
+Short-TTL cache for the restaurant list (GET /restaurants/).
+
+Keys embed a global list version that every restaurant write bumps, so
+a page or count cached before the write is never read after it; the old
+keys simply expire.
+
+  restaurants:list:version
+  restaurants:list:{version}:page:{digest}
+  restaurants:list:{version}:count:{digest}
+
+digest hashes the caller's scope (all restaurants, or the sorted ids a
+staff user is assigned to) together with the filters, so users with the
+same scope share entries.
+"""
+import hashlib
+import json
+import logging
+
+from redis.exceptions import RedisError
+
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+LIST_VERSION_KEY = "restaurants:list:version"
+
+
+def list_digest(scope: list[int] | None, **filters) -> str:
+    raw = json.dumps([scope, filters], sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _key(kind: str, version: int, digest: str) -> str:
+    return f"restaurants:list:{version}:{kind}:{digest}"
+
+
+# ------------------------------------------------
+# VERSION
+# ------------------------------------------------
+def get_list_version() -> int | None:
+    """
+    Current list version, None if Redis is unavailable (cache bypassed).
+    """
+    try:
+        version = redis_client.get(LIST_VERSION_KEY)
+    except RedisError as e:
+        logger.debug("Restaurant list cache unavailable: %s", e)
+        return None
+    return int(version) if version else 0
+
+
+def bump_restaurant_list_version() -> None:
+    """
+    Called after commit by every write that changes listed restaurants.
+    """
+    try:
+        redis_client.incr(LIST_VERSION_KEY)
+    except RedisError as e:
+        logger.warning("Restaurant list version bump failed: %s", e)
+
+
+# ------------------------------------------------
+# ENTRIES
+# ------------------------------------------------
+def get_cached(kind: str, version: int | None, digest: str):
+    if version is None:
+        return None
+
+    try:
+        raw = redis_client.get(_key(kind, version, digest))
+    except RedisError as e:
+        logger.debug("Restaurant list cache unavailable: %s", e)
+        return None
+
+    return json.loads(raw) if raw is not None else None
+
+
+def set_cached(kind: str, version: int | None, digest: str, value, ttl: int) -> None:
+    if version is None:
+        return
+
+    try:
+        redis_client.set(
+            _key(kind, version, digest),
+            json.dumps(value, separators=(",", ":")),
+            ex=ttl,
+        )
+    except RedisError as e:
+        logger.debug("Restaurant list cache unavailable: %s", e)
@@ -1,13 +1,44 @@
+import base64
+from datetime import datetime
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from app.models.user import User, UserRole
 from app.models.user_restaurant_map import UserRestaurant
 from app.models.restaurant import Restaurant
-from app.utils.slug_generator import generate_unique_slug
+from app.core.access_scope import bump_scope_version, invalidate_access
+from app.core.config import settings
+from app.schemas.restaurant import RestaurantRead
+from app.services import restaurant_list_cache
+from app.services.menu_version_service import bump_menu_version
+from app.services.restaurant_setting_service import invalidate_cached_settings
+from app.utils.slug_generator import SLUG_ATTEMPTS, generate_unique_slug, is_slug_conflict
 from app.utils.validators import validate_business_hours_format
 
 
+# ------------------------------------------------
+# KEYSET CURSOR
+# ------------------------------------------------
+def encode_cursor(created_at: datetime, restaurant_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{restaurant_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, restaurant_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(restaurant_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
 class RestaurantService:
 
     @staticmethod
@@ -24,15 +55,33 @@ class RestaurantService:
                 detail=str(e)
             )
 
+    @staticmethod
+    def _commit_with_unique_slug(db: Session, apply) -> None:
+        """
+        Run apply() (which allocates the slug) and commit. When a
+        concurrent write takes the same slug first, roll back and run it
+        again with a newly allocated one.
+        """
+        for attempt in range(SLUG_ATTEMPTS):
+            apply()
+            try:
+                db.commit()
+                return
+            except IntegrityError as e:
+                db.rollback()
+                if is_slug_conflict(e) and attempt + 1 < SLUG_ATTEMPTS:
+                    continue
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Restaurant with this name or slug already exists"
+                )
+
     def create(self, db: Session, payload):
         # Validate business_hours format
         validated_business_hours = self.validate_business_hours(payload.business_hours)
         
-        slug = generate_unique_slug(db, payload.name)
-
         restaurant = Restaurant(
             name=payload.name,
-            slug=slug,
             address=payload.address,
             phone=payload.phone,
             email=payload.email,
@@ -45,17 +94,13 @@ class RestaurantService:
             is_active=True
         )
 
-        db.add(restaurant)
-        try:
-            db.commit()
-        except IntegrityError:
-            db.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Restaurant with this name or slug already exists"
-            )
+        def apply():
+            restaurant.slug = generate_unique_slug(db, payload.name)
+            db.add(restaurant)
+
+        self._commit_with_unique_slug(db, apply)
 
-        db.refresh(restaurant)
+        restaurant_list_cache.bump_restaurant_list_version()
         return restaurant
 
     def get_all(
@@ -66,33 +111,118 @@ class RestaurantService:
         limit: int = 10,
         is_active: bool | None = None,
         search: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
     ):
-        query = db.query(Restaurant)
+        """
+        One page of restaurants visible to the user, newest first.
+
+        With a cursor the page is fetched by keyset on (created_at, id)
+        and skip is ignored. Pages and totals are served from a short-TTL
+        cache keyed by the user's scope and the filters.
 
+        Returns (restaurants as dicts, total or None, next cursor or None).
+        """
         # 🔐 STAFF: only their restaurants
-        if not user.is_admin:
-            query = query.join(Restaurant.users).filter(
-                User.id == user.id
+        scope = None if user.is_admin else sorted(user.restaurant_ids)
+        filters = {"is_active": is_active, "search": search}
+
+        version = restaurant_list_cache.get_list_version()
+
+        page_digest = restaurant_list_cache.list_digest(
+            scope, skip=skip, limit=limit, cursor=cursor, **filters
+        )
+        page = restaurant_list_cache.get_cached("page", version, page_digest)
+        if page is None:
+            page = self._fetch_page(db, scope, skip, limit, cursor, **filters)
+            restaurant_list_cache.set_cached(
+                "page",
+                version,
+                page_digest,
+                page,
+                settings.RESTAURANT_LIST_CACHE_TTL_SECONDS,
             )
 
+        total = None
+        if include_total:
+            count_digest = restaurant_list_cache.list_digest(scope, **filters)
+            total = restaurant_list_cache.get_cached("count", version, count_digest)
+            if total is None:
+                total = self._base_query(db, scope, **filters).count()
+                restaurant_list_cache.set_cached(
+                    "count",
+                    version,
+                    count_digest,
+                    total,
+                    settings.RESTAURANT_COUNT_CACHE_TTL_SECONDS,
+                )
+
+        return page["data"], total, page["next_cursor"]
+
+    def _base_query(
+        self,
+        db: Session,
+        scope: list[int] | None,
+        is_active: bool | None = None,
+        search: str | None = None,
+    ):
+        query = db.query(Restaurant)
+
+        if scope is not None:
+            query = query.filter(Restaurant.id.in_(scope))
+
         if is_active is not None:
             query = query.filter(Restaurant.is_active == is_active)
 
         if search:
             query = query.filter(Restaurant.name.ilike(f"%{search}%"))
 
-        total = query.count()
+        return query
+
+    def _fetch_page(
+        self,
+        db: Session,
+        scope: list[int] | None,
+        skip: int,
+        limit: int,
+        cursor: str | None,
+        **filters,
+    ) -> dict:
+        if scope == []:
+            return {"data": [], "next_cursor": None}
+
+        query = self._base_query(db, scope, **filters)
+
+        if cursor:
+            created_at, restaurant_id = decode_cursor(cursor)
+            query = query.filter(
+                tuple_(Restaurant.created_at, Restaurant.id)
+                < tuple_(created_at, restaurant_id)
+            )
+        else:
+            query = query.offset(skip)
 
+        # One extra row tells whether there is a next page
         restaurants = (
             query
-            .order_by(Restaurant.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+            .order_by(Restaurant.created_at.desc(), Restaurant.id.desc())
+            .limit(limit + 1)
             .all()
         )
 
-        return restaurants, total
+        next_cursor = None
+        if len(restaurants) > limit:
+            restaurants = restaurants[:limit]
+            last = restaurants[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
 
+        return {
+            "data": [
+                RestaurantRead.model_validate(r).model_dump(mode="json")
+                for r in restaurants
+            ],
+            "next_cursor": next_cursor,
+        }
 
     def get_by_id(self, db: Session, restaurant_id: int):
         return (
@@ -101,6 +231,12 @@ class RestaurantService:
             .first()
         )
 
+    async def get_by_id_async(self, db: AsyncSession, restaurant_id: int):
+        result = await db.execute(
+            select(Restaurant).where(Restaurant.id == restaurant_id)
+        )
+        return result.scalars().first()
+
     def update(self, db: Session, restaurant_id: int, payload):
         restaurant = self.get_by_id(db, restaurant_id)
         if not restaurant:
@@ -113,29 +249,28 @@ class RestaurantService:
         if "business_hours" in data:
             data["business_hours"] = self.validate_business_hours(data["business_hours"])
 
-        # Regenerate slug only if name changes
-        if "name" in data:
-            restaurant.name = data["name"]
-            restaurant.slug = generate_unique_slug(
-                db,
-                data["name"],
-                exclude_id=restaurant.id
-            )
+        def apply():
+            # Regenerate slug only if name changes
+            if "name" in data:
+                restaurant.name = data["name"]
+                restaurant.slug = generate_unique_slug(
+                    db,
+                    data["name"],
+                    exclude_id=restaurant.id
+                )
 
-        for key, value in data.items():
-            if key != "name":
-                setattr(restaurant, key, value)
+            for key, value in data.items():
+                if key != "name":
+                    setattr(restaurant, key, value)
 
-        try:
-            db.commit()
-        except IntegrityError:
-            db.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Restaurant with this name or slug already exists"
-            )
+        self._commit_with_unique_slug(db, apply)
+
+        restaurant_list_cache.bump_restaurant_list_version()
+
+        # The compiled menu evaluates availability in the restaurant's timezone
+        if "timezone" in data:
+            bump_menu_version(restaurant.id)
 
-        db.refresh(restaurant)
         return restaurant
 
     def delete(self, db: Session, restaurant_id: int):
@@ -143,8 +278,21 @@ class RestaurantService:
         if not restaurant:
             return False
 
+        # Assignments cascade with the restaurant; drop the cached scopes
+        user_ids = [
+            r[0]
+            for r in db.query(UserRestaurant.user_id)
+            .filter(UserRestaurant.restaurant_id == restaurant_id)
+            .all()
+        ]
+
         db.delete(restaurant)
+        bump_scope_version(db, *user_ids)
         db.commit()
+        restaurant_list_cache.bump_restaurant_list_version()
+        invalidate_access(*user_ids)
+        # Settings cascade with the restaurant
+        invalidate_cached_settings(restaurant_id)
         return True
 
     def add_staff(
@@ -183,7 +331,9 @@ class RestaurantService:
         )
         if existing:
             # If role was updated, commit that change
+            bump_scope_version(db, staff_user_id)
             db.commit()
+            invalidate_access(staff_user_id)
             return restaurant  # Already assigned; idempotent
 
         # Create mapping in user_restaurants_map table
@@ -192,5 +342,7 @@ class RestaurantService:
             restaurant_id=restaurant_id,
         )
         db.add(mapping)
+        bump_scope_version(db, staff_user_id)
         db.commit()  # Commit both role update (if any) and mapping together
+        invalidate_access(staff_user_id)
         return restaurant
@@ -1,7 +1,96 @@
+"""
+Restaurant settings.
+
+Settings are read far more often than written, so reads go through a
+short-TTL Redis copy of the response fields. Keys embed a per-restaurant
+settings version that update() and restaurant deletion bump after
+commit, as in restaurant_list_cache:
+
+  restaurant:settings:version:{id}
+  restaurant:settings:{id}:{version}
+
+A read caches under the version it saw before loading the row, so one
+racing an update can only write a key that is no longer read.
+
+Missing settings are created with INSERT ... ON CONFLICT (restaurant_id)
+DO NOTHING RETURNING, so concurrent first reads do not race on the
+unique restaurant_id; the one that inserts nothing reads the winner's
+row. A missing restaurant fails the foreign key instead of being looked
+up first.
+"""
+import json
+import logging
+
+from redis.exceptions import RedisError
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from app.core.config import settings as app_settings
+from app.core.redis import redis_client
 from app.models.restaurant_settings import RestaurantSettings
-from app.models.restaurant import Restaurant
+from app.schemas.restaurant_setting_schema import RestaurantSettingsRead
+
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------
+# CACHE
+# ------------------------------------------------
+def version_key(restaurant_id: int) -> str:
+    return f"restaurant:settings:version:{restaurant_id}"
+
+
+def settings_key(restaurant_id: int, version: int) -> str:
+    return f"restaurant:settings:{restaurant_id}:{version}"
+
+
+def get_settings_version(restaurant_id: int) -> int | None:
+    """
+    Current settings version, None if Redis is unavailable (cache bypassed).
+    """
+    try:
+        version = redis_client.get(version_key(restaurant_id))
+    except RedisError as e:
+        logger.debug("Restaurant settings cache unavailable: %s", e)
+        return None
+    return int(version) if version else 0
+
+
+def get_cached_settings(restaurant_id: int, version: int | None) -> dict | None:
+    if version is None:
+        return None
+
+    try:
+        raw = redis_client.get(settings_key(restaurant_id, version))
+    except RedisError as e:
+        logger.debug("Restaurant settings cache unavailable: %s", e)
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+def set_cached_settings(restaurant_id: int, version: int | None, data: dict) -> None:
+    if version is None:
+        return
+
+    try:
+        redis_client.set(
+            settings_key(restaurant_id, version),
+            json.dumps(data),
+            ex=app_settings.RESTAURANT_SETTINGS_CACHE_TTL_SECONDS,
+        )
+    except RedisError as e:
+        logger.debug("Restaurant settings cache unavailable: %s", e)
+
+
+def invalidate_cached_settings(restaurant_id: int) -> None:
+    """
+    Called after commit by every write that changes a restaurant's settings.
+    """
+    try:
+        redis_client.incr(version_key(restaurant_id))
+    except RedisError as e:
+        logger.warning("Restaurant settings version bump failed: %s", e)
 
 
 class RestaurantSettingsService:
@@ -23,31 +112,29 @@ class RestaurantSettingsService:
         restaurant_id: int,
     ) -> RestaurantSettings:
         """
-        Create default settings for a restaurant.
-        Called when restaurant is created or first accessed.
+        Create default settings for a restaurant, or return the row a
+        concurrent request created first.
         """
-
-        # Ensure restaurant exists
-        restaurant = (
-            db.query(Restaurant)
-            .filter(Restaurant.id == restaurant_id)
-            .first()
+        stmt = (
+            insert(RestaurantSettings)
+            .values(restaurant_id=restaurant_id, auto_accept_orders=False)
+            .on_conflict_do_nothing(index_elements=[RestaurantSettings.restaurant_id])
+            .returning(RestaurantSettings)
         )
 
-        if not restaurant:
+        try:
+            settings = db.scalars(stmt).first()
+            db.commit()
+        except IntegrityError:
+            # restaurant_id foreign key
+            db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Restaurant not found",
             )
 
-        settings = RestaurantSettings(
-            restaurant_id=restaurant_id,
-            auto_accept_orders=False,
-        )
-
-        db.add(settings)
-        db.commit()
-        db.refresh(settings)
+        if settings is None:
+            settings = self.get_by_restaurant_id(db, restaurant_id)
 
         return settings
 
@@ -66,6 +153,25 @@ class RestaurantSettingsService:
 
         return self.create_default(db, restaurant_id)
 
+    def get_cached_or_create(
+        self,
+        db: Session,
+        restaurant_id: int,
+    ) -> dict:
+        """
+        Settings as RestaurantSettingsRead fields, from the cache when
+        present.
+        """
+        version = get_settings_version(restaurant_id)
+        data = get_cached_settings(restaurant_id, version)
+        if data is not None:
+            return data
+
+        settings = self.get_or_create(db, restaurant_id)
+        data = RestaurantSettingsRead.model_validate(settings).model_dump()
+        set_cached_settings(restaurant_id, version, data)
+        return data
+
     def update(
         self,
         db: Session,
@@ -84,7 +190,6 @@ class RestaurantSettingsService:
             setattr(settings, key, value)
 
         db.commit()
-        db.refresh(settings)
+        invalidate_cached_settings(restaurant_id)
 
         return settings
-
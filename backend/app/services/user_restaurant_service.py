@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
+from app.core.access_scope import bump_scope_version, invalidate_access
 from app.models.user_restaurant_map import UserRestaurant
 
 
@@ -20,6 +21,7 @@ class UserRestaurantService:
 
         db.add(mapping)
         try:
+            bump_scope_version(db, user_id)
             db.commit()
         except IntegrityError:
             db.rollback()
@@ -28,6 +30,7 @@ class UserRestaurantService:
                 detail="User already assigned to this restaurant, or invalid user/restaurant.",
             )
 
+        invalidate_access(user_id)
         return True
 
     def remove_user_from_restaurant(
@@ -43,5 +46,7 @@ class UserRestaurantService:
                 detail="User-restaurant assignment not found",
             )
         db.delete(mapping)
+        bump_scope_version(db, user_id)
         db.commit()
+        invalidate_access(user_id)
         return True
\ No newline at end of file
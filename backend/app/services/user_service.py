@@ -4,8 +4,10 @@ from fastapi import HTTPException, status
 from app.models.user import User, UserRole
 from app.schemas.user_schema import UserCreate
 from app.core.security import hash_password
-from app.core.security import verify_password
+from app.core.security import verify_and_rehash
 from app.core.jwt import create_access_token, create_refresh_token, decode_access_token
+from app.core.access_scope import scope_claims
+from app.core.principal_cache import UserPrincipal, get_user_principal
 
 
 def create_user(db: Session, payload: UserCreate, current_user: User) -> User:
@@ -44,7 +46,6 @@ def create_user(db: Session, payload: UserCreate, current_user: User) -> User:
 
     db.add(user)
     db.commit()
-    db.refresh(user)
 
     return user
 
@@ -63,12 +64,19 @@ def authenticate_user(
             detail="Invalid credentials",
         )
 
-    if not verify_password(password, user.password_hash):
+    verified, new_hash = verify_and_rehash(password, user.password_hash)
+
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
 
+    # Stored with an older bcrypt cost: upgrade it now we have the password
+    if new_hash:
+        user.password_hash = new_hash
+        db.commit()
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -78,23 +86,20 @@ def authenticate_user(
     return user
 
 
-def login_user(db: Session, email: str, password: str) -> str:
-
-    user = authenticate_user(db, email, password)
+def _issue_tokens(principal: UserPrincipal) -> dict:
+    """
+    Access token carries the restaurant scope; refresh token does not.
+    """
+    claims = {
+        "sub": str(principal.id),
+        "role": principal.role.value,
+    }
 
     access_token = create_access_token(
-        data={
-            "sub": str(user.id),
-            "role": user.role.value,
-        }
+        data={**claims, **scope_claims(principal)}
     )
 
-    refresh_token = create_refresh_token(
-        data={
-            "sub": str(user.id),
-            "role": user.role.value,
-        }
-    )
+    refresh_token = create_refresh_token(data=claims)
 
     return {
         "access_token": access_token,
@@ -103,6 +108,15 @@ def login_user(db: Session, email: str, password: str) -> str:
     }
 
 
+def login_user(db: Session, email: str, password: str) -> str:
+
+    user = authenticate_user(db, email, password)
+
+    principal = get_user_principal(db, user.id)
+
+    return _issue_tokens(principal)
+
+
 def refresh_tokens(db: Session, refresh_token: str) -> dict:
     """
     Validate a refresh token and return a new token pair.
@@ -124,30 +138,12 @@ def refresh_tokens(db: Session, refresh_token: str) -> dict:
             detail="Invalid token payload",
         )
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    principal = get_user_principal(db, int(user_id))
 
-    if not user or not user.is_active:
+    if not principal or not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
         )
 
-    access_token = create_access_token(
-        data={
-            "sub": str(user.id),
-            "role": user.role.value,
-        }
-    )
-
-    new_refresh_token = create_refresh_token(
-        data={
-            "sub": str(user.id),
-            "role": user.role.value,
-        }
-    )
-
-    return {
-        "access_token": access_token,
-        "refresh_token": new_refresh_token,
-        "token_type": "bearer",
-    }
+    return _issue_tokens(principal)
@@ -0,0 +1,202 @@
+"""
+Menu item import worker.
+
+Consumes jobs enqueued by bulk_import_items_service.create_job so large
+imports never run inside an API process.
+
+Usage:
+    python -m app.workers.import_worker [--concurrency N]
+"""
+import argparse
+import logging
+import os
+import signal
+import threading
+
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.database import SessionLocal, pool_config_summary
+from app.services import bulk_import_items_service, import_queue_service
+
+logger = logging.getLogger(__name__)
+
+
+class ImportWorker:
+
+    def __init__(
+        self,
+        concurrency: int = settings.IMPORT_WORKER_CONCURRENCY,
+        visibility_timeout: int = settings.IMPORT_VISIBILITY_TIMEOUT_SECONDS,
+        max_retries: int = settings.IMPORT_MAX_RETRIES,
+        poll_interval: float = settings.IMPORT_POLL_INTERVAL_SECONDS,
+    ):
+        self.concurrency = concurrency
+        self.visibility_timeout = visibility_timeout
+        self.max_retries = max_retries
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+
+    # =========================================================
+    # LIFECYCLE
+    # =========================================================
+    def run(self) -> None:
+        logger.info(
+            "Import worker started (concurrency=%s, visibility_timeout=%ss, max_retries=%s)",
+            self.concurrency,
+            self.visibility_timeout,
+            self.max_retries,
+        )
+
+        consumers = [
+            threading.Thread(target=self._consume, name=f"import-{i}", daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for consumer in consumers:
+            consumer.start()
+
+        # Main thread reclaims jobs abandoned by crashed workers
+        while not self._stop.is_set():
+            try:
+                moved = import_queue_service.requeue_expired()
+                if moved:
+                    logger.warning("Requeued %s import job(s) with expired leases", moved)
+            except RedisError as e:
+                logger.error("Import queue unavailable: %s", e)
+
+            self._stop.wait(self.visibility_timeout / 2)
+
+        for consumer in consumers:
+            consumer.join()
+
+        logger.info("Import worker stopped")
+
+    def stop(self, *_) -> None:
+        self._stop.set()
+
+    # =========================================================
+    # CONSUMER
+    # =========================================================
+    def _consume(self) -> None:
+        # Nothing may end this loop but stop(): a dead consumer thread
+        # would leave the process looking healthy while imports pile up
+        while not self._stop.is_set():
+            try:
+                reserved = import_queue_service.reserve(self.visibility_timeout)
+                if reserved is None:
+                    self._stop.wait(self.poll_interval)
+                    continue
+
+                self._handle(*reserved)
+            except RedisError as e:
+                logger.error("Import queue unavailable: %s", e)
+                self._stop.wait(self.poll_interval * 5)
+            except Exception:
+                # The job stays leased; requeue_expired() hands it out again
+                logger.exception("Import consumer failed")
+                self._stop.wait(self.poll_interval * 5)
+
+    def _handle(self, raw: str, payload: dict) -> None:
+        job_id = payload["job_id"]
+        attempts = payload.get("attempts", 0)
+
+        # Redelivered after the final commit but before the ack (crash or
+        # expired lease): the outcome is already recorded
+        if self._is_finished(job_id):
+            logger.warning("Import job %s already finished, acknowledging", job_id)
+            self._finish(raw, payload)
+            return
+
+        if attempts > self.max_retries:
+            self._give_up(raw, payload, f"Import failed after {attempts} attempts")
+            return
+
+        if not os.path.exists(payload["path"]):
+            self._give_up(raw, payload, "Uploaded file not found")
+            return
+
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(job_id, done),
+            daemon=True,
+        )
+        heartbeat.start()
+
+        try:
+            bulk_import_items_service.run_import_job(
+                job_id,
+                payload["restaurant_id"],
+                payload["file_type"],
+                payload["path"],
+            )
+        except Exception:
+            logger.exception("Import job %s failed (attempt %s)", job_id, attempts + 1)
+            import_queue_service.retry(raw, payload)
+            return
+        finally:
+            done.set()
+            heartbeat.join()
+
+        self._finish(raw, payload)
+        logger.info("Import job %s finished", job_id)
+
+    def _is_finished(self, job_id: int) -> bool:
+        db = SessionLocal()
+        try:
+            return bulk_import_items_service.is_job_finished(db, job_id)
+        finally:
+            db.close()
+
+    def _finish(self, raw: str, payload: dict) -> None:
+        # The upload is kept until the ack, so a redelivery before it can
+        # still be retried
+        import_queue_service.ack(raw, payload["job_id"])
+        if os.path.exists(payload["path"]):
+            os.remove(payload["path"])
+
+    def _heartbeat(self, job_id: int, done: threading.Event) -> None:
+        # Keep the lease alive while the job is running
+        while not done.wait(self.visibility_timeout / 3):
+            try:
+                import_queue_service.extend_lease(job_id, self.visibility_timeout)
+            except RedisError as e:
+                logger.warning("Could not extend lease of import job %s: %s", job_id, e)
+
+    def _give_up(self, raw: str, payload: dict, error: str) -> None:
+        logger.error("Import job %s: %s", payload["job_id"], error)
+
+        db = SessionLocal()
+        try:
+            bulk_import_items_service.mark_job_failed(db, payload["job_id"], error)
+        finally:
+            db.close()
+
+        self._finish(raw, payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DineBuddy menu import worker")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.IMPORT_WORKER_CONCURRENCY,
+        help="Number of jobs processed in parallel",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s [%(threadName)s] %(message)s",
+    )
+
+    logger.info("Database pools: %s", pool_config_summary())
+
+    worker = ImportWorker(concurrency=args.concurrency)
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run()
+
+
+if __name__ == "__main__":
+    main()
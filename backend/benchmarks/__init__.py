@@ -0,0 +1,3 @@
+"""
+Micro-benchmarks and load tests for API hot paths.
+"""
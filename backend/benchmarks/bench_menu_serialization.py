@@ -0,0 +1,73 @@
+"""
+Menu list serialization: default FastAPI path vs the orjson fast path.
+
+    cd backend && python -m benchmarks.bench_menu_serialization [--items 300]
+
+Compares, per request for an N-item menu:
+
+  pydantic+json   validate each row through MenuItemRead, then encode
+                  with the stdlib json module (what response_model does)
+  orjson dicts    encode the snapshot's plain dicts with orjson
+  pre-encoded     look up the body already encoded for the ETag
+"""
+import argparse
+import json
+import timeit
+from datetime import time
+from decimal import Decimal
+from types import SimpleNamespace
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from app.schemas.menu_items_schema import MenuItemRead
+
+
+def make_rows(count: int) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=i,
+            restaurant_id=1,
+            category_id=i % 12 + 1,
+            name=f"Menu item {i}",
+            description="Slow-cooked with house spices and served with rice",
+            price=Decimal("249.00"),
+            image_url=f"https://cdn.example.com/items/{i}.jpg",
+            is_available=True,
+            is_vegetarian=i % 2 == 0,
+            preparation_time_minutes=15,
+            available_from=time(11, 0) if i % 5 == 0 else None,
+            available_to=time(15, 0) if i % 5 == 0 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = make_rows(args.items)
+    dicts = [MenuItemRead.model_validate(r).model_dump(mode="json") for r in rows]
+    pre_encoded = {'"etag"': orjson.dumps(dicts)}
+
+    cases = {
+        "pydantic+json": lambda: json.dumps(
+            jsonable_encoder([MenuItemRead.model_validate(r) for r in rows])
+        ).encode(),
+        "orjson dicts": lambda: orjson.dumps(dicts),
+        "pre-encoded": lambda: pre_encoded['"etag"'],
+    }
+
+    baseline = None
+    print(f"{args.items} items, best of 5 x {args.repeat} runs")
+    for name, fn in cases.items():
+        best = min(timeit.repeat(fn, number=args.repeat, repeat=5)) / args.repeat
+        baseline = baseline or best
+        print(f"  {name:<14} {best * 1e3:9.3f} ms/request  {baseline / best:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+OTP verification throughput against Redis: fused script vs round trips.
+
+    cd backend && python -m benchmarks.bench_otp_verify [--phones 5000 --concurrency 64]
+
+Seeds N OTP sessions, then verifies every one of them with `concurrency`
+concurrent callers, per strategy:
+
+  round trips   GET code, GET attempts, compare in Python, then
+                INCR+EXPIRE or DEL+DEL (the previous implementation)
+  fused script  otp_service.check_otp: one EVALSHA on one key
+
+Keys use a bench: prefix and are removed afterwards.
+"""
+import argparse
+import asyncio
+import time
+
+from app.core.redis import async_redis_client
+from app.services import otp_service
+from app.services.otp_service import MAX_ATTEMPTS, OTP_TTL, hash_otp
+
+PREFIX = "bench:"
+CODE = "123456"
+
+
+async def round_trips(phone: str, otp: str) -> str:
+    redis = async_redis_client
+    code_key, attempt_key = f"{PREFIX}otp:{phone}", f"{PREFIX}otp_attempt:{phone}"
+
+    saved = await redis.get(code_key)
+    if not saved:
+        return "expired"
+
+    attempts = int(await redis.get(attempt_key) or 0)
+    if attempts >= MAX_ATTEMPTS:
+        return "locked"
+
+    if saved != hash_otp(otp):
+        await redis.incr(attempt_key)
+        await redis.expire(attempt_key, OTP_TTL)
+        return "wrong"
+
+    await redis.delete(code_key)
+    await redis.delete(attempt_key)
+    return "ok"
+
+
+async def fused(phone: str, otp: str) -> str:
+    return await otp_service.check_otp(f"{PREFIX}{phone}", otp)
+
+
+async def seed(phones: list[str]) -> None:
+    hashed = hash_otp(CODE)
+    async with async_redis_client.pipeline(transaction=False) as pipe:
+        for phone in phones:
+            pipe.setex(f"{PREFIX}otp:{phone}", OTP_TTL, hashed)
+            pipe.hset(
+                otp_service.otp_key(f"{PREFIX}{phone}"),
+                mapping={"code": hashed, "attempts": 0},
+            )
+            pipe.expire(otp_service.otp_key(f"{PREFIX}{phone}"), OTP_TTL)
+        await pipe.execute()
+
+
+async def run(verify, phones: list[str], concurrency: int) -> tuple[float, list[float]]:
+    queue = iter(phones)
+    latencies: list[float] = []
+
+    async def caller():
+        for phone in queue:
+            started = time.perf_counter()
+            result = await verify(phone, CODE)
+            latencies.append(time.perf_counter() - started)
+            assert result == "ok", result
+
+    started = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    return time.perf_counter() - started, sorted(latencies)
+
+
+async def main_async(args) -> None:
+    phones = [f"9{i:09d}" for i in range(args.phones)]
+
+    print(f"{args.phones} verifications, concurrency {args.concurrency}")
+    for name, verify in (("round trips", round_trips), ("fused script", fused)):
+        await seed(phones)
+        elapsed, latencies = await run(verify, phones, args.concurrency)
+        p50 = latencies[len(latencies) // 2]
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(
+            f"  {name:<13} {len(phones) / elapsed:9.0f} verifications/s  "
+            f"p50 {p50 * 1e3:6.2f} ms  p99 {p99 * 1e3:6.2f} ms"
+        )
+
+    keys = [k async for k in async_redis_client.scan_iter(f"{PREFIX}*")]
+    if keys:
+        await async_redis_client.delete(*keys)
+    await async_redis_client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--phones", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
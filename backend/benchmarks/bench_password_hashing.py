@@ -0,0 +1,75 @@
+"""
+Password verification throughput by bcrypt cost and hashing pool size.
+
+    cd backend && python -m benchmarks.bench_password_hashing [--logins 64]
+
+Fires a burst of `logins` concurrent verifications (one request thread
+each, as sync FastAPI routes run) at a pool of N hashing threads and
+reports logins/s plus how long a trivial task on another thread waits
+meanwhile - a stand-in for an unrelated route during a login burst.
+For end-to-end numbers run the `login` scenario of benchmarks.run.
+"""
+import argparse
+import hashlib
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.hash import bcrypt
+
+
+def burst(hashed: str, secret: bytes, logins: int, workers: int) -> tuple[float, float]:
+    pool = ThreadPoolExecutor(max_workers=workers)
+    stop = threading.Event()
+    stalls: list[float] = []
+
+    def login():
+        assert pool.submit(bcrypt.verify, secret, hashed).result()
+
+    def unrelated():
+        # 1 ms of sleep; anything above that is time spent waiting for the GIL
+        while not stop.is_set():
+            started = time.perf_counter()
+            time.sleep(0.001)
+            stalls.append(time.perf_counter() - started - 0.001)
+
+    probe = threading.Thread(target=unrelated)
+    probe.start()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=login) for _ in range(logins)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    probe.join()
+    pool.shutdown()
+    return logins / elapsed, statistics.quantiles(stalls, n=100)[98] if len(stalls) > 1 else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--rounds", default="10,12", help="comma-separated bcrypt costs")
+    parser.add_argument("--workers", default="1,2,4", help="comma-separated pool sizes")
+    args = parser.parse_args()
+
+    secret = hashlib.sha256(b"bench-password").digest()
+
+    print(f"burst of {args.logins} concurrent logins")
+    for rounds in (int(r) for r in args.rounds.split(",")):
+        hashed = bcrypt.using(rounds=rounds).hash(secret)
+        for workers in (int(w) for w in args.workers.split(",")):
+            rate, stall_p99 = burst(hashed, secret, args.logins, workers)
+            print(
+                f"  cost {rounds:>2}  workers {workers:>2}  "
+                f"{rate:8.1f} logins/s  other-thread stall p99 {stall_p99 * 1e3:6.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
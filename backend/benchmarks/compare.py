@@ -0,0 +1,55 @@
+"""
+Compare two benchmarks.run result files.
+
+    cd backend && python -m benchmarks.compare baseline.json candidate.json
+
+Prints, per scenario present in both files, throughput and p50/p99
+latency with the relative change from the baseline.
+"""
+import argparse
+import json
+
+
+def change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark results")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    print(
+        f"baseline  {baseline['meta'].get('commit')}  "
+        f"candidate {candidate['meta'].get('commit')}"
+    )
+    print(f"{'scenario':<16} {'rps':>22} {'p50 ms':>24} {'p99 ms':>24}")
+
+    for name, before in baseline["scenarios"].items():
+        after = candidate["scenarios"].get(name)
+        if after is None:
+            continue
+
+        columns = [f"{name:<16}"]
+        for before_value, after_value in (
+            (before["rps"], after["rps"]),
+            (before["latency_ms"]["p50"], after["latency_ms"]["p50"]),
+            (before["latency_ms"]["p99"], after["latency_ms"]["p99"]),
+        ):
+            columns.append(
+                f"{before_value:>8.1f} -> {after_value:>8.1f} "
+                f"{change(before_value, after_value):>7}"
+            )
+        print(" ".join(columns))
+
+
+if __name__ == "__main__":
+    main()
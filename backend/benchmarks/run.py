@@ -0,0 +1,314 @@
+"""
+Scenario runner for the API hot paths.
+
+    cd backend && python -m benchmarks.run \\
+        --base-url http://localhost:8000/api/v1 \\
+        --scenarios menu_list,item_get,restaurant_list \\
+        --concurrency 32 --duration 20 --output results.json
+
+Each scenario runs `concurrency` workers in a closed loop for `duration`
+seconds against a running stack (docker-compose Postgres/Redis) seeded
+with benchmarks.seed, then reports throughput and latency percentiles.
+Compare two result files with benchmarks.compare.
+
+Scenarios:
+
+  menu_list        GET  /restaurants/{id}/menu-items/
+  item_get         GET  /restaurants/{id}/menu-items/{item_id}
+  login            POST /auth/login
+  otp_verify       POST /auth/customer/verify-otp (request-otp is untimed)
+  restaurant_list  GET  /restaurants/
+  item_toggle      PATCH /restaurants/{id}/menu-items/{item_id}/availability
+  bulk_import      POST /restaurants/{id}/menu-items/import
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+import httpx
+
+
+# ------------------------------------------------
+# SCENARIOS
+# ------------------------------------------------
+@dataclass
+class Context:
+    manifest: dict
+    token: str | None = None
+
+    def restaurant(self, rng: random.Random) -> dict:
+        return rng.choice(self.manifest["restaurants"])
+
+    @property
+    def auth(self) -> dict:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+Request = Callable[[httpx.AsyncClient, Context, random.Random, object], Awaitable[httpx.Response]]
+
+
+async def menu_list(client, ctx, rng, prepared):
+    restaurant = ctx.restaurant(rng)
+    return await client.get(f"/restaurants/{restaurant['id']}/menu-items/")
+
+
+async def item_get(client, ctx, rng, prepared):
+    restaurant = ctx.restaurant(rng)
+    item_id = rng.choice(restaurant["item_ids"])
+    return await client.get(f"/restaurants/{restaurant['id']}/menu-items/{item_id}")
+
+
+async def login(client, ctx, rng, prepared):
+    admin = ctx.manifest["admin"]
+    return await client.post(
+        "/auth/login",
+        json={"email": admin["email"], "password": admin["password"]},
+    )
+
+
+async def restaurant_list(client, ctx, rng, prepared):
+    return await client.get(
+        "/restaurants/",
+        params={"page": rng.randint(1, 3), "limit": 20},
+        headers=ctx.auth,
+    )
+
+
+async def request_otp(client, ctx, rng, worker, n) -> tuple[str, str]:
+    # Valid Indian mobile number, distinct per worker and iteration
+    phone = f"9{(worker * 100_000 + n) % 1_000_000_000:09d}"
+    response = await client.post("/auth/customer/request-otp", json={"phone": phone})
+    response.raise_for_status()
+    return phone, response.json()["otp"]
+
+
+async def otp_verify(client, ctx, rng, prepared):
+    phone, otp = prepared
+    return await client.post(
+        "/auth/customer/verify-otp",
+        json={"phone": phone, "otp": otp},
+    )
+
+
+async def item_toggle(client, ctx, rng, prepared):
+    restaurant = ctx.restaurant(rng)
+    item_id = rng.choice(restaurant["item_ids"])
+    return await client.patch(
+        f"/restaurants/{restaurant['id']}/menu-items/{item_id}/availability",
+        json={"is_available": rng.random() < 0.5},
+        headers=ctx.auth,
+    )
+
+
+def import_csv(restaurant: dict, rng: random.Random, rows: int = 200) -> bytes:
+    lines = ["category_id,name,price,description,is_available"]
+    for i in range(rows):
+        lines.append(
+            f"{rng.choice(restaurant['category_ids'])},"
+            f"Imported {rng.getrandbits(48):x} {i},"
+            f"{rng.randrange(50, 900)},Bench import,true"
+        )
+    return ("\n".join(lines) + "\n").encode()
+
+
+async def bulk_import(client, ctx, rng, prepared):
+    restaurant = ctx.restaurant(rng)
+    return await client.post(
+        f"/restaurants/{restaurant['id']}/menu-items/import",
+        files={"file": ("items.csv", import_csv(restaurant, rng), "text/csv")},
+        headers=ctx.auth,
+    )
+
+
+SCENARIOS: dict[str, Request] = {
+    "menu_list": menu_list,
+    "item_get": item_get,
+    "login": login,
+    "otp_verify": otp_verify,
+    "restaurant_list": restaurant_list,
+    "item_toggle": item_toggle,
+    "bulk_import": bulk_import,
+}
+
+# Untimed per-iteration setup whose result is passed to the scenario
+PREPARE = {
+    "otp_verify": request_otp,
+}
+
+NEEDS_TOKEN = {"restaurant_list", "item_toggle", "bulk_import"}
+
+
+# ------------------------------------------------
+# RUNNER
+# ------------------------------------------------
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an ascending list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def _worker(name, client, ctx, worker, deadline, latencies, statuses, seed):
+    rng = random.Random(seed * 1000 + worker)
+    prepare = PREPARE.get(name)
+    n = 0
+    while time.perf_counter() < deadline:
+        n += 1
+        prepared = None
+        if prepare:
+            try:
+                prepared = await prepare(client, ctx, rng, worker, n)
+            except httpx.HTTPError as e:
+                key = f"prepare:{type(e).__name__}"
+                statuses[key] = statuses.get(key, 0) + 1
+                continue
+
+        started = time.perf_counter()
+        try:
+            response = await SCENARIOS[name](client, ctx, rng, prepared)
+            status = str(response.status_code)
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+
+        latencies.append(time.perf_counter() - started)
+        statuses[status] = statuses.get(status, 0) + 1
+
+
+async def run_scenario(name, base_url, ctx, concurrency, duration, warmup, seed) -> dict:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        if warmup:
+            await asyncio.gather(*(
+                _worker(name, client, ctx, w, time.perf_counter() + warmup, [], {}, seed)
+                for w in range(concurrency)
+            ))
+
+        latencies: list[float] = []
+        statuses: dict[str, int] = {}
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            _worker(name, client, ctx, w, started + duration, latencies, statuses, seed)
+            for w in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    ok = sum(count for status, count in statuses.items() if status.startswith("2"))
+    total = len(latencies)
+    return {
+        "requests": total,
+        "errors": total - ok,
+        "rps": round(total / elapsed, 1),
+        "latency_ms": {
+            "mean": round(sum(latencies) / total * 1e3, 2) if total else 0.0,
+            **{
+                f"p{p}": round(percentile(latencies, p) * 1e3, 2)
+                for p in (50, 90, 95, 99)
+            },
+            "max": round(latencies[-1] * 1e3, 2) if total else 0.0,
+        },
+        "status": statuses,
+    }
+
+
+async def fetch_token(base_url: str, manifest: dict) -> str:
+    admin = manifest["admin"]
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        response = await client.post(
+            "/auth/login",
+            json={"email": admin["email"], "password": admin["password"]},
+        )
+        response.raise_for_status()
+        return response.json()["access_token"]
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main_async(args) -> dict:
+    with open(args.manifest) as f:
+        ctx = Context(manifest=json.load(f))
+
+    names = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    if NEEDS_TOKEN & set(names):
+        ctx.token = await fetch_token(args.base_url, ctx.manifest)
+
+    results = {}
+    for name in names:
+        results[name] = await run_scenario(
+            name,
+            args.base_url,
+            ctx,
+            args.concurrency,
+            args.duration,
+            args.warmup,
+            args.seed,
+        )
+        r = results[name]
+        print(
+            f"{name:<16} {r['rps']:>9.1f} rps  "
+            f"p50 {r['latency_ms']['p50']:>7.2f} ms  "
+            f"p99 {r['latency_ms']['p99']:>7.2f} ms  "
+            f"errors {r['errors']}"
+        )
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+        },
+        "scenarios": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run API hot-path benchmarks")
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--manifest", default="benchmarks/manifest.json")
+    parser.add_argument(
+        "--scenarios",
+        default="menu_list,item_get,restaurant_list,login,otp_verify",
+        help=f"comma-separated, from: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20, help="seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=3, help="untimed seconds per scenario")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
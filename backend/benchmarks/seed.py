@@ -0,0 +1,167 @@
+"""
+Seed a database with benchmark data through the app's models.
+
+    cd backend && python -m benchmarks.seed --restaurants 20 --items 300
+
+Creates (or reuses) an admin user, then N restaurants, each with its own
+categories, menu items and variants, and writes a manifest of the
+generated ids and credentials for benchmarks.run. Every run is tagged so
+it can be repeated against the same database without name clashes.
+"""
+import argparse
+import json
+import random
+import time
+from datetime import time as clock
+from decimal import Decimal
+
+from sqlalchemy import insert
+
+from app.core.database import SessionLocal
+from app.core.security import hash_password
+from app.db import base  # noqa: F401  (registers every model)
+from app.models.menu_category import MenuCategory
+from app.models.menu_item_variant import MenuItemVariant
+from app.models.menu_items import MenuItem
+from app.models.restaurant import Restaurant
+from app.models.user import User, UserRole
+from app.services.restaurant_list_cache import bump_restaurant_list_version
+
+
+ADMIN_EMAIL = "bench-admin@dinebuddy.local"
+ADMIN_PASSWORD = "bench-admin-password"
+
+VARIANT_NAMES = ["Regular", "Medium", "Large", "Family", "Jumbo"]
+
+
+def get_or_create_admin(db) -> User:
+    user = db.query(User).filter(User.email == ADMIN_EMAIL).first()
+    if user:
+        return user
+
+    user = User(
+        email=ADMIN_EMAIL,
+        full_name="Benchmark Admin",
+        password_hash=hash_password(ADMIN_PASSWORD),
+        role=UserRole.ADMIN,
+        is_active=True,
+        is_verified=True,
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def seed_restaurant(db, tag: str, index: int, args, rng: random.Random) -> dict:
+    restaurant = Restaurant(
+        name=f"Bench {tag} Restaurant {index}",
+        slug=f"bench-{tag}-restaurant-{index}",
+        address=f"{index} Benchmark Road",
+        phone="9000000000",
+        email=f"restaurant-{index}@bench.local",
+        timezone="Asia/Kolkata",
+        currency="INR",
+        is_active=True,
+    )
+    db.add(restaurant)
+    db.flush()
+
+    category_ids = db.execute(
+        insert(MenuCategory).returning(MenuCategory.id),
+        [
+            {
+                "restaurant_id": restaurant.id,
+                "name": f"Category {c}",
+                "display_order": c,
+                "is_active": True,
+                "is_global": False,
+            }
+            for c in range(args.categories)
+        ],
+    ).scalars().all()
+
+    item_rows = []
+    for i in range(args.items):
+        windowed = rng.random() < args.windowed_ratio
+        start = rng.randrange(0, 24)
+        item_rows.append({
+            "restaurant_id": restaurant.id,
+            "category_id": category_ids[i % len(category_ids)],
+            "name": f"Item {i} {rng.choice(['Tikka', 'Masala', 'Biryani', 'Dosa', 'Curry'])}",
+            "description": "Benchmark dish with a reasonably long description",
+            "price": Decimal(rng.randrange(50, 900)),
+            "is_available": rng.random() > 0.05,
+            "is_vegetarian": rng.random() < 0.5,
+            "available_from": clock(start) if windowed else None,
+            "available_to": clock((start + 6) % 24) if windowed else None,
+        })
+
+    item_ids = db.execute(
+        insert(MenuItem).returning(MenuItem.id), item_rows
+    ).scalars().all()
+
+    variant_rows = [
+        {
+            "item_id": item_id,
+            "name": VARIANT_NAMES[v],
+            "price_adjustment": Decimal(v * 40),
+            "is_default": v == 0,
+        }
+        for item_id in item_ids
+        for v in range(args.variants)
+    ]
+    if variant_rows:
+        db.execute(insert(MenuItemVariant), variant_rows)
+
+    db.commit()
+
+    return {
+        "id": restaurant.id,
+        "category_ids": list(category_ids),
+        "item_ids": list(item_ids),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed benchmark data")
+    parser.add_argument("--restaurants", type=int, default=20)
+    parser.add_argument("--categories", type=int, default=8)
+    parser.add_argument("--items", type=int, default=300, help="items per restaurant")
+    parser.add_argument("--variants", type=int, default=3, help="variants per item (max 5)")
+    parser.add_argument("--windowed-ratio", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--manifest", default="benchmarks/manifest.json")
+    args = parser.parse_args()
+
+    args.variants = min(args.variants, len(VARIANT_NAMES))
+    rng = random.Random(args.seed)
+    tag = str(int(time.time()))
+
+    db = SessionLocal()
+    try:
+        admin_id = get_or_create_admin(db).id
+        restaurants = [
+            seed_restaurant(db, tag, i, args, rng)
+            for i in range(args.restaurants)
+        ]
+    finally:
+        db.close()
+
+    bump_restaurant_list_version()
+
+    manifest = {
+        "tag": tag,
+        "admin": {"id": admin_id, "email": ADMIN_EMAIL, "password": ADMIN_PASSWORD},
+        "restaurants": restaurants,
+    }
+    with open(args.manifest, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    print(
+        f"Seeded {len(restaurants)} restaurants x {args.items} items; "
+        f"manifest: {args.manifest}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Shared fixtures for unit tests that run against SQLite.
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.request_metrics import instrument_engine
+from app.db.base import Base
+from app.models.menu_category import MenuCategory
+from app.models.menu_item_variant import MenuItemVariant
+from app.models.menu_items import MenuItem
+from app.models.restaurant import Restaurant
+
+
+@pytest.fixture
+def engine():
+    """
+    In-memory SQLite with the restaurant and menu tables. StaticPool
+    keeps one connection, so every session sees the same database;
+    statements are counted like on the real engines.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            Restaurant.__table__,
+            MenuCategory.__table__,
+            MenuItem.__table__,
+            MenuItemVariant.__table__,
+        ],
+    )
+    instrument_engine(engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
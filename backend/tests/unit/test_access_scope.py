@@ -0,0 +1,135 @@
+"""
+Unit tests for token-embedded restaurant scope (app.core.access_scope).
+"""
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core import access_scope, dependencies
+from app.core.principal_cache import UserPrincipal
+from app.models.user import UserRole
+
+
+def _payload(**overrides):
+    payload = {"sub": "7", "role": "restaurant_admin", "rids": [5, 6], "sv": 3}
+    payload.update(overrides)
+    return payload
+
+
+def _principal(scope_version=3):
+    return UserPrincipal(
+        7, UserRole.RESTAURANT_ADMIN, True, frozenset({6, 5}), scope_version
+    )
+
+
+class TestScopeClaims:
+    """Tests for scope_claims()."""
+
+    def test_embeds_sorted_ids_and_version(self):
+        assert access_scope.scope_claims(_principal()) == {"rids": [5, 6], "sv": 3}
+
+    def test_large_scope_is_not_embedded(self, monkeypatch):
+        monkeypatch.setattr(access_scope.settings, "TOKEN_SCOPE_MAX_RESTAURANTS", 1)
+
+        assert access_scope.scope_claims(_principal()) == {}
+
+
+class TestCheckTokenScope:
+    """Tests for check_token_scope()."""
+
+    def test_current_version_passes(self):
+        access_scope.check_token_scope(_payload(), _principal())
+
+    def test_stale_version_raises(self):
+        with pytest.raises(ValueError):
+            access_scope.check_token_scope(_payload(sv=2), _principal())
+
+    def test_token_without_scope_passes(self):
+        payload = _payload()
+        del payload["sv"]
+
+        access_scope.check_token_scope(payload, _principal())
+
+
+class TestBumpScopeVersion:
+    """Tests for bump_scope_version()."""
+
+    def test_increments_in_the_callers_transaction(self):
+        db = MagicMock()
+
+        access_scope.bump_scope_version(db, 7, None, 8)
+
+        sql = str(db.execute.call_args.args[0])
+        assert "UPDATE users SET scope_version=(users.scope_version +" in sql
+        db.commit.assert_not_called()
+
+    def test_no_users_is_a_no_op(self):
+        db = MagicMock()
+
+        access_scope.bump_scope_version(db)
+
+        db.execute.assert_not_called()
+
+
+class TestInvalidateAccess:
+    """Tests for invalidate_access()."""
+
+    def test_drops_cached_principals(self, monkeypatch):
+        invalidate_user = MagicMock()
+        monkeypatch.setattr(access_scope, "invalidate_user", invalidate_user)
+
+        access_scope.invalidate_access(7, None, 8)
+
+        invalidate_user.assert_called_once_with(7, 8)
+
+    def test_failed_principal_invalidation_is_reported(self, monkeypatch):
+        monkeypatch.setattr(
+            access_scope,
+            "invalidate_user",
+            MagicMock(side_effect=RedisConnectionError()),
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            access_scope.invalidate_access(7)
+
+        assert exc_info.value.status_code == 503
+
+
+class TestGetCurrentUser:
+    """get_current_user() checks the token against the cached principal."""
+
+    @pytest.fixture
+    def principal(self, monkeypatch):
+        holder = {"principal": _principal()}
+        monkeypatch.setattr(dependencies, "decode_access_token", lambda token: _payload())
+        monkeypatch.setattr(
+            dependencies, "get_user_principal", lambda db, uid: holder["principal"]
+        )
+        return holder
+
+    def _call(self):
+        credentials = MagicMock(credentials="token")
+        return dependencies.get_current_user(credentials, MagicMock())
+
+    def test_current_scope_is_authorized(self, principal):
+        assert self._call().restaurant_ids == frozenset({5, 6})
+
+    def test_stale_scope_is_401(self, principal):
+        principal["principal"] = _principal(scope_version=4)
+
+        with pytest.raises(HTTPException) as exc_info:
+            self._call()
+
+        assert exc_info.value.status_code == 401
+
+    def test_deactivated_user_with_current_scope_is_403(self, principal):
+        principal["principal"] = UserPrincipal(
+            7, UserRole.RESTAURANT_ADMIN, False, frozenset({5, 6}), 3
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            self._call()
+
+        assert exc_info.value.status_code == 403
@@ -0,0 +1,173 @@
+"""
+Unit tests for the batched menu item import engine (bulk_import_items_service).
+"""
+import io
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.services import bulk_import_items_service
+
+
+def _row(**overrides) -> dict:
+    row = {"name": "Paneer Tikka", "category_id": "3", "price": "249.00"}
+    row.update(overrides)
+    return row
+
+
+class TestValidateRows:
+    """Tests for validate_rows()."""
+
+    def test_valid_csv_row_is_coerced(self):
+        valid, errors = bulk_import_items_service.validate_rows(
+            [_row(is_vegetarian="true", preparation_time_minutes="")],
+            restaurant_id=5,
+            category_ids={3},
+        )
+
+        assert errors == []
+        index, values = valid[0]
+        assert index == 1
+        assert values["restaurant_id"] == 5
+        assert values["is_vegetarian"] is True
+        assert values["preparation_time_minutes"] is None
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        valid, errors = bulk_import_items_service.validate_rows(
+            [_row(), _row(price="abc"), _row(category_id="99"), {"price": "10"}],
+            restaurant_id=5,
+            category_ids={3},
+        )
+
+        assert [index for index, _ in valid] == [1]
+        assert [e["row"] for e in errors] == [2, 3, 4]
+        assert "price" in errors[0]["error"]
+        assert "Category 99" in errors[1]["error"]
+
+    def test_non_object_json_rows_are_reported(self):
+        valid, errors = bulk_import_items_service.validate_rows(
+            [1, _row(), None, ["a"]],
+            restaurant_id=5,
+            category_ids={3},
+        )
+
+        assert [index for index, _ in valid] == [2]
+        assert [(e["row"], e["error"], e["data"]) for e in errors] == [
+            (1, "row must be an object", 1),
+            (3, "row must be an object", None),
+            (4, "row must be an object", ["a"]),
+        ]
+
+
+class TestInsertBatch:
+    """Tests for insert_batch()."""
+
+    def test_whole_batch_in_one_statement(self):
+        db = MagicMock()
+        batch = [(1, {"name": "a"}), (2, {"name": "b"})]
+
+        errors = bulk_import_items_service.insert_batch(db, batch)
+
+        assert errors == []
+        db.execute.assert_called_once()
+        assert len(db.execute.call_args[0][1]) == 2
+
+    def test_rejected_batch_only_drops_bad_rows(self):
+        def execute(stmt, params):
+            if len(params) > 1 or params[0]["name"] == "bad":
+                raise IntegrityError("stmt", params, Exception("fk violation"))
+
+        db = MagicMock()
+        db.execute.side_effect = execute
+        batch = [(1, {"name": "a"}), (2, {"name": "bad"}), (3, {"name": "c"})]
+
+        errors = bulk_import_items_service.insert_batch(db, batch)
+
+        assert [e["row"] for e in errors] == [2]
+        # 1 batch attempt + 3 row-by-row retries, no full rollback
+        assert db.execute.call_count == 4
+        db.rollback.assert_not_called()
+
+
+class TestIterJsonRows:
+    """Tests for iter_json_rows() (incremental JSON array reader)."""
+
+    def _rows(self, text: str, chunk_size: int = 4) -> list:
+        return list(bulk_import_items_service.iter_json_rows(io.StringIO(text), chunk_size))
+
+    def test_elements_spanning_chunks(self):
+        text = '[ {"name": "Masala Dosa", "price": 120}, {"name": "Idli"} ]'
+        assert self._rows(text) == [{"name": "Masala Dosa", "price": 120}, {"name": "Idli"}]
+
+    def test_number_split_across_chunks(self):
+        assert self._rows("[12345, 6]", chunk_size=3) == [12345, 6]
+
+    def test_empty_array(self):
+        assert self._rows("  [ ]  ") == []
+
+    def test_not_an_array_raises(self):
+        with pytest.raises(ValueError):
+            self._rows('{"name": "Idli"}')
+
+    def test_truncated_array_raises_after_yielding_complete_rows(self):
+        reader = bulk_import_items_service.iter_json_rows(io.StringIO('[{"a": 1}, {"b": '), 4)
+        assert next(reader) == {"a": 1}
+        with pytest.raises(ValueError):
+            next(reader)
+
+
+class TestProcessRowsStreaming:
+    """Tests for process_rows() fed by a lazy row iterator."""
+
+    def test_progress_counters_updated_per_batch(self, monkeypatch):
+        monkeypatch.setattr(bulk_import_items_service, "_allowed_category_ids", lambda db, rid: {3})
+        monkeypatch.setattr(bulk_import_items_service, "bump_menu_version", MagicMock())
+        record_finished = MagicMock()
+        monkeypatch.setattr(
+            bulk_import_items_service.import_queue_service, "record_finished", record_finished
+        )
+        job = MagicMock()
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = job
+        totals = []
+        db.commit.side_effect = lambda: totals.append(job.total_records)
+
+        rows = (_row(name=f"Item {i}") for i in range(5))
+        bulk_import_items_service.process_rows(db, job_id=1, restaurant_id=5, rows=rows, batch_size=2)
+
+        assert totals == [0, 2, 4, 5, 5]
+        assert job.success_count == 5
+        assert job.failed_count == 0
+        assert job.status == "COMPLETED"
+        record_finished.assert_called_once()
+        assert record_finished.call_args.args == ("COMPLETED",)
+        assert record_finished.call_args.kwargs["rows_imported"] == 5
+
+
+class TestProcessRowsRedelivery:
+    """process_rows() on a job whose outcome is already committed."""
+
+    @pytest.mark.parametrize("status", ["COMPLETED", "FAILED"])
+    def test_finished_job_is_not_imported_again(self, monkeypatch, status):
+        insert_batch = MagicMock()
+        monkeypatch.setattr(bulk_import_items_service, "insert_batch", insert_batch)
+        job = MagicMock(status=status, total_records=2, success_count=2)
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = job
+
+        bulk_import_items_service.process_rows(db, 1, 5, iter([_row(), _row()]))
+
+        insert_batch.assert_not_called()
+        db.commit.assert_not_called()
+        assert (job.status, job.success_count) == (status, 2)
+
+    def test_give_up_keeps_a_completed_outcome(self):
+        job = MagicMock(status="COMPLETED", errors=[])
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = job
+
+        bulk_import_items_service.mark_job_failed(db, 1, "Uploaded file not found")
+
+        assert job.status == "COMPLETED"
+        db.commit.assert_not_called()
@@ -0,0 +1,72 @@
+"""
+Unit tests for OTP customer resolution (app.services.customer_service).
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.dialects import postgresql
+
+from app.services import customer_service
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = MagicMock()
+    redis.get = AsyncMock(return_value=None)
+    redis.setex = AsyncMock()
+    monkeypatch.setattr(customer_service, "async_redis_client", redis)
+    return redis
+
+
+def _db(customer_id=7):
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    db.execute.return_value.scalar_one.return_value = customer_id
+    db.commit = AsyncMock()
+    return db
+
+
+class TestResolveCustomerId:
+    """Tests for resolve_customer_id()."""
+
+    def test_cached_customer_needs_no_query(self, redis):
+        redis.get.return_value = "42"
+        db = _db()
+
+        assert asyncio.run(customer_service.resolve_customer_id(db, "9000000000")) == 42
+        redis.get.assert_awaited_once_with("customer:phone:9000000000")
+        db.execute.assert_not_called()
+
+    def test_miss_upserts_once_and_caches(self, redis, monkeypatch):
+        monkeypatch.setattr(customer_service.settings, "CUSTOMER_ID_CACHE_TTL_SECONDS", 60)
+        db = _db(customer_id=7)
+
+        assert asyncio.run(customer_service.resolve_customer_id(db, "9000000000")) == 7
+        db.execute.assert_awaited_once()
+        db.commit.assert_awaited_once()
+        redis.setex.assert_awaited_once_with("customer:phone:9000000000", 60, 7)
+
+    def test_redis_outage_falls_back_to_upsert(self, redis):
+        redis.get.side_effect = RedisConnectionError("down")
+        redis.setex.side_effect = RedisConnectionError("down")
+        db = _db(customer_id=7)
+
+        assert asyncio.run(customer_service.resolve_customer_id(db, "9000000000")) == 7
+        db.execute.assert_awaited_once()
+
+
+class TestUpsertCustomerId:
+    """Tests for upsert_customer_id()."""
+
+    def test_single_insert_on_conflict_returning_id(self):
+        db = _db()
+
+        asyncio.run(customer_service.upsert_customer_id(db, "9000000000"))
+
+        stmt = db.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO customers")
+        assert "ON CONFLICT (phone) DO UPDATE SET phone = excluded.phone" in sql
+        assert sql.endswith("RETURNING customers.id")
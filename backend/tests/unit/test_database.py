@@ -0,0 +1,88 @@
+"""
+Unit tests for engine pool profiles (app.core.database).
+"""
+import pytest
+from sqlalchemy.pool import NullPool
+
+from app.core import database
+from app.core.database import PoolConfig, engine_options, pool_config
+from app.core.metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool
+
+
+@pytest.fixture
+def db_settings(monkeypatch):
+    for name in (
+        "DB_POOL_SIZE",
+        "DB_MAX_OVERFLOW",
+        "DB_POOL_TIMEOUT_SECONDS",
+        "DB_POOL_RECYCLE_SECONDS",
+        "DB_POOL_PRE_PING",
+        "DB_STATEMENT_CACHE_SIZE",
+    ):
+        monkeypatch.setattr(database.settings, name, None)
+    monkeypatch.setattr(database.settings, "DB_POOL_PROFILE", "api")
+    monkeypatch.setattr(database.settings, "DB_PGBOUNCER_TRANSACTION_MODE", False)
+    monkeypatch.setattr(database.settings, "DB_ECHO", False)
+    return database.settings
+
+
+class TestPoolConfig:
+    """Tests for pool_config()."""
+
+    def test_profile_defaults(self, db_settings):
+        assert pool_config() == database.POOL_PROFILES["api"]
+
+    def test_settings_override_profile(self, db_settings):
+        db_settings.DB_POOL_PROFILE = "worker"
+        db_settings.DB_POOL_SIZE = 3
+        db_settings.DB_POOL_PRE_PING = False
+
+        config = pool_config()
+
+        assert config.pool_size == 3
+        assert config.pool_pre_ping is False
+        assert config.max_overflow == database.POOL_PROFILES["worker"].max_overflow
+
+    def test_pgbouncer_mode_disables_pooling_and_statement_caches(self, db_settings):
+        db_settings.DB_PGBOUNCER_TRANSACTION_MODE = True
+        db_settings.DB_STATEMENT_CACHE_SIZE = 500
+
+        config = pool_config()
+
+        assert config.null_pool is True
+        assert config.statement_cache_size == 0
+
+    def test_unknown_profile(self, db_settings):
+        db_settings.DB_POOL_PROFILE = "batch"
+
+        with pytest.raises(ValueError, match="Unknown DB_POOL_PROFILE"):
+            pool_config()
+
+
+class TestEngineOptions:
+    """Tests for engine_options()."""
+
+    def test_queue_pool(self, db_settings):
+        options = engine_options(PoolConfig(pool_size=5, max_overflow=1), is_async=False)
+
+        assert options["poolclass"] is TimedQueuePool
+        assert options["pool_size"] == 5
+        assert options["max_overflow"] == 1
+        assert options["echo"] is False
+        assert "connect_args" not in options
+
+    def test_async_statement_cache(self, db_settings):
+        options = engine_options(PoolConfig(statement_cache_size=0), is_async=True)
+
+        assert options["poolclass"] is TimedAsyncAdaptedQueuePool
+        assert options["connect_args"] == {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+        }
+
+    def test_null_pool_takes_no_sizing(self, db_settings):
+        options = engine_options(PoolConfig(null_pool=True), is_async=False)
+
+        assert options["poolclass"] is NullPool
+        assert "pool_size" not in options
+        assert "max_overflow" not in options
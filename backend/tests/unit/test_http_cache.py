@@ -0,0 +1,31 @@
+"""
+Unit tests for ETag helpers (app.core.http_cache).
+"""
+from app.core import http_cache
+
+
+class TestEtagMatches:
+    """Tests for etag_matches()."""
+
+    def test_matches_in_list_and_weak_form(self):
+        etag = http_cache.make_etag("menu-items", 7, 3)
+
+        assert http_cache.etag_matches(f'"other", W/{etag}', etag)
+        assert http_cache.etag_matches("*", etag)
+
+    def test_missing_or_different_tag(self):
+        etag = http_cache.make_etag("menu-items", 7, 3)
+
+        assert not http_cache.etag_matches(None, etag)
+        assert not http_cache.etag_matches(http_cache.make_etag("menu-items", 7, 4), etag)
+
+
+class TestNotModified:
+    """Tests for not_modified()."""
+
+    def test_304_carries_validators(self):
+        response = http_cache.not_modified('"abc"', http_cache.PUBLIC_MENU_CACHE_CONTROL)
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == '"abc"'
+        assert response.headers["cache-control"] == http_cache.PUBLIC_MENU_CACHE_CONTROL
@@ -0,0 +1,109 @@
+"""
+Unit tests for the out-of-process menu import worker (app.workers.import_worker).
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.workers import import_worker
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    queue = MagicMock()
+    monkeypatch.setattr(import_worker, "import_queue_service", queue)
+    return queue
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = MagicMock()
+    service.is_job_finished.return_value = False
+    monkeypatch.setattr(import_worker, "bulk_import_items_service", service)
+    monkeypatch.setattr(import_worker, "SessionLocal", MagicMock())
+    return service
+
+
+@pytest.fixture
+def upload(tmp_path):
+    path = tmp_path / "menu.csv"
+    path.write_text("name,category_id,price\n")
+    return path
+
+
+def _payload(path, attempts=0) -> dict:
+    return {
+        "job_id": 42,
+        "restaurant_id": 7,
+        "file_type": "csv",
+        "path": str(path),
+        "attempts": attempts,
+    }
+
+
+class TestHandle:
+    """Tests for ImportWorker._handle()."""
+
+    def test_successful_job_is_acked(self, queue, service, upload):
+        worker = import_worker.ImportWorker(concurrency=1, max_retries=2)
+
+        worker._handle("raw", _payload(upload))
+
+        service.run_import_job.assert_called_once_with(42, 7, "csv", str(upload))
+        queue.ack.assert_called_once_with("raw", 42)
+        queue.retry.assert_not_called()
+        assert not upload.exists()
+
+    def test_redelivered_finished_job_is_only_acked(self, queue, service, upload):
+        service.is_job_finished.return_value = True
+        worker = import_worker.ImportWorker(concurrency=1, max_retries=2)
+
+        worker._handle("raw", _payload(upload, attempts=1))
+
+        service.run_import_job.assert_not_called()
+        service.mark_job_failed.assert_not_called()
+        queue.ack.assert_called_once_with("raw", 42)
+        assert not upload.exists()
+
+    def test_crashed_job_is_retried(self, queue, service, upload):
+        service.run_import_job.side_effect = RuntimeError("db went away")
+        worker = import_worker.ImportWorker(concurrency=1, max_retries=2)
+
+        worker._handle("raw", _payload(upload))
+
+        queue.retry.assert_called_once_with("raw", _payload(upload))
+        queue.ack.assert_not_called()
+        assert upload.exists()
+
+    def test_job_over_retry_budget_is_failed(self, queue, service, upload):
+        worker = import_worker.ImportWorker(concurrency=1, max_retries=2)
+
+        worker._handle("raw", _payload(upload, attempts=3))
+
+        service.run_import_job.assert_not_called()
+        service.mark_job_failed.assert_called_once()
+        queue.ack.assert_called_once_with("raw", 42)
+        assert not upload.exists()
+
+
+class TestConsume:
+    """Tests for ImportWorker._consume()."""
+
+    def test_handling_error_keeps_consuming(self, queue, service, upload, monkeypatch):
+        worker = import_worker.ImportWorker(concurrency=1, poll_interval=0)
+        queue.reserve.side_effect = [("raw", _payload(upload)), None]
+        service.is_job_finished.side_effect = RuntimeError("db went away")
+        waits = []
+
+        def wait(timeout):
+            waits.append(timeout)
+            if len(waits) == 2:
+                worker.stop()
+
+        monkeypatch.setattr(worker._stop, "wait", wait)
+
+        worker._consume()
+
+        assert queue.reserve.call_count == 2
+        queue.ack.assert_not_called()
+        queue.retry.assert_not_called()
@@ -0,0 +1,123 @@
+"""
+Unit tests for the compiled availability index (app.services.menu_availability_service).
+"""
+from datetime import time
+
+import pytest
+
+from app.services import menu_availability_service, menu_snapshot_service
+from app.services.menu_availability_service import (
+    AvailabilityIndex,
+    AvailabilityIndexCache,
+)
+
+
+ITEMS = [
+    {"id": 1, "is_available": True, "available_from": None, "available_to": None},
+    {"id": 2, "is_available": True, "available_from": "10:00:00", "available_to": "14:00:00"},
+    {"id": 3, "is_available": True, "available_from": "22:00:00", "available_to": "02:00:00"},
+    {"id": 4, "is_available": False, "available_from": None, "available_to": None},
+    {"id": 5, "is_available": True, "available_from": "13:30:00", "available_to": "23:59:00"},
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_indexes(monkeypatch):
+    monkeypatch.setattr(menu_availability_service, "_indexes", AvailabilityIndexCache())
+
+
+class TestItemIntervals:
+    """Tests for item_intervals()."""
+
+    def test_overnight_window_is_split_at_midnight(self):
+        assert menu_availability_service.item_intervals(ITEMS[2]) == [(79200, 86400), (0, 7201)]
+
+    def test_unavailable_item_has_no_intervals(self):
+        assert menu_availability_service.item_intervals(ITEMS[3]) == []
+
+
+class TestAvailabilityIndex:
+    """Tests for AvailabilityIndex.available_ids()."""
+
+    def test_matches_row_predicate_for_every_minute(self):
+        index = AvailabilityIndex(ITEMS)
+
+        for minute in range(24 * 60):
+            at = time(minute // 60, minute % 60)
+            expected = {
+                i["id"] for i in ITEMS if menu_snapshot_service.is_available_at(i, at)
+            }
+            assert index.available_ids(at) == expected, at
+
+    def test_window_edges_match_row_predicate_to_the_second(self):
+        index = AvailabilityIndex(ITEMS)
+
+        for at in (time(9, 59, 59), time(10, 0), time(14, 0), time(14, 0, 0, 500000),
+                   time(14, 0, 1), time(14, 0, 30), time(2, 0), time(2, 0, 1)):
+            expected = {
+                i["id"] for i in ITEMS if menu_snapshot_service.is_available_at(i, at)
+            }
+            assert index.available_ids(at) == expected, at
+
+    def test_end_is_inclusive_only_to_the_second(self):
+        index = AvailabilityIndex(ITEMS)
+
+        assert 2 in index.available_ids(time(14, 0, 0, 999999))
+        assert 2 not in index.available_ids(time(14, 0, 30))
+
+    def test_empty_menu(self):
+        assert AvailabilityIndex([]).available_ids(time(12, 0)) == frozenset()
+
+
+class TestGetIndex:
+    """Tests for get_index() per-version caching."""
+
+    def test_reused_until_version_changes(self):
+        snapshot = {"restaurant_id": 7, "version": 1, "items": ITEMS}
+
+        first = menu_availability_service.get_index(snapshot)
+        assert menu_availability_service.get_index(snapshot) is first
+
+        bumped = {**snapshot, "version": 2}
+        assert menu_availability_service.get_index(bumped) is not first
+
+    def test_least_recently_used_restaurant_is_evicted(self, monkeypatch):
+        monkeypatch.setattr(
+            menu_availability_service, "_indexes", AvailabilityIndexCache(maxsize=2)
+        )
+        for restaurant_id in (1, 2):
+            menu_availability_service.get_index(
+                {"restaurant_id": restaurant_id, "version": 1, "items": ITEMS}
+            )
+        menu_availability_service.cached_index(1, 1)
+
+        menu_availability_service.get_index({"restaurant_id": 3, "version": 1, "items": ITEMS})
+
+        assert menu_availability_service.cached_index(1, 1) is not None
+        assert menu_availability_service.cached_index(2, 1) is None
+        assert menu_availability_service.cached_index(3, 1) is not None
+
+
+class TestAvailableItems:
+    """Tests for available_items()."""
+
+    def test_explicit_time(self):
+        snapshot = {"restaurant_id": 7, "version": 1, "items": ITEMS}
+
+        result = menu_availability_service.available_items(snapshot, time(23, 0))
+
+        assert [i["id"] for i in result] == [1, 3, 5]
+
+    def test_now_uses_restaurant_timezone(self, monkeypatch):
+        seen = []
+        monkeypatch.setattr(
+            menu_availability_service,
+            "restaurant_local_time",
+            lambda tz: seen.append(tz) or time(12, 0),
+        )
+        snapshot = {"timezone": "Asia/Kolkata", "items": ITEMS}
+
+        result = menu_availability_service.available_items(snapshot)
+
+        assert seen == ["Asia/Kolkata"]
+        assert [i["id"] for i in result] == [1, 2]
@@ -0,0 +1,112 @@
+"""
+Unit tests for GET /restaurants/{id}/menu-categories/ (ETag and
+pre-encoded body reuse).
+"""
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.api.v1.endpoints import menu_category
+from app.core.database import get_async_db
+from app.core.dependencies import check_restaurant_access
+from app.core.responses import EncodedBodyCache
+
+ROWS = [
+    {
+        "id": 1,
+        "restaurant_id": 1,
+        "name": "Mains",
+        "description": None,
+        "display_order": 0,
+        "is_active": True,
+        "is_global": False,
+        "created_at": "2026-01-05T08:42:01",
+        "updated_at": "2026-01-05T08:42:01",
+    },
+]
+
+
+@pytest.fixture
+def list_rows(monkeypatch):
+    mock = AsyncMock(return_value=ROWS)
+    monkeypatch.setattr(menu_category.menu_category_service, "list_rows_async", mock)
+    return mock
+
+
+@pytest.fixture
+def version(monkeypatch):
+    mock = AsyncMock(return_value=3)
+    monkeypatch.setattr(menu_category, "get_menu_version_async", mock)
+    return mock
+
+
+@pytest.fixture
+def client(monkeypatch, list_rows, version):
+    monkeypatch.setattr(menu_category, "encoded_bodies", EncodedBodyCache(maxsize=8))
+
+    async def no_db():
+        yield None
+
+    app = FastAPI()
+    app.include_router(menu_category.router)
+    app.dependency_overrides[get_async_db] = no_db
+    app.dependency_overrides[check_restaurant_access] = lambda: None
+    return TestClient(app)
+
+
+URL = "/restaurants/1/menu-categories/"
+
+
+class TestListMenuCategories:
+    """Tests for list_menu_categories()."""
+
+    def test_first_request_lists_and_tags(self, client, list_rows):
+        response = client.get(URL)
+
+        assert response.status_code == 200
+        assert response.json() == ROWS
+        assert response.headers["ETag"]
+        list_rows.assert_awaited_once()
+
+    def test_matching_etag_is_304_without_db(self, client, list_rows):
+        etag = client.get(URL).headers["ETag"]
+        list_rows.reset_mock()
+
+        response = client.get(URL, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        list_rows.assert_not_awaited()
+
+    def test_cached_body_is_reused_without_db(self, client, list_rows):
+        first = client.get(URL)
+        list_rows.reset_mock()
+
+        second = client.get(URL)
+
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert second.headers["ETag"] == first.headers["ETag"]
+        list_rows.assert_not_awaited()
+
+    def test_new_version_is_listed_again(self, client, list_rows, version):
+        etag = client.get(URL).headers["ETag"]
+        version.return_value = 4
+
+        response = client.get(URL, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert list_rows.await_count == 2
+
+    def test_redis_down_serves_untagged(self, client, list_rows, version):
+        version.side_effect = RedisConnectionError()
+
+        response = client.get(URL)
+
+        assert response.status_code == 200
+        assert response.json() == ROWS
+        assert "ETag" not in response.headers
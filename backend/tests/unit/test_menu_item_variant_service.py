@@ -0,0 +1,153 @@
+"""
+Unit tests for batched variant loading (menu_item_variant_service) and the
+query count of the menu-with-variants read paths, run on SQLite.
+"""
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.endpoints import menu_items
+from app.core import request_metrics
+from app.core.database import get_db
+from app.core.request_metrics import RequestMetricsMiddleware, RequestStats
+from app.models.menu_category import MenuCategory
+from app.models.menu_item_variant import MenuItemVariant
+from app.models.menu_items import MenuItem
+from app.models.restaurant import Restaurant
+from app.services import menu_item_variant_service, menu_snapshot_service
+
+
+def _seed(engine, items: int) -> None:
+    session = sessionmaker(bind=engine)()
+    session.add(Restaurant(id=1, name="Spice Route", slug="spice-route"))
+    session.add(MenuCategory(id=1, restaurant_id=1, name="Mains"))
+    for item_id in range(1, items + 1):
+        session.add(MenuItem(
+            id=item_id,
+            restaurant_id=1,
+            category_id=1,
+            name=f"Item {item_id:03d}",
+            price=Decimal("100.00"),
+            is_available=True,
+            is_vegetarian=False,
+        ))
+        # Item 1 has no variants; the others have two, inserted out of order
+        if item_id > 1:
+            session.add(MenuItemVariant(item_id=item_id, name="Large", price_adjustment=Decimal("40")))
+            session.add(MenuItemVariant(item_id=item_id, name="Regular", price_adjustment=Decimal("0")))
+    session.commit()
+    session.close()
+
+
+def _count_queries(fn) -> int:
+    stats = RequestStats()
+    token = request_metrics._current.set(stats)
+    try:
+        fn()
+    finally:
+        request_metrics._current.reset(token)
+    return stats.queries
+
+
+class TestListVariantsForItems:
+    """Tests for list_variants_for_items()."""
+
+    def test_groups_by_item_in_price_order(self, engine):
+        _seed(engine, items=3)
+        db = sessionmaker(bind=engine)()
+
+        grouped = menu_item_variant_service.list_variants_for_items(db, [1, 2, 3])
+
+        assert list(grouped) == [1, 2, 3]
+        assert grouped[1] == []
+        assert [v.name for v in grouped[2]] == ["Regular", "Large"]
+
+    def test_one_query_for_any_number_of_items(self, engine):
+        _seed(engine, items=40)
+        db = sessionmaker(bind=engine)()
+
+        queries = _count_queries(
+            lambda: menu_item_variant_service.list_variants_for_items(db, range(1, 41))
+        )
+
+        assert queries == 1
+
+    def test_no_items_no_query(self, engine):
+        db = sessionmaker(bind=engine)()
+
+        assert _count_queries(
+            lambda: menu_item_variant_service.list_variants_for_items(db, [])
+        ) == 0
+
+
+class TestBuildSnapshotQueryCount:
+    """build_snapshot() loads variants in one batch."""
+
+    @pytest.mark.parametrize("items", [3, 30])
+    def test_constant_number_of_queries(self, engine, items):
+        _seed(engine, items=items)
+        db = sessionmaker(bind=engine)()
+
+        queries = _count_queries(
+            lambda: menu_snapshot_service.build_snapshot(db, restaurant_id=1, version=1)
+        )
+
+        # categories, items, variants, timezone
+        assert queries == 4
+
+
+class TestMenuListWithVariants:
+    """GET /menu-items/?include=variants on the Postgres fallback path."""
+
+    @pytest.fixture
+    def client(self, engine, monkeypatch):
+        def redis_down(db, restaurant_id):
+            raise RedisConnectionError()
+
+        monkeypatch.setattr(menu_snapshot_service, "get_snapshot", redis_down)
+        monkeypatch.setattr(menu_snapshot_service, "current_menu_version", lambda rid: None)
+
+        app = FastAPI()
+        app.add_middleware(RequestMetricsMiddleware)
+        app.include_router(menu_items.router)
+        session_factory = sessionmaker(bind=engine)
+
+        def override_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override_db
+        return TestClient(app)
+
+    def _get(self, client):
+        response = client.get(
+            "/restaurants/1/menu-items/",
+            params={"available_now": "false", "include": "variants"},
+        )
+        assert response.status_code == 200
+        return response
+
+    def test_embeds_variants(self, engine, client):
+        _seed(engine, items=3)
+
+        items = self._get(client).json()
+
+        assert [i["id"] for i in items] == [1, 2, 3]
+        assert items[0]["variants"] == []
+        assert [v["name"] for v in items[1]["variants"]] == ["Regular", "Large"]
+
+    @pytest.mark.parametrize("items", [3, 30])
+    def test_query_count_does_not_grow_with_menu(self, engine, client, items):
+        _seed(engine, items=items)
+
+        timing = self._get(client).headers["Server-Timing"]
+
+        # items, variants
+        assert 'desc="2 queries"' in timing
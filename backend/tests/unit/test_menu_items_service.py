@@ -0,0 +1,178 @@
+"""
+Unit tests for menu item writes (app.services.menu_items_service).
+"""
+from datetime import time
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from app.core import request_metrics
+from app.core.database import SessionLocal
+from app.core.request_metrics import RequestStats
+from app.models.menu_category import MenuCategory
+from app.models.menu_items import MenuItem
+from app.models.restaurant import Restaurant
+from app.schemas.menu_items_schema import MenuItemBatchRequest, MenuItemBatchUpdate
+from app.services import menu_items_service
+
+
+@pytest.fixture
+def db(db):
+    db.add_all([
+        Restaurant(id=1, name="Spice Route", slug="spice-route"),
+        Restaurant(id=2, name="Other", slug="other"),
+        MenuCategory(id=1, restaurant_id=1, name="Mains"),
+        MenuCategory(id=2, restaurant_id=1, name="Desserts"),
+        MenuCategory(id=3, restaurant_id=2, name="Elsewhere"),
+    ])
+    for item_id, restaurant_id in ((1, 1), (2, 1), (3, 2)):
+        db.add(MenuItem(
+            id=item_id,
+            restaurant_id=restaurant_id,
+            category_id=1,
+            name=f"Item {item_id}",
+            price=Decimal("100.00"),
+            is_available=True,
+            is_vegetarian=False,
+            available_from=time(10, 0),
+            available_to=time(14, 0),
+        ))
+    db.commit()
+    return db
+
+
+@pytest.fixture
+def bumps(monkeypatch):
+    calls = []
+    monkeypatch.setattr(menu_items_service, "bump_menu_version", lambda *ids: calls.append(ids))
+    return calls
+
+
+def _updates(*items):
+    return MenuItemBatchRequest(items=list(items)).items
+
+
+class TestWriteWithoutRefresh:
+    """Writes return the object without reloading it after commit."""
+
+    def test_session_keeps_state_after_commit(self):
+        assert SessionLocal.kw["expire_on_commit"] is False
+
+    def test_availability_toggle_is_one_statement(self, engine, db, bumps):
+        session = sessionmaker(bind=engine, expire_on_commit=False)()
+        item = session.get(MenuItem, 1)
+        stats = RequestStats()
+        token = request_metrics._current.set(stats)
+        try:
+            menu_items_service.update_menu_item_availability(session, item, is_available=False)
+            assert item.is_available is False
+            assert item.updated_at is not None
+        finally:
+            request_metrics._current.reset(token)
+            session.close()
+
+        # The UPDATE only; no SELECT after commit
+        assert stats.queries == 1
+
+
+class TestCurrentlyAvailableClause:
+    """currently_available_clause() compares in whole seconds."""
+
+    def test_window_end_is_inclusive_to_the_second(self, db):
+        def available(at):
+            return [i.id for i in menu_items_service.list_menu_items(db, 1, at=at)]
+
+        assert available(time(14, 0)) == [1, 2]
+        assert available(time(14, 0, 0, 500000)) == [1, 2]
+        assert available(time(14, 0, 30)) == []
+
+
+class TestMenuItemBatchRequest:
+    """Validation of batch update payloads."""
+
+    def test_timing_must_be_set_as_a_pair(self):
+        with pytest.raises(ValidationError, match="set together"):
+            MenuItemBatchUpdate(id=1, available_from=None)
+
+    def test_empty_update_rejected(self):
+        with pytest.raises(ValidationError, match="Nothing to update"):
+            MenuItemBatchUpdate(id=1)
+
+    def test_only_null_fields_rejected(self):
+        with pytest.raises(ValidationError, match="Nothing to update"):
+            MenuItemBatchUpdate(id=1, price=None, is_available=None)
+
+    def test_clearing_timing_is_an_update(self):
+        update = MenuItemBatchUpdate(id=1, available_from=None, available_to=None)
+
+        assert update.sets_timing
+
+    def test_duplicate_ids_rejected(self):
+        with pytest.raises(ValidationError, match="only once"):
+            MenuItemBatchRequest(items=[
+                {"id": 1, "is_available": False},
+                {"id": 1, "price": "5.00"},
+            ])
+
+
+class TestBatchUpdateMenuItems:
+    """Tests for batch_update_menu_items()."""
+
+    def test_applies_partial_updates(self, db, bumps):
+        updated = menu_items_service.batch_update_menu_items(db, 1, _updates(
+            MenuItemBatchUpdate(id=1, is_available=False),
+            MenuItemBatchUpdate(id=2, price=Decimal("80.00"), category_id=2,
+                                available_from=None, available_to=None),
+        ))
+
+        assert updated == [1, 2]
+        first, second = db.get(MenuItem, 1), db.get(MenuItem, 2)
+        assert first.is_available is False
+        assert first.price == Decimal("100.00")
+        assert first.available_from == time(10, 0)
+        assert second.is_available is True
+        assert second.price == Decimal("80.00")
+        assert second.category_id == 2
+        assert second.available_from is None and second.available_to is None
+        assert bumps == [(1,)]
+
+    def test_other_restaurants_item_rolls_back_everything(self, db, bumps):
+        with pytest.raises(HTTPException) as exc:
+            menu_items_service.batch_update_menu_items(db, 1, _updates(
+                MenuItemBatchUpdate(id=1, is_available=False),
+                MenuItemBatchUpdate(id=3, is_available=False),
+            ))
+
+        assert exc.value.status_code == 404
+        assert "[3]" in exc.value.detail
+        assert db.get(MenuItem, 1).is_available is True
+        assert bumps == []
+
+    def test_foreign_category_rejected(self, db, bumps):
+        with pytest.raises(HTTPException) as exc:
+            menu_items_service.batch_update_menu_items(db, 1, _updates(
+                MenuItemBatchUpdate(id=1, category_id=3),
+            ))
+
+        assert exc.value.status_code == 400
+        assert bumps == []
+
+
+class TestBatchUpdateStatement:
+    """batch_update_statement() on PostgreSQL."""
+
+    def test_single_update_from_values(self):
+        stmt = menu_items_service.batch_update_statement(1, _updates(
+            MenuItemBatchUpdate(id=1, is_available=False),
+            MenuItemBatchUpdate(id=2, available_from=time(9, 0), available_to=time(11, 0)),
+        ))
+
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert sql.count("UPDATE menu_items") == 1
+        assert "FROM (VALUES" in sql
+        assert "RETURNING menu_items.id" in sql
@@ -0,0 +1,105 @@
+"""
+Unit tests for menu item search (app.services.menu_search_service),
+run on SQLite through the in-process trigram fallback.
+"""
+from datetime import time
+from decimal import Decimal
+
+import pytest
+
+from app.models.menu_category import MenuCategory
+from app.models.menu_items import MenuItem
+from app.models.restaurant import Restaurant
+from app.services import menu_search_service
+
+
+@pytest.fixture
+def db(db):
+    db.add(Restaurant(id=1, name="Spice Route", slug="spice-route"))
+    db.add(Restaurant(id=2, name="Other", slug="other"))
+    db.add(MenuCategory(id=1, restaurant_id=1, name="Mains"))
+    for item_id, restaurant_id, name, description, available in [
+        (1, 1, "Paneer Tikka", "Char-grilled cottage cheese", True),
+        (2, 1, "Paneer Butter Masala", "Creamy tomato gravy", True),
+        (3, 1, "Chicken Biryani", "Dum-cooked rice with paneer raita", True),
+        (4, 1, "Paneer Paratha", None, False),
+        (5, 2, "Paneer Tikka", None, True),
+    ]:
+        db.add(MenuItem(
+            id=item_id,
+            restaurant_id=restaurant_id,
+            category_id=1,
+            name=name,
+            description=description,
+            price=Decimal("100.00"),
+            is_available=available,
+            is_vegetarian=False,
+        ))
+    db.add(MenuItem(
+        id=6,
+        restaurant_id=1,
+        category_id=1,
+        name="Masala Dosa",
+        price=Decimal("80.00"),
+        is_available=True,
+        is_vegetarian=True,
+        available_from=time(7, 0),
+        available_to=time(11, 0),
+    ))
+    db.commit()
+
+    return db
+
+
+class TestTrigrams:
+    """Tests for trigrams() / similarity()."""
+
+    def test_matches_pg_trgm_padding(self):
+        assert menu_search_service.trigrams("Cat") == {"  c", " ca", "cat", "at "}
+
+    def test_identical_text_scores_one(self):
+        grams = menu_search_service.trigrams("paneer tikka")
+
+        assert menu_search_service.similarity(grams, grams) == 1.0
+
+
+class TestSearchMenuItems:
+    """Tests for search_menu_items()."""
+
+    def test_ranks_closest_name_first(self, db):
+        results = menu_search_service.search_menu_items(db, 1, "paneer")
+
+        assert [item.id for item, _ in results] == [1, 2, 3]
+        assert results[0][1] > results[1][1] > results[2][1]
+
+    def test_tolerates_typos(self, db):
+        results = menu_search_service.search_menu_items(db, 1, "paner tikka")
+
+        assert [item.id for item, _ in results] == [1]
+
+    def test_matches_description_and_scopes_to_restaurant(self, db):
+        results = menu_search_service.search_menu_items(db, 1, "raita")
+
+        assert [item.id for item, _ in results] == [3]
+
+    def test_excludes_unavailable_items_by_default(self, db):
+        ids = {item.id for item, _ in menu_search_service.search_menu_items(db, 1, "paratha")}
+        all_ids = {
+            item.id
+            for item, _ in menu_search_service.search_menu_items(
+                db, 1, "paratha", available_only=False
+            )
+        }
+
+        assert 4 not in ids
+        assert 4 in all_ids
+
+    def test_available_only_applies_time_windows(self, db):
+        def ids(at):
+            return [
+                item.id
+                for item, _ in menu_search_service.search_menu_items(db, 1, "dosa", at=at)
+            ]
+
+        assert ids(time(9, 0)) == [6]
+        assert ids(time(11, 0, 30)) == []
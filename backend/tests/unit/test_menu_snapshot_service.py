@@ -0,0 +1,254 @@
+"""
+Unit tests for the compiled public menu snapshot (menu_snapshot_service / menu_version_service).
+"""
+from datetime import time
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.api.v1.endpoints import menu_items
+from app.core.database import get_db
+from app.core.responses import EncodedBodyCache
+from app.services import menu_snapshot_service, menu_version_service
+
+
+def _item(**overrides) -> dict:
+    item = {
+        "id": 1,
+        "category_id": 10,
+        "name": "Dosa",
+        "is_available": True,
+        "available_from": None,
+        "available_to": None,
+    }
+    item.update(overrides)
+    return item
+
+
+class TestIsAvailableAt:
+    """Tests for is_available_at()."""
+
+    def test_all_day_item_is_available(self):
+        assert menu_snapshot_service.is_available_at(_item(), time(3, 0)) is True
+
+    def test_unavailable_item_is_hidden(self):
+        item = _item(is_available=False)
+        assert menu_snapshot_service.is_available_at(item, time(12, 0)) is False
+
+    def test_normal_window(self):
+        item = _item(available_from="10:00:00", available_to="14:00:00")
+        assert menu_snapshot_service.is_available_at(item, time(12, 0)) is True
+        assert menu_snapshot_service.is_available_at(item, time(15, 0)) is False
+
+    def test_overnight_window(self):
+        item = _item(available_from="22:00:00", available_to="02:00:00")
+        assert menu_snapshot_service.is_available_at(item, time(23, 30)) is True
+        assert menu_snapshot_service.is_available_at(item, time(1, 0)) is True
+        assert menu_snapshot_service.is_available_at(item, time(12, 0)) is False
+
+
+class TestFilterItems:
+    """Tests for filter_items()."""
+
+    def test_filters_by_category(self):
+        snapshot = {"items": [_item(id=1, category_id=10), _item(id=2, category_id=20)]}
+        result = menu_snapshot_service.filter_items(snapshot, category_id=20)
+        assert [i["id"] for i in result] == [2]
+
+    def test_all_items_when_not_filtering_availability(self):
+        snapshot = {"items": [_item(id=1), _item(id=2, is_available=False)]}
+        result = menu_snapshot_service.filter_items(
+            snapshot, only_currently_available=False
+        )
+        assert [i["id"] for i in result] == [1, 2]
+
+
+class TestBumpMenuVersion:
+    """Tests for bump_menu_version()."""
+
+    @pytest.fixture(autouse=True)
+    def timers(self, monkeypatch):
+        started = []
+
+        class FakeTimer:
+            def __init__(self, interval, fn):
+                self.fn = fn
+                self.daemon = False
+
+            def start(self):
+                started.append(self)
+
+        monkeypatch.setattr(menu_version_service.threading, "Timer", FakeTimer)
+        monkeypatch.setattr(menu_version_service, "_pending", set())
+        monkeypatch.setattr(menu_version_service, "_retry_timer", None)
+        return started
+
+    def test_increments_version_and_drops_snapshot(self, monkeypatch):
+        client = MagicMock()
+        pipe = client.pipeline.return_value
+        monkeypatch.setattr(menu_version_service, "redis_client", client)
+
+        menu_version_service.bump_menu_version(7, None, 7)
+
+        client.pipeline.assert_called_once_with(transaction=True)
+        pipe.incr.assert_called_once_with("menu:version:7")
+        pipe.delete.assert_called_once_with("menu:snapshot:7")
+        pipe.execute.assert_called_once()
+
+    def test_redis_outage_does_not_raise(self, monkeypatch):
+        client = MagicMock()
+        client.pipeline.return_value.execute.side_effect = RedisConnectionError()
+        monkeypatch.setattr(menu_version_service, "redis_client", client)
+
+        menu_version_service.bump_menu_version(7)
+
+    def test_failed_bump_is_counted_and_retried(self, monkeypatch, timers):
+        client = MagicMock()
+        pipe = client.pipeline.return_value
+        pipe.execute.side_effect = [RedisConnectionError(), None]
+        monkeypatch.setattr(menu_version_service, "redis_client", client)
+        failures = MagicMock()
+        monkeypatch.setattr(menu_version_service, "MENU_VERSION_BUMP_FAILURES", failures)
+
+        menu_version_service.bump_menu_version(7)
+
+        failures.inc.assert_called_once()
+        assert menu_version_service._pending == {7}
+        assert len(timers) == 1
+
+        pipe.reset_mock()
+        timers[0].fn()
+
+        pipe.incr.assert_called_once_with("menu:version:7")
+        assert menu_version_service._pending == set()
+        assert menu_version_service._retry_timer is None
+
+    def test_next_bump_carries_pending_restaurants(self, monkeypatch):
+        client = MagicMock()
+        pipe = client.pipeline.return_value
+        monkeypatch.setattr(menu_version_service, "redis_client", client)
+        menu_version_service._pending.add(3)
+
+        menu_version_service.bump_menu_version(7)
+
+        assert {c.args[0] for c in pipe.incr.call_args_list} == {
+            "menu:version:3",
+            "menu:version:7",
+        }
+        assert menu_version_service._pending == set()
+
+
+class TestListMenuItems:
+    """Tests for the public list_menu_items() read path."""
+
+    def test_served_from_cached_snapshot_without_db(self, monkeypatch):
+        client = MagicMock()
+        client.get.return_value = (
+            '{"items":[{"id":1,"category_id":10,"is_available":true,'
+            '"available_from":null,"available_to":null}]}'
+        )
+        monkeypatch.setattr(menu_snapshot_service, "redis_client", client)
+        db = MagicMock()
+
+        result = menu_snapshot_service.list_menu_items(db, restaurant_id=7)
+
+        assert [i["id"] for i in result] == [1]
+        client.get.assert_called_once_with("menu:snapshot:7")
+        db.query.assert_not_called()
+
+    def test_falls_back_to_db_when_redis_is_down(self, monkeypatch):
+        client = MagicMock()
+        client.get.side_effect = RedisConnectionError()
+        monkeypatch.setattr(menu_snapshot_service, "redis_client", client)
+        fallback = MagicMock(return_value=["from-db"])
+        monkeypatch.setattr(
+            menu_snapshot_service.menu_items_service, "list_menu_items", fallback
+        )
+
+        result = menu_snapshot_service.list_menu_items(MagicMock(), restaurant_id=7)
+
+        assert result == ["from-db"]
+        fallback.assert_called_once()
+
+
+class TestListMenuItemsEndpoint:
+    """GET /menu-items/ tags the body with the snapshot's own version."""
+
+    def test_write_between_version_read_and_snapshot_read(self, monkeypatch):
+        app = FastAPI()
+        app.include_router(menu_items.router)
+        app.dependency_overrides[get_db] = lambda: MagicMock()
+        cache = EncodedBodyCache(maxsize=8)
+        monkeypatch.setattr(menu_items, "encoded_bodies", cache)
+        # The version moved to 5 after the snapshot of version 4 was read
+        monkeypatch.setattr(menu_snapshot_service, "current_menu_version", lambda rid: 5)
+        monkeypatch.setattr(
+            menu_snapshot_service,
+            "get_snapshot",
+            lambda db, rid: {"restaurant_id": 7, "version": 4, "items": [_item()]},
+        )
+
+        response = TestClient(app).get(
+            "/restaurants/7/menu-items/", params={"available_now": "false"}
+        )
+
+        etag = menu_snapshot_service.menu_list_etag(7, 4, only_currently_available=False)
+        assert response.headers["ETag"] == etag
+        assert cache.get(etag) is not None
+        assert cache.get(
+            menu_snapshot_service.menu_list_etag(7, 5, only_currently_available=False)
+        ) is None
+
+
+class TestMenuListEtag:
+    """Tests for menu_list_etag()."""
+
+    def test_unknown_version_has_no_etag(self):
+        assert menu_snapshot_service.menu_list_etag(7, None) is None
+
+    def test_available_now_needs_compiled_index(self, monkeypatch):
+        monkeypatch.setattr(
+            menu_snapshot_service.menu_availability_service,
+            "_indexes",
+            menu_snapshot_service.menu_availability_service.AvailabilityIndexCache(),
+        )
+
+        assert menu_snapshot_service.menu_list_etag(7, 3) is None
+
+        menu_snapshot_service.menu_availability_service.get_index(
+            {"restaurant_id": 7, "version": 3, "items": [_item()]}
+        )
+        assert menu_snapshot_service.menu_list_etag(7, 3) is not None
+
+    def test_changes_with_version_and_filters(self):
+        etag = menu_snapshot_service.menu_list_etag(7, 3, only_currently_available=False)
+
+        assert etag == menu_snapshot_service.menu_list_etag(7, 3, only_currently_available=False)
+        assert etag != menu_snapshot_service.menu_list_etag(7, 4, only_currently_available=False)
+        assert etag != menu_snapshot_service.menu_list_etag(
+            7, 3, category_id=10, only_currently_available=False
+        )
+
+    def test_include_variants_changes_etag(self):
+        assert menu_snapshot_service.menu_list_etag(
+            7, 3, only_currently_available=False
+        ) != menu_snapshot_service.menu_list_etag(
+            7, 3, only_currently_available=False, include_variants=True
+        )
+
+
+class TestWithVariants:
+    """Tests for with_variants()."""
+
+    def test_attaches_snapshot_variants(self):
+        items = [_item(id=1), _item(id=2)]
+        variants = {"1": [{"id": 5, "item_id": 1, "name": "Large"}]}
+
+        result = menu_snapshot_service.with_variants(items, variants)
+
+        assert result[0]["variants"] == [{"id": 5, "item_id": 1, "name": "Large"}]
+        assert result[1]["variants"] == []
+        assert "variants" not in items[0]
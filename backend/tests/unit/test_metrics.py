@@ -0,0 +1,215 @@
+"""
+Unit tests for Prometheus metrics (app.core.metrics) and the import queue
+totals they read (app.services.import_queue_service.stats).
+"""
+import os
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry, generate_latest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import create_engine, text
+
+from app.core import metrics
+from app.core.config import settings
+from app.main import app
+from app.services import import_queue_service
+
+
+def _scrape(collector) -> str:
+    registry = CollectorRegistry()
+    registry.register(collector)
+    return generate_latest(registry).decode()
+
+
+def _sample(name: str, **labels) -> float:
+    return metrics.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestObserveRequest:
+    """Tests for observe_request()."""
+
+    def test_counts_status_and_queries_per_route(self):
+        route = "/test/{item_id}"
+        before = _sample(
+            "dinebuddy_http_requests_total", method="GET", route=route, status="200"
+        )
+
+        metrics.observe_request("GET", route, 200, 0.02, 3)
+
+        assert _sample(
+            "dinebuddy_http_requests_total", method="GET", route=route, status="200"
+        ) == before + 1
+        assert _sample(
+            "dinebuddy_http_request_db_queries_sum", method="GET", route=route
+        ) >= 3
+
+
+class TestObserveRedis:
+    """Tests for observe_redis()."""
+
+    def test_normalises_command_name(self):
+        before = _sample(
+            "dinebuddy_redis_command_duration_seconds_count", client="sync", command="GET"
+        )
+
+        metrics.observe_redis("sync", b"get", 0.001)
+
+        assert _sample(
+            "dinebuddy_redis_command_duration_seconds_count", client="sync", command="GET"
+        ) == before + 1
+
+
+class TestTimedQueuePool:
+    """Tests for TimedQueuePool."""
+
+    def test_checkout_wait_and_gauges(self):
+        engine = create_engine(
+            "sqlite://",
+            poolclass=metrics.TimedQueuePool,
+            pool_logging_name="test",
+            pool_size=2,
+        )
+        before = _sample("dinebuddy_db_pool_wait_seconds_count", pool="test")
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            assert _sample("dinebuddy_db_pool_checked_out", pool="test") == 1
+            assert _sample("dinebuddy_db_pool_size", pool="test") == 2
+
+        assert _sample("dinebuddy_db_pool_wait_seconds_count", pool="test") == before + 1
+        assert _sample("dinebuddy_db_pool_checked_out", pool="test") == 0
+
+
+class TestRender:
+    """Tests for render() in multiprocess mode."""
+
+    def test_aggregates_every_worker_and_import_metrics(self, tmp_path, monkeypatch):
+        env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+        worker = (
+            "from prometheus_client import Counter; "
+            "Counter('dinebuddy_render_test', 'test').inc()"
+        )
+        for _ in range(2):
+            subprocess.run([sys.executable, "-c", worker], env=env, check=True)
+
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        monkeypatch.setattr(metrics, "_import_stats", lambda: {
+            "pending": 1,
+            "processing": 0,
+            "jobs": {},
+            "rows_imported": 0,
+            "rows_failed": 0,
+            "seconds": 0.0,
+        })
+
+        output = metrics.render().decode()
+
+        assert "dinebuddy_render_test_total 2.0" in output
+        assert 'dinebuddy_import_queue_depth{state="pending"} 1.0' in output
+
+
+class TestMetricsEndpoint:
+    """GET /metrics requires METRICS_TOKEN."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+        return TestClient(app)
+
+    def test_disabled_without_token_setting(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+
+        assert client.get("/metrics").status_code == 404
+
+    def test_rejects_missing_or_wrong_token(self, client):
+        assert client.get("/metrics").status_code == 401
+        assert client.get(
+            "/metrics", headers={"Authorization": "Bearer nope"}
+        ).status_code == 401
+
+    def test_serves_with_token(self, client, monkeypatch):
+        monkeypatch.setattr(metrics, "render", lambda: b"dinebuddy_up 1.0\n")
+
+        response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+
+        assert response.status_code == 200
+        assert response.text == "dinebuddy_up 1.0\n"
+
+
+class TestImportQueueCollector:
+    """Tests for ImportQueueCollector."""
+
+    def test_exports_depth_and_totals(self):
+        stats = {
+            "pending": 4,
+            "processing": 1,
+            "jobs": {"COMPLETED": 7, "FAILED": 2},
+            "rows_imported": 900,
+            "rows_failed": 12,
+            "seconds": 31.5,
+        }
+
+        output = _scrape(metrics.ImportQueueCollector(lambda: stats))
+
+        assert 'dinebuddy_import_queue_depth{state="pending"} 4.0' in output
+        assert 'dinebuddy_import_jobs_total{status="COMPLETED"} 7.0' in output
+        assert 'dinebuddy_import_rows_total{result="failed"} 12.0' in output
+        assert "dinebuddy_import_processing_seconds_total 31.5" in output
+
+    def test_redis_outage_skips_import_metrics(self):
+        def unavailable():
+            raise RedisConnectionError("down")
+
+        output = _scrape(metrics.ImportQueueCollector(unavailable))
+
+        assert "dinebuddy_import" not in output
+
+    def test_registering_does_not_collect(self):
+        stats = MagicMock()
+
+        CollectorRegistry().register(metrics.ImportQueueCollector(stats))
+
+        stats.assert_not_called()
+
+
+class TestImportQueueStats:
+    """Tests for import_queue_service.stats()."""
+
+    def test_parses_totals_hash(self, monkeypatch):
+        redis = MagicMock()
+        redis.pipeline.return_value.execute.return_value = [
+            3,
+            1,
+            {
+                "jobs:COMPLETED": "5",
+                "jobs:FAILED": "1",
+                "rows_imported": "420",
+                "rows_failed": "3",
+                "seconds": "12.5",
+            },
+        ]
+        monkeypatch.setattr(import_queue_service, "redis_client", redis)
+
+        assert import_queue_service.stats() == {
+            "pending": 3,
+            "processing": 1,
+            "jobs": {"COMPLETED": 5, "FAILED": 1},
+            "rows_imported": 420,
+            "rows_failed": 3,
+            "seconds": 12.5,
+        }
+
+    def test_empty_totals(self, monkeypatch):
+        redis = MagicMock()
+        redis.pipeline.return_value.execute.return_value = [0, 0, {}]
+        monkeypatch.setattr(import_queue_service, "redis_client", redis)
+
+        stats = import_queue_service.stats()
+
+        assert stats["jobs"] == {}
+        assert stats["rows_imported"] == 0
+        assert stats["seconds"] == 0.0
@@ -0,0 +1,93 @@
+"""
+Unit tests for the async OTP flow (app.services.otp_service).
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import otp_service
+
+
+@pytest.fixture
+def script(monkeypatch):
+    script = AsyncMock(return_value="ok")
+    monkeypatch.setattr(otp_service, "_verify_script", script)
+    return script
+
+
+def _db():
+    db = MagicMock()
+    db.execute = AsyncMock()
+    db.commit = AsyncMock()
+    return db
+
+
+class TestCheckOtp:
+    """Tests for check_otp()."""
+
+    def test_runs_single_script_with_hashed_otp(self, script):
+        result = asyncio.run(otp_service.check_otp("9000000000", "123456"))
+
+        assert result == "ok"
+        script.assert_awaited_once_with(
+            keys=["otp_session:9000000000"],
+            args=[otp_service.hash_otp("123456"), otp_service.MAX_ATTEMPTS],
+        )
+
+
+class TestRequestOtp:
+    """Tests for request_otp()."""
+
+    def test_stores_hashed_code_and_resets_attempts_in_one_transaction(self, monkeypatch):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        redis = MagicMock()
+        redis.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        redis.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+        monkeypatch.setattr(otp_service, "async_redis_client", redis)
+        monkeypatch.setattr(otp_service, "generate_otp", lambda: "654321")
+
+        result = asyncio.run(otp_service.request_otp("9000000000"))
+
+        assert result["otp"] == "654321"
+        redis.pipeline.assert_called_once_with(transaction=True)
+        pipe.hset.assert_called_once_with(
+            "otp_session:9000000000",
+            mapping={"code": otp_service.hash_otp("654321"), "attempts": 0},
+        )
+        pipe.expire.assert_called_once_with("otp_session:9000000000", otp_service.OTP_TTL)
+        pipe.execute.assert_awaited_once()
+
+
+class TestVerifyOtp:
+    """Tests for verify_otp()."""
+
+    @pytest.mark.parametrize(
+        "outcome, status_code",
+        [("expired", 400), ("locked", 429), ("wrong", 400)],
+    )
+    def test_failures_skip_db(self, script, outcome, status_code):
+        script.return_value = outcome
+        db = _db()
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(otp_service.verify_otp(db, "9000000000", "123456"))
+
+        assert exc_info.value.status_code == status_code
+        db.execute.assert_not_called()
+
+    def test_success_resolves_customer_and_issues_token(self, script, monkeypatch):
+        resolve = AsyncMock(return_value=42)
+        monkeypatch.setattr(otp_service, "resolve_customer_id", resolve)
+        monkeypatch.setattr(otp_service, "create_access_token", MagicMock(return_value="tok"))
+        db = _db()
+
+        result = asyncio.run(otp_service.verify_otp(db, "9000000000", "123456"))
+
+        assert result == {"access_token": "tok", "token_type": "bearer"}
+        resolve.assert_awaited_once_with(db, "9000000000")
+        otp_service.create_access_token.assert_called_once_with(
+            {"sub": "42", "type": "customer"}
+        )
@@ -0,0 +1,103 @@
+"""
+Unit tests for the authenticated principal cache (app.core.principal_cache).
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core import principal_cache
+from app.core.principal_cache import PrincipalCache, UserPrincipal
+from app.models.user import UserRole
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = MagicMock()
+    client.get.return_value = None
+    monkeypatch.setattr(principal_cache, "redis_client", client)
+    return client
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = PrincipalCache("user", UserPrincipal, maxsize=2, local_ttl=30, redis_ttl=60)
+    monkeypatch.setattr(principal_cache, "user_principals", cache)
+    return cache
+
+
+def _db(user_id=1, role=UserRole.RESTAURANT_ADMIN, restaurant_ids=(5, 6)):
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = SimpleNamespace(
+        id=user_id, role=role, is_active=True, scope_version=4
+    )
+    db.query.return_value.filter.return_value.all.return_value = [
+        (rid,) for rid in restaurant_ids
+    ]
+    return db
+
+
+class TestGetUserPrincipal:
+    """Tests for get_user_principal()."""
+
+    def test_second_lookup_skips_db_and_redis(self, client, cache):
+        db = _db()
+
+        first = principal_cache.get_user_principal(db, 1)
+        second = principal_cache.get_user_principal(db, 1)
+
+        assert second is first
+        assert first.restaurant_ids == frozenset({5, 6})
+        assert first.is_restaurant_admin
+        assert first.scope_version == 4
+        assert db.query.call_count == 2
+        client.get.assert_called_once_with("auth:principal:user:1")
+
+    def test_redis_hit_avoids_db(self, client, cache):
+        client.get.return_value = UserPrincipal(1, UserRole.ADMIN, True).to_json()
+        db = MagicMock()
+
+        principal = principal_cache.get_user_principal(db, 1)
+
+        assert principal.is_admin
+        db.query.assert_not_called()
+
+    def test_redis_outage_falls_back_to_db(self, client, cache):
+        client.get.side_effect = RedisConnectionError()
+        client.set.side_effect = RedisConnectionError()
+
+        principal = principal_cache.get_user_principal(_db(), 1)
+
+        assert principal.id == 1
+
+
+class TestPrincipalCache:
+    """Tests for PrincipalCache eviction."""
+
+    def test_least_recently_used_entry_is_evicted(self, client, cache):
+        for user_id in (1, 2):
+            cache.set(UserPrincipal(user_id, UserRole.ADMIN, True))
+        cache.get(1)
+        cache.set(UserPrincipal(3, UserRole.ADMIN, True))
+
+        assert list(cache._local) == [1, 3]
+
+    def test_invalidate_drops_both_tiers_and_broadcasts(self, client, cache):
+        cache.set(UserPrincipal(1, UserRole.ADMIN, True))
+        pipe = client.pipeline.return_value
+
+        principal_cache.invalidate_user(1)
+
+        assert 1 not in cache._local
+        pipe.delete.assert_called_once_with("auth:principal:user:1")
+        pipe.publish.assert_called_once_with(principal_cache.INVALIDATION_CHANNEL, "user:1")
+
+    def test_failed_invalidation_raises(self, client, cache):
+        cache.set(UserPrincipal(1, UserRole.ADMIN, True))
+        client.pipeline.return_value.execute.side_effect = RedisConnectionError()
+
+        with pytest.raises(RedisConnectionError):
+            principal_cache.invalidate_user(1)
+
+        assert 1 not in cache._local
@@ -0,0 +1,134 @@
+"""
+Unit tests for request timing and query counting (app.core.request_metrics).
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core import metrics, request_metrics
+from app.core.request_metrics import (
+    RequestMetricsMiddleware,
+    RequestStats,
+    instrument_engine,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    return engine
+
+
+@pytest.fixture
+def app(engine):
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        with engine.connect() as conn:
+            for _ in range(item_id):
+                conn.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    return app
+
+
+def _sample(name: str, **labels) -> float:
+    return metrics.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestInstrumentEngine:
+    """Tests for instrument_engine()."""
+
+    def test_counts_statements_in_the_current_request(self, engine):
+        stats = RequestStats()
+        token = request_metrics._current.set(stats)
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+        finally:
+            request_metrics._current.reset(token)
+
+        assert stats.queries == 2
+        assert stats.db_seconds > 0
+
+    def test_failed_statement_leaves_nothing_on_the_connection(self, engine):
+        stats = RequestStats()
+        token = request_metrics._current.set(stats)
+        try:
+            with engine.connect() as conn:
+                with pytest.raises(OperationalError):
+                    conn.execute(text("SELECT * FROM missing"))
+                conn.execute(text("SELECT 1"))
+                assert conn.info == {}
+        finally:
+            request_metrics._current.reset(token)
+
+        assert stats.queries == 1
+        assert 0 < stats.db_seconds < 1
+
+    def test_statements_outside_a_request_are_ignored(self, engine):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert request_metrics.current_stats() is None
+
+    def test_is_idempotent(self, engine):
+        instrument_engine(engine)
+
+        stats = RequestStats()
+        token = request_metrics._current.set(stats)
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        finally:
+            request_metrics._current.reset(token)
+
+        assert stats.queries == 1
+
+
+class TestRequestMetricsMiddleware:
+    """Tests for RequestMetricsMiddleware."""
+
+    def test_sets_server_timing_header(self, app):
+        response = TestClient(app).get("/items/3")
+
+        timing = response.headers["Server-Timing"]
+        assert timing.startswith("app;dur=")
+        assert 'desc="3 queries"' in timing
+
+    def test_header_can_be_disabled(self, app, monkeypatch):
+        monkeypatch.setattr(request_metrics.settings, "SERVER_TIMING_HEADER", False)
+
+        response = TestClient(app).get("/items/1")
+
+        assert "Server-Timing" not in response.headers
+
+    def test_exports_per_route_template(self, app):
+        route = {"method": "GET", "route": "/items/{item_id}"}
+        unmatched = {"method": "GET", "route": "<unmatched>", "status": "404"}
+        requests_before = _sample("dinebuddy_http_request_db_queries_count", **route)
+        queries_before = _sample("dinebuddy_http_request_db_queries_sum", **route)
+        unmatched_before = _sample("dinebuddy_http_requests_total", **unmatched)
+
+        client = TestClient(app)
+        client.get("/items/1")
+        client.get("/items/4")
+        client.get("/missing")
+
+        assert _sample("dinebuddy_http_request_db_queries_count", **route) == requests_before + 2
+        assert _sample("dinebuddy_http_request_db_queries_sum", **route) == queries_before + 5
+        assert _sample("dinebuddy_http_requests_total", **unmatched) == unmatched_before + 1
+
+    def test_warns_over_query_budget(self, app, monkeypatch, caplog):
+        monkeypatch.setattr(request_metrics.settings, "REQUEST_QUERY_BUDGET", 2)
+
+        with caplog.at_level("WARNING", logger=request_metrics.__name__):
+            TestClient(app).get("/items/3")
+
+        assert "GET /items/{item_id} issued 3 queries (budget 2)" in caplog.text
@@ -0,0 +1,35 @@
+"""
+Unit tests for the pre-encoded JSON body cache (app.core.responses).
+"""
+import orjson
+
+from app.core.responses import EncodedBodyCache
+
+
+class TestEncodedBodyCache:
+    """Tests for EncodedBodyCache."""
+
+    def test_body_is_reused_for_same_etag(self):
+        cache = EncodedBodyCache(maxsize=2)
+
+        body = cache.encode('"a"', [{"id": 1, "price": "10.00"}])
+
+        assert orjson.loads(body) == [{"id": 1, "price": "10.00"}]
+        assert cache.get('"a"') is body
+
+    def test_untagged_bodies_are_not_kept(self):
+        cache = EncodedBodyCache(maxsize=2)
+
+        cache.encode(None, [])
+
+        assert cache.get(None) is None
+        assert len(cache._bodies) == 0
+
+    def test_least_recently_used_body_is_evicted(self):
+        cache = EncodedBodyCache(maxsize=2)
+        for etag in ('"a"', '"b"'):
+            cache.encode(etag, [])
+        cache.get('"a"')
+        cache.encode('"c"', [])
+
+        assert list(cache._bodies) == ['"a"', '"c"']
@@ -0,0 +1,99 @@
+"""
+Unit tests for RestaurantService.get_all keyset pagination and caching.
+"""
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+
+from app.core.principal_cache import UserPrincipal
+from app.models.user import UserRole
+from app.services import restaurant_list_cache, restaurant_service
+from app.services.restaurant_service import RestaurantService, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = MagicMock()
+    client.get.return_value = None
+    monkeypatch.setattr(restaurant_list_cache, "redis_client", client)
+    return client
+
+
+class TestCursor:
+    """Tests for encode_cursor() / decode_cursor()."""
+
+    def test_round_trip(self):
+        created_at = datetime(2026, 1, 5, 8, 42, 1, 123456)
+
+        assert decode_cursor(encode_cursor(created_at, 17)) == (created_at, 17)
+
+    def test_garbage_raises_400(self):
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor("not-a-cursor")
+
+        assert exc_info.value.status_code == 400
+
+
+class TestGetAll:
+    """Tests for get_all()."""
+
+    def test_cache_hit_skips_db(self, client):
+        client.get.side_effect = ["3", '{"data":[],"next_cursor":"c"}', "12"]
+        db = MagicMock()
+        user = UserPrincipal(1, UserRole.ADMIN, True)
+
+        data, total, next_cursor = RestaurantService().get_all(db, user)
+
+        assert (data, total, next_cursor) == ([], 12, "c")
+        db.query.assert_not_called()
+
+    def test_staff_without_restaurants_skips_page_query(self, client):
+        db = MagicMock()
+        user = UserPrincipal(2, UserRole.RESTAURANT_STAFF, True)
+
+        data, total, next_cursor = RestaurantService().get_all(db, user, include_total=False)
+
+        assert (data, total, next_cursor) == ([], None, None)
+        db.query.assert_not_called()
+
+
+def _unique_violation(column: str) -> IntegrityError:
+    return IntegrityError("INSERT", {}, Exception(f"UNIQUE constraint failed: restaurants.{column}"))
+
+
+class TestCommitWithUniqueSlug:
+    """Tests for _commit_with_unique_slug()."""
+
+    def test_slug_race_reallocates_and_retries(self):
+        db = MagicMock()
+        db.commit.side_effect = [_unique_violation("slug"), None]
+        apply = MagicMock()
+
+        RestaurantService._commit_with_unique_slug(db, apply)
+
+        assert apply.call_count == 2
+        db.rollback.assert_called_once()
+
+    def test_name_conflict_is_not_retried(self):
+        db = MagicMock()
+        db.commit.side_effect = _unique_violation("name")
+        apply = MagicMock()
+
+        with pytest.raises(HTTPException) as exc_info:
+            RestaurantService._commit_with_unique_slug(db, apply)
+
+        assert exc_info.value.status_code == 400
+        apply.assert_called_once()
+
+    def test_gives_up_after_attempts(self):
+        db = MagicMock()
+        db.commit.side_effect = _unique_violation("slug")
+        apply = MagicMock()
+
+        with pytest.raises(HTTPException):
+            RestaurantService._commit_with_unique_slug(db, apply)
+
+        assert apply.call_count == restaurant_service.SLUG_ATTEMPTS
@@ -0,0 +1,134 @@
+"""
+Unit tests for restaurant settings creation and caching
+(app.services.restaurant_setting_service).
+"""
+import json
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.exc import IntegrityError
+
+from app.models.restaurant_settings import RestaurantSettings
+from app.schemas.restaurant_setting_schema import RestaurantSettingsUpdateRequest
+from app.services import restaurant_setting_service
+from app.services.restaurant_setting_service import RestaurantSettingsService
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = MagicMock()
+    client.get.return_value = None
+    monkeypatch.setattr(restaurant_setting_service, "redis_client", client)
+    return client
+
+
+def _settings() -> RestaurantSettings:
+    return RestaurantSettings(
+        restaurant_id=7,
+        tax_percentage=Decimal("5.00"),
+        service_charge=None,
+        auto_accept_orders=False,
+        order_preparation_time=20,
+    )
+
+
+class TestCreateDefault:
+    """Tests for create_default()."""
+
+    def test_inserted_row_is_returned(self):
+        db = MagicMock()
+        row = _settings()
+        db.scalars.return_value.first.return_value = row
+
+        assert RestaurantSettingsService().create_default(db, 7) is row
+        db.commit.assert_called_once()
+        db.query.assert_not_called()
+
+    def test_lost_race_reads_existing_row(self, monkeypatch):
+        db = MagicMock()
+        db.scalars.return_value.first.return_value = None
+        row = _settings()
+        service = RestaurantSettingsService()
+        monkeypatch.setattr(service, "get_by_restaurant_id", lambda db, rid: row)
+
+        assert service.create_default(db, 7) is row
+
+    def test_unknown_restaurant_is_404(self):
+        db = MagicMock()
+        db.scalars.side_effect = IntegrityError("INSERT", {}, Exception("foreign key"))
+
+        with pytest.raises(HTTPException) as exc_info:
+            RestaurantSettingsService().create_default(db, 7)
+
+        assert exc_info.value.status_code == 404
+        db.rollback.assert_called_once()
+
+
+class TestGetCachedOrCreate:
+    """Tests for get_cached_or_create()."""
+
+    def test_cache_hit_skips_db(self, redis):
+        cached = {"tax_percentage": 5.0, "service_charge": None,
+                  "auto_accept_orders": False, "order_preparation_time": 20}
+        redis.get.side_effect = {
+            "restaurant:settings:version:7": "2",
+            "restaurant:settings:7:2": json.dumps(cached),
+        }.get
+        db = MagicMock()
+
+        assert RestaurantSettingsService().get_cached_or_create(db, 7) == cached
+        db.query.assert_not_called()
+
+    def test_miss_loads_and_caches(self, redis, monkeypatch):
+        service = RestaurantSettingsService()
+        monkeypatch.setattr(service, "get_or_create", lambda db, rid: _settings())
+
+        data = service.get_cached_or_create(MagicMock(), 7)
+
+        assert data["tax_percentage"] == 5.0
+        key, raw = redis.set.call_args.args
+        assert key == "restaurant:settings:7:0"
+        assert json.loads(raw) == data
+
+    def test_read_racing_update_caches_under_old_version(self, redis, monkeypatch):
+        versions = {"restaurant:settings:version:7": "4"}
+        redis.get.side_effect = versions.get
+        service = RestaurantSettingsService()
+
+        def load_then_update(db, rid):
+            # An update commits and bumps the version while this read loads
+            versions["restaurant:settings:version:7"] = "5"
+            return _settings()
+
+        monkeypatch.setattr(service, "get_or_create", load_then_update)
+
+        service.get_cached_or_create(MagicMock(), 7)
+
+        assert redis.set.call_args.args[0] == "restaurant:settings:7:4"
+
+    def test_redis_down_falls_back_to_db(self, redis, monkeypatch):
+        redis.get.side_effect = RedisConnectionError()
+        redis.set.side_effect = RedisConnectionError()
+        service = RestaurantSettingsService()
+        monkeypatch.setattr(service, "get_or_create", lambda db, rid: _settings())
+
+        assert service.get_cached_or_create(MagicMock(), 7)["order_preparation_time"] == 20
+
+
+class TestUpdate:
+    """Tests for update()."""
+
+    def test_invalidates_after_commit(self, redis, monkeypatch):
+        db = MagicMock()
+        row = _settings()
+        service = RestaurantSettingsService()
+        monkeypatch.setattr(service, "get_or_create", lambda db, rid: row)
+        db.commit.side_effect = lambda: redis.incr.assert_not_called()
+
+        service.update(db, 7, RestaurantSettingsUpdateRequest(service_charge=2.5))
+
+        assert row.service_charge == 2.5
+        redis.incr.assert_called_once_with("restaurant:settings:version:7")
@@ -1,9 +1,14 @@
 """
 Unit tests for app.core.security (password hashing and verification).
 """
+import threading
+
 import pytest
+from fastapi import HTTPException
+from passlib.hash import bcrypt
 
-from app.core.security import hash_password, verify_password
+from app.core import security
+from app.core.security import hash_password, verify_and_rehash, verify_password
 
 
 class TestHashPassword:
@@ -60,3 +65,43 @@ class TestVerifyPassword:
             hashed = hash_password(pwd)
             assert verify_password(pwd, hashed) is True
             assert verify_password(pwd + "x", hashed) is False
+
+
+class TestVerifyAndRehash:
+    """Tests for verify_and_rehash()."""
+
+    def test_current_cost_needs_no_rehash(self):
+        hashed = hash_password("secret")
+        assert verify_and_rehash("secret", hashed) == (True, None)
+
+    def test_other_cost_is_rehashed_on_success(self):
+        old = bcrypt.using(rounds=4).hash(security._sha256("secret"))
+
+        verified, new_hash = verify_and_rehash("secret", old)
+
+        assert verified is True
+        assert new_hash is not None
+        assert bcrypt.from_string(new_hash).rounds == security.settings.BCRYPT_ROUNDS
+        assert verify_password("secret", new_hash) is True
+
+    def test_wrong_password_is_not_rehashed(self):
+        old = bcrypt.using(rounds=4).hash(security._sha256("secret"))
+        assert verify_and_rehash("wrong", old) == (False, None)
+
+
+class TestHashingPool:
+    """Tests for the bounded password hashing pool."""
+
+    def test_runs_on_dedicated_threads(self):
+        seen = security._offload(lambda: threading.current_thread().name)
+        assert seen.startswith("password-hash")
+
+    def test_refuses_when_pool_is_full(self, monkeypatch):
+        monkeypatch.setattr(security, "_slots", threading.BoundedSemaphore(1))
+        security._slots.acquire()
+
+        with pytest.raises(HTTPException) as exc_info:
+            verify_password("secret", "not-a-hash")
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "1"}
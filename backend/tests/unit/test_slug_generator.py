@@ -0,0 +1,71 @@
+"""
+Unit tests for slug allocation (app.utils.slug_generator).
+"""
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.core import request_metrics
+from app.core.request_metrics import RequestStats
+from app.models.restaurant import Restaurant
+from app.utils.slug_generator import generate_unique_slug, is_slug_conflict, next_free_slug
+
+
+def _add(db, *slugs):
+    for i, slug in enumerate(slugs):
+        db.add(Restaurant(name=f"{slug} {i}", slug=slug))
+    db.commit()
+
+
+class TestNextFreeSlug:
+    """Tests for next_free_slug()."""
+
+    def test_base_when_free(self):
+        assert next_free_slug("dominos", {"dominos-1"}) == "dominos"
+
+    def test_smallest_free_suffix(self):
+        assert next_free_slug("dominos", {"dominos", "dominos-1", "dominos-3"}) == "dominos-2"
+
+    def test_ignores_longer_slugs_sharing_the_prefix(self):
+        taken = {"dominos", "dominos-pizza", "dominos-1-express"}
+
+        assert next_free_slug("dominos", taken) == "dominos-1"
+
+
+class TestGenerateUniqueSlug:
+    """Tests for generate_unique_slug()."""
+
+    def test_one_query_for_any_number_of_collisions(self, db):
+        _add(db, "domino-s", *(f"domino-s-{n}" for n in range(1, 200)))
+        stats = RequestStats()
+        token = request_metrics._current.set(stats)
+        try:
+            slug = generate_unique_slug(db, "Domino's")
+        finally:
+            request_metrics._current.reset(token)
+
+        assert slug == "domino-s-200"
+        assert stats.queries == 1
+
+    def test_excludes_own_row_on_rename(self, db):
+        _add(db, "spice-route")
+        own_id = db.query(Restaurant.id).scalar()
+
+        assert generate_unique_slug(db, "Spice Route!", exclude_id=own_id) == "spice-route"
+
+
+class TestIsSlugConflict:
+    """Tests for is_slug_conflict()."""
+
+    def test_slug_vs_name_constraint(self, db):
+        _add(db, "spice-route")
+
+        for restaurant, expected in (
+            (Restaurant(name="Other", slug="spice-route"), True),
+            (Restaurant(name="spice-route 0", slug="other"), False),
+        ):
+            db.add(restaurant)
+            with pytest.raises(IntegrityError) as exc_info:
+                db.commit()
+            db.rollback()
+
+            assert is_slug_conflict(exc_info.value) is expected
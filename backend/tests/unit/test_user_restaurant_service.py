@@ -6,9 +6,17 @@ from unittest.mock import MagicMock
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 
+from app.services import user_restaurant_service
 from app.services.user_restaurant_service import UserRestaurantService
 
 
+@pytest.fixture(autouse=True)
+def invalidate_access(monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr(user_restaurant_service, "invalidate_access", mock)
+    return mock
+
+
 class TestAssignUserToRestaurant:
     """Tests for assign_user_to_restaurant()."""
 
@@ -16,7 +24,9 @@ class TestAssignUserToRestaurant:
     def service(self):
         return UserRestaurantService()
 
-    def test_assign_user_to_restaurant_success(self, service: UserRestaurantService):
+    def test_assign_user_to_restaurant_success(
+        self, service: UserRestaurantService, invalidate_access
+    ):
         """Assigning a user to a restaurant adds the mapping and returns True."""
         db = MagicMock()
         user_id = 1
@@ -30,6 +40,7 @@ class TestAssignUserToRestaurant:
         assert call_args.user_id == user_id
         assert call_args.restaurant_id == restaurant_id
         db.commit.assert_called_once()
+        invalidate_access.assert_called_once_with(user_id)
 
     def test_assign_user_to_restaurant_duplicate_raises_400(self, service: UserRestaurantService):
         """Assigning the same user to the same restaurant again raises HTTP 400."""